@@ -0,0 +1,240 @@
+"""Benchmark del motor de pivoteo del SimplexSolver.
+
+Uso:
+    python benchmark.py --filas 300 --columnas 600 --pivotes 20
+    python benchmark.py --filas 2000 --columnas 4000 --pivotes 20 --sin-referencia
+    python benchmark.py --filas 10 --columnas 15 --lote 1000 --historial resumen
+    python benchmark.py --filas 60 --columnas 120 --reglas --metodo revisado
+    python benchmark.py --filas 200 --columnas 300 --metodos
+    python benchmark.py --filas 1000 --columnas 200 --parseo
+    python benchmark.py --arranque
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from simplex import REGLAS_PRECIO, HistorialTableau, SimplexSolver, resolver_apilado
+
+
+def crear_solver_aleatorio(filas, columnas, semilla=0, **opciones):
+    """Crear un problema MAX aleatorio con restricciones <= ya estandarizado"""
+    rng = np.random.default_rng(semilla)
+    solver = SimplexSolver(**opciones)
+    solver.tipo = "max"
+    solver.c = rng.integers(1, 20, columnas).astype(float).tolist()
+    solver.A = rng.integers(1, 10, (filas, columnas)).astype(float).tolist()
+    solver.b = rng.integers(100, 1000, filas).astype(float).tolist()
+    solver.tipos_restricciones = ["<="] * filas
+    solver.variables_originales = columnas
+    solver.estandarizar()
+    return solver
+
+
+def pivotear_referencia(tableau, num_restricciones, num_variables, pivotes):
+    """Motor original, con bucles Python celda a celda sobre el tableau, como referencia de
+    medir_pivotes: la misma regla (Dantzig, primer índice en los empates) y el mismo cociente
+    mínimo en MAX"""
+    realizados = 0
+    for _ in range(pivotes):
+        max_val, col_pivote = 1e-10, -1
+        for j in range(num_variables):
+            if tableau[num_restricciones][j] > max_val:
+                max_val, col_pivote = tableau[num_restricciones][j], j
+        if col_pivote == -1:
+            break
+        
+        min_ratio, fila_pivote = float('inf'), -1
+        for i in range(num_restricciones):
+            coef = tableau[i][col_pivote]
+            if coef > 1e-10:
+                ratio = tableau[i][num_variables] / coef
+                if -1e-10 <= ratio < min_ratio:
+                    min_ratio, fila_pivote = ratio, i
+        if fila_pivote == -1:
+            break
+        
+        pivote = tableau[fila_pivote][col_pivote]
+        for j in range(num_variables + 1):
+            tableau[fila_pivote][j] /= pivote
+        for i in range(num_restricciones + 1):
+            if i != fila_pivote:
+                factor = tableau[i][col_pivote]
+                for j in range(num_variables + 1):
+                    tableau[i][j] -= factor * tableau[fila_pivote][j]
+        realizados += 1
+    return realizados
+
+
+def medir_pivotes_referencia(filas, columnas, pivotes):
+    """Pivotes por segundo del motor de referencia sobre el mismo problema que medir_pivotes"""
+    solver = crear_solver_aleatorio(filas, columnas)
+    tableau = solver.tableau  # Arreglo NumPy indexado elemento a elemento, como antes de vectorizar
+    inicio = time.perf_counter()
+    realizados = pivotear_referencia(tableau, len(solver.A), len(solver.c), pivotes)
+    duracion = time.perf_counter() - inicio
+    return realizados, duracion
+
+
+def medir_pivotes(filas, columnas, pivotes):
+    """Medir pivotes por segundo (selección de columna, cociente y pivoteo)"""
+    solver = crear_solver_aleatorio(filas, columnas)
+    realizados = 0
+    inicio = time.perf_counter()
+    for _ in range(pivotes):
+        col_pivote = solver.encontrar_columna_pivote()
+        if col_pivote == -1:
+            break
+        fila_pivote = solver.encontrar_fila_pivote(col_pivote)
+        if fila_pivote == -1:
+            break
+        solver.operaciones_fila(fila_pivote, col_pivote)
+        realizados += 1
+    duracion = time.perf_counter() - inicio
+    return realizados, duracion
+
+
+def medir_lote(filas, columnas, problemas, modo_historial="completo"):
+    """Comparar resolver uno a uno contra el kernel apilado sobre problemas de la misma forma
+    
+    Devuelve la duración total de cada camino y la de su fase de resolución (pivoteo e
+    historial, sin construir las respuestas), sumada de las estadísticas de cada solver.
+    """
+    individuales = [crear_solver_aleatorio(filas, columnas, semilla, modo_historial=modo_historial)
+                    for semilla in range(problemas)]
+    apilados = [crear_solver_aleatorio(filas, columnas, semilla, modo_historial=modo_historial)
+                for semilla in range(problemas)]
+    
+    # En ambos casos se conservan todos los resultados, como en resolver_lote
+    inicio = time.perf_counter()
+    resultados = [solver.resolver() for solver in individuales]
+    duracion_individual = time.perf_counter() - inicio
+    del resultados
+    
+    inicio = time.perf_counter()
+    resultados = resolver_apilado(apilados)
+    duracion_apilada = time.perf_counter() - inicio
+    
+    resolucion = [sum(solver.estadisticas.tiempos["resolucion"] for solver in solvers)
+                  for solvers in (individuales, apilados)]
+    return duracion_individual, duracion_apilada, *resolucion
+
+
+def medir_reglas(filas, columnas, metodo):
+    """Iteraciones y tiempo de cada regla de precio sobre el mismo problema"""
+    mediciones = []
+    for regla in REGLAS_PRECIO:
+        solver = crear_solver_aleatorio(filas, columnas, regla_precio=regla, metodo=metodo)
+        solver.max_iteraciones = 100000
+        resultado = solver.resolver()
+        mediciones.append((regla, resultado['iteraciones'], resultado['tiempo_resolucion_ms'],
+                           resultado.get('z_optimo', resultado.get('error'))))
+    return mediciones
+
+
+def medir_metodos(filas, columnas):
+    """Iteraciones y tiempo de cada método sobre el mismo problema (en punto_interior, las
+    iteraciones del punto interior y los pivotes del crossover)"""
+    mediciones = []
+    for metodo in SimplexSolver.METODOS:
+        solver = crear_solver_aleatorio(filas, columnas, metodo=metodo)
+        solver.max_iteraciones = 100000
+        resultado = solver.resolver()
+        iteraciones = f"{resultado['iteraciones']} iteraciones"
+        if 'punto_interior' in resultado:
+            iteraciones = (f"{resultado['punto_interior']['iteraciones']} iteraciones + "
+                           f"{resultado['iteraciones']} pivotes de crossover")
+        mediciones.append((metodo, iteraciones, resultado['tiempo_resolucion_ms'],
+                           resultado.get('z_optimo', resultado.get('error'))))
+    return mediciones
+
+
+def medir_parseo(filas, columnas, semilla=0):
+    """Medir configurar_problema (parseo del texto) sobre un modelo denso de filas x columnas"""
+    rng = np.random.default_rng(semilla)
+    funcion_objetivo = " + ".join(f"{v}x{j + 1}" for j, v in enumerate(rng.integers(1, 20, columnas)))
+    restricciones = [
+        " + ".join(f"{v}x{j + 1}" for j, v in enumerate(fila)) + f" <= {rhs}"
+        for fila, rhs in zip(rng.integers(1, 10, (filas, columnas)), rng.integers(100, 1000, filas))
+    ]
+    solver = SimplexSolver()
+    inicio = time.perf_counter()
+    solver.configurar_problema(funcion_objetivo, "max", restricciones)
+    duracion = time.perf_counter() - inicio
+    return (filas + 1) * columnas, duracion
+
+
+def medir_arranque(modulo, repeticiones=5):
+    """Tiempo medio de un intérprete nuevo que solo importa el módulo (arranque en frío)"""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        subprocess.run([sys.executable, "-c", f"import {modulo}"], check=True,
+                       stdout=subprocess.DEVNULL, cwd=sys.path[0] or None)
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filas", type=int, default=300)
+    parser.add_argument("--columnas", type=int, default=600)
+    parser.add_argument("--pivotes", type=int, default=20)
+    parser.add_argument("--sin-referencia", action="store_true",
+                        help="No medir el motor de referencia con bucles Python (lento en modelos grandes)")
+    parser.add_argument("--lote", type=int, default=0,
+                        help="Número de problemas para medir el kernel apilado")
+    parser.add_argument("--historial", choices=sorted(set(HistorialTableau.MODOS.values())), default="completo",
+                        help="Modo de historial de los problemas de --lote")
+    parser.add_argument("--reglas", action="store_true",
+                        help="Comparar las reglas de precio (iteraciones y tiempo)")
+    parser.add_argument("--metodo", choices=SimplexSolver.METODOS, default="tableau")
+    parser.add_argument("--metodos", action="store_true",
+                        help="Comparar tableau, revisado y punto_interior (iteraciones y tiempo)")
+    parser.add_argument("--parseo", action="store_true",
+                        help="Medir el parseo de la función objetivo y las restricciones")
+    parser.add_argument("--arranque", action="store_true",
+                        help="Comparar el arranque en frío de simplex (sin Flask) con el de app")
+    args = parser.parse_args()
+    
+    if args.arranque:
+        for modulo in ("simplex", "app"):
+            print(f"import {modulo}: {medir_arranque(modulo) * 1000:.1f} ms")
+        return
+
+    if args.parseo:
+        terminos, duracion = medir_parseo(args.filas, args.columnas)
+        print(f"Parseo {args.filas}x{args.columnas}: {terminos} términos en {duracion:.3f} s "
+              f"({terminos / duracion:,.0f} términos/s)")
+        return
+
+    if args.reglas:
+        for regla, iteraciones, tiempo_ms, z in medir_reglas(args.filas, args.columnas, args.metodo):
+            print(f"{regla:>14}: {iteraciones} iteraciones, {tiempo_ms:.1f} ms (Z = {z})")
+        return
+
+    if args.metodos:
+        for metodo, iteraciones, tiempo_ms, z in medir_metodos(args.filas, args.columnas):
+            print(f"{metodo:>14}: {iteraciones}, {tiempo_ms:.1f} ms (Z = {z})")
+        return
+
+    if args.lote:
+        individual, apilado, resolucion_individual, resolucion_apilada = medir_lote(
+            args.filas, args.columnas, args.lote, args.historial)
+        print(f"{args.lote} problemas {args.filas}x{args.columnas} (historial {args.historial}):")
+        for fase, uno_a_uno, apilados in (("total", individual, apilado),
+                                          ("resolución", resolucion_individual, resolucion_apilada)):
+            print(f"{fase:>12}: uno a uno {args.lote / uno_a_uno:.1f} problemas/s, "
+                  f"apilado {args.lote / apilados:.1f} problemas/s ({uno_a_uno / apilados:.1f}x)")
+        return
+
+    mediciones = [("NumPy", medir_pivotes(args.filas, args.columnas, args.pivotes))]
+    if not args.sin_referencia:
+        mediciones.insert(0, ("bucles Python", medir_pivotes_referencia(args.filas, args.columnas, args.pivotes)))
+    print(f"Tableau {args.filas}x{args.columnas}:")
+    for motor, (realizados, duracion) in mediciones:
+        print(f"{motor:>20}: {realizados} pivotes en {duracion:.3f} s ({realizados / duracion:.1f} pivotes/s)")
+
+
+if __name__ == "__main__":
+    main()
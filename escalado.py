@@ -0,0 +1,85 @@
+"""Escalado de filas y columnas de A antes de construir el tableau
+
+Con factores r (filas) y s (columnas), y un factor kc para el objetivo y otro kb para los
+términos independientes, el modelo escalado es A' = diag(r)·A·diag(s), c' = kc·diag(s)·c y
+b' = kb·diag(r)·b. Las variables originales se recuperan como xj = sj·x'j / kb, la holgura
+de la fila i como hi = h'i / (kb·ri) y Z como Z' / (kc·kb). Los factores se redondean a
+potencias de 2 para que escalar y desescalar no añadan error de redondeo.
+
+- geometrico: pasadas alternas que dividen cada fila y cada columna por la media
+  geométrica de su mayor y su menor coeficiente, mientras el rango max|a|/min|a| mejore
+- equilibrio: cada fila y luego cada columna se divide por su mayor coeficiente
+"""
+import numpy as np
+
+METODOS = ("geometrico", "equilibrio")
+
+MAX_PASADAS = 8
+MEJORA_MINIMA = 0.9  # La pasada geométrica debe reducir el rango al menos un 10 %
+
+
+def _grupos(indices):
+    """Orden que agrupa las entradas por índice, inicio de cada grupo no vacío y sus índices"""
+    orden = np.argsort(indices, kind="stable")
+    ordenados = indices[orden]
+    if not len(ordenados):
+        return orden, np.zeros(0, dtype=np.int64), ordenados
+    inicios = np.flatnonzero(np.r_[True, ordenados[1:] != ordenados[:-1]])
+    return orden, inicios, ordenados[inicios]
+
+
+def _extremos(magnitudes, grupos, tamano):
+    """(máximo, mínimo) de las magnitudes de cada grupo; 1 en los grupos vacíos"""
+    orden, inicios, indices = grupos
+    maximos, minimos = np.ones(tamano), np.ones(tamano)
+    if len(inicios):
+        ordenadas = magnitudes[orden]
+        maximos[indices] = np.maximum.reduceat(ordenadas, inicios)
+        minimos[indices] = np.minimum.reduceat(ordenadas, inicios)
+    return maximos, minimos
+
+
+def _potencia_de_2(factores):
+    return np.exp2(np.round(np.log2(factores)))
+
+
+def _rango(magnitudes):
+    return magnitudes.max() / magnitudes.min() if len(magnitudes) else 1.0
+
+
+def factor_vector(valores):
+    """Potencia de 2 que deja el mayor valor absoluto cerca de 1 (1 si todos son cero)"""
+    mayor = float(np.max(np.abs(valores), initial=0.0))
+    return float(_potencia_de_2(1 / mayor)) if mayor > 0 else 1.0
+
+
+def factores_escalado(filas, columnas, valores, forma, metodo):
+    """Factores (r, s) de filas y columnas para los tripletes de A con el método indicado"""
+    if metodo not in METODOS:
+        raise ValueError(f"Método de escalado no soportado: {metodo}")
+    m, n = forma
+    filas, columnas = np.asarray(filas, dtype=np.int64), np.asarray(columnas, dtype=np.int64)
+    magnitudes = np.abs(np.asarray(valores, dtype=float))
+    no_nulos = magnitudes > 0
+    filas, columnas, magnitudes = filas[no_nulos], columnas[no_nulos], magnitudes[no_nulos]
+    grupos_filas, grupos_columnas = _grupos(filas), _grupos(columnas)
+    r, s = np.ones(m), np.ones(n)
+
+    if metodo == "equilibrio":
+        maximos, _ = _extremos(magnitudes, grupos_filas, m)
+        r = _potencia_de_2(1 / maximos)
+        maximos, _ = _extremos(magnitudes * r[filas], grupos_columnas, n)
+        s = _potencia_de_2(1 / maximos)
+        return r, s
+
+    rango = _rango(magnitudes)
+    for _ in range(MAX_PASADAS):
+        maximos, minimos = _extremos(magnitudes * s[columnas], grupos_filas, m)
+        r_nuevo = 1 / np.sqrt(maximos * minimos)
+        maximos, minimos = _extremos(magnitudes * r_nuevo[filas], grupos_columnas, n)
+        s_nuevo = 1 / np.sqrt(maximos * minimos)
+        rango_nuevo = _rango(magnitudes * r_nuevo[filas] * s_nuevo[columnas])
+        if rango_nuevo > MEJORA_MINIMA * rango:
+            break
+        r, s, rango = r_nuevo, s_nuevo, rango_nuevo
+    return _potencia_de_2(r), _potencia_de_2(s)
@@ -0,0 +1,620 @@
+"""Lectura en flujo de modelos MPS (libre y fijo) y CPLEX-LP
+
+Los archivos se recorren línea a línea y los coeficientes de la matriz se van guardando en
+arreglos tipados (array de C, sin un objeto Python por coeficiente), de modo que nunca se
+tiene el texto completo en memoria. El resultado tiene los campos de la entrada matricial
+de /resolver (c, A en tripletes, b, tipos, tipo_optimizacion, nombres_variables y
+constante_objetivo).
+
+El solver solo admite variables no negativas: las cotas superiores y las inferiores
+positivas se convierten en restricciones, y las variables libres o con cota inferior
+negativa se rechazan. La integralidad (MARKER, General, Binary) se ignora: se resuelve la
+relajación lineal.
+
+Uso:
+    python lector_modelos.py modelo.mps
+    python lector_modelos.py modelo.lp.gz --opciones '{"metodo": "revisado"}'
+"""
+import argparse
+import gzip
+import io
+import json
+import re
+import sys
+from array import array
+
+import numpy as np
+
+FORMATOS = ("mps", "mps_fijo", "lp")
+
+# Columnas (base 1) de los seis campos de una línea MPS en formato fijo
+_CAMPOS_FIJOS = ((2, 3), (5, 12), (15, 22), (25, 36), (40, 47), (50, 61))
+_SECCIONES_MPS = {"NAME", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA", "OBJSENSE", "OBJSENCE"}
+_SENTIDOS_MPS = {"L": "<=", "G": ">=", "E": "="}
+
+
+class ModeloEnConstruccion:
+    """Acumula columnas, coeficientes y filas mientras se lee un modelo"""
+
+    def __init__(self):
+        self.columnas = {}  # Nombre -> índice, en orden de aparición
+        self.costos = {}  # Índice de columna -> coeficiente de la función objetivo
+        self.filas = array('q')
+        self.indices_columnas = array('q')
+        self.valores = array('d')
+        self.b = array('d')
+        self.tipos = []
+        self.nombres_filas = []
+        self.cotas_inferiores = {}
+        self.cotas_superiores = {}
+        self.tipo_optimizacion = "min"
+        self.constante_objetivo = 0.0
+        self.enteras = set()  # Índices de columnas declaradas enteras
+        self.nombre = None
+
+    def columna(self, nombre):
+        indice = self.columnas.get(nombre)
+        if indice is None:
+            indice = self.columnas[nombre] = len(self.columnas)
+        return indice
+
+    def agregar_fila(self, nombre, tipo, valor=0.0):
+        self.nombres_filas.append(nombre)
+        self.tipos.append(tipo)
+        self.b.append(valor)
+        return len(self.tipos) - 1
+
+    def agregar_coeficiente(self, fila, columna, valor):
+        self.filas.append(fila)
+        self.indices_columnas.append(columna)
+        self.valores.append(valor)
+
+    def agregar_costo(self, columna, valor):
+        self.costos[columna] = self.costos.get(columna, 0.0) + valor
+
+    def fijar_cota(self, nombre, inferior=None, superior=None):
+        columna = self.columna(nombre)
+        if inferior is not None:
+            self.cotas_inferiores[columna] = inferior
+        if superior is not None:
+            self.cotas_superiores[columna] = superior
+
+    def agregar_filas_de_cotas(self):
+        """Convertir las cotas en restricciones x >= l, x <= u o x = v"""
+        nombres = list(self.columnas)
+        for columna in sorted(set(self.cotas_inferiores) | set(self.cotas_superiores)):
+            inferior = self.cotas_inferiores.get(columna, 0.0)
+            superior = self.cotas_superiores.get(columna, np.inf)
+            if inferior < 0:
+                raise ValueError(f"La variable {nombres[columna]} es libre o tiene cota inferior negativa; "
+                                 "el solver solo admite variables no negativas")
+            if superior < inferior:
+                raise ValueError(f"La variable {nombres[columna]} tiene cota superior menor que la inferior")
+
+            if inferior == superior:
+                fila = self.agregar_fila(f"cota_{nombres[columna]}", "=", inferior)
+                self.agregar_coeficiente(fila, columna, 1.0)
+                continue
+            if inferior > 0:
+                fila = self.agregar_fila(f"cota_inf_{nombres[columna]}", ">=", inferior)
+                self.agregar_coeficiente(fila, columna, 1.0)
+            if np.isfinite(superior):
+                fila = self.agregar_fila(f"cota_sup_{nombres[columna]}", "<=", superior)
+                self.agregar_coeficiente(fila, columna, 1.0)
+
+    def resultado(self, formato):
+        """Campos de la entrada matricial junto con un resumen del modelo leído"""
+        self.agregar_filas_de_cotas()
+        if not self.tipos:
+            raise ValueError("El modelo no tiene restricciones")
+        if not self.columnas:
+            raise ValueError("El modelo no tiene variables")
+
+        num_variables = len(self.columnas)
+        c = np.zeros(num_variables)
+        if self.costos:
+            c[list(self.costos)] = list(self.costos.values())
+
+        avisos = []
+        if self.enteras:
+            avisos.append(f"Se ignoró la integralidad de {len(self.enteras)} variables (relajación lineal)")
+
+        return {
+            'c': c,
+            'A': {
+                'forma': [len(self.tipos), num_variables],
+                'filas': np.frombuffer(self.filas, dtype=np.int64),
+                'columnas': np.frombuffer(self.indices_columnas, dtype=np.int64),
+                'valores': np.frombuffer(self.valores, dtype=float)
+            },
+            'b': np.frombuffer(self.b, dtype=float),
+            'tipos': self.tipos,
+            'tipo_optimizacion': self.tipo_optimizacion,
+            'nombres_variables': list(self.columnas),
+            'constante_objetivo': self.constante_objetivo,
+            'modelo': {
+                'nombre': self.nombre,
+                'formato': formato,
+                'filas': len(self.tipos),
+                'columnas': num_variables,
+                'no_nulos': len(self.valores),
+                'avisos': avisos
+            }
+        }
+
+
+def _numero(texto):
+    try:
+        return float(texto)
+    except ValueError:
+        raise ValueError(f"Se esperaba un número y se encontró '{texto}'")
+
+
+def _campos_mps(linea, fijo):
+    if not fijo:
+        return linea.split()
+    campos = [linea[inicio - 1:fin].strip() for inicio, fin in _CAMPOS_FIJOS]
+    while campos and not campos[-1]:
+        campos.pop()
+    return campos
+
+
+def leer_mps(lineas, fijo=False):
+    """Leer un modelo MPS desde cualquier iterable de líneas (por ejemplo, un archivo abierto)
+
+    En formato libre los campos se separan por espacios; en el fijo se toman por columnas,
+    lo que permite nombres con espacios. La primera fila N es el objetivo (su RHS es la
+    constante con signo cambiado) y el resto de filas N se ignoran.
+    """
+    modelo = ModeloEnConstruccion()
+    indices_filas = {}
+    objetivo = None
+    libres = set()  # Filas N adicionales
+    enteras = False  # Dentro de un bloque MARKER INTORG/INTEND
+    rangos = {}
+    seccion = None
+
+    for numero_linea, linea in enumerate(lineas, 1):
+        linea = linea.rstrip("\r\n")
+        if not linea.strip() or linea.startswith("*"):
+            continue
+        try:
+            if not linea[0].isspace():
+                # Encabezado de sección (OBJSENSE y NAME pueden traer el valor en la misma línea)
+                partes = linea.split()
+                seccion = partes[0].upper()
+                if seccion not in _SECCIONES_MPS:
+                    raise ValueError(f"Sección MPS desconocida '{partes[0]}'")
+                if seccion == "NAME":
+                    modelo.nombre = " ".join(partes[1:]) or None
+                elif seccion in ("OBJSENSE", "OBJSENCE") and len(partes) > 1:
+                    modelo.tipo_optimizacion = _sentido_objetivo(partes[1])
+                elif seccion == "ENDATA":
+                    break
+                continue
+
+            campos = _campos_mps(linea, fijo)
+            if fijo and seccion in ("COLUMNS", "RHS", "RANGES"):
+                campos = campos[1:]  # El campo 1 (tipo) solo se usa en ROWS y BOUNDS
+            if seccion in ("OBJSENSE", "OBJSENCE"):
+                modelo.tipo_optimizacion = _sentido_objetivo(campos[0])
+
+            elif seccion == "ROWS":
+                tipo, nombre = campos[0].upper(), campos[1]
+                if tipo == "N":
+                    if objetivo is None:
+                        objetivo = nombre
+                    else:
+                        libres.add(nombre)
+                elif tipo in _SENTIDOS_MPS:
+                    indices_filas[nombre] = modelo.agregar_fila(nombre, _SENTIDOS_MPS[tipo])
+                else:
+                    raise ValueError(f"Tipo de fila desconocido '{campos[0]}'")
+
+            elif seccion == "COLUMNS":
+                if len(campos) > 2 and campos[1].strip("'\"").upper() == "MARKER":
+                    enteras = campos[2].strip("'\"").upper() == "INTORG"
+                    continue
+                columna = modelo.columna(campos[0])
+                if enteras:
+                    modelo.enteras.add(columna)
+                if len(campos) not in (3, 5):
+                    raise ValueError("Una línea de COLUMNS debe tener uno o dos pares fila/valor")
+                for fila, valor in zip(campos[1::2], campos[2::2]):
+                    valor = _numero(valor)
+                    if fila == objetivo:
+                        modelo.agregar_costo(columna, valor)
+                    elif fila in indices_filas:
+                        modelo.agregar_coeficiente(indices_filas[fila], columna, valor)
+                    elif fila not in libres:
+                        raise ValueError(f"Fila '{fila}' no declarada en ROWS")
+
+            elif seccion in ("RHS", "RANGES"):
+                # El nombre del conjunto es opcional en formato libre: sobra un campo si está
+                pares = campos[1:] if len(campos) % 2 else campos
+                for fila, valor in zip(pares[0::2], pares[1::2]):
+                    valor = _numero(valor)
+                    if seccion == "RHS" and fila == objetivo:
+                        modelo.constante_objetivo = -valor
+                    elif fila in indices_filas:
+                        if seccion == "RHS":
+                            modelo.b[indices_filas[fila]] = valor
+                        else:
+                            rangos[indices_filas[fila]] = valor
+                    elif fila not in libres:
+                        raise ValueError(f"Fila '{fila}' no declarada en ROWS")
+
+            elif seccion == "BOUNDS":
+                _cota_mps(modelo, campos)
+
+            else:
+                raise ValueError("Línea de datos fuera de una sección")
+        except (IndexError, ValueError) as e:
+            detalle = str(e) if isinstance(e, ValueError) else "faltan campos"
+            raise ValueError(f"Línea {numero_linea} del MPS: {detalle}")
+
+    _aplicar_rangos(modelo, rangos)
+    return modelo.resultado("mps_fijo" if fijo else "mps")
+
+
+def _sentido_objetivo(texto):
+    texto = texto.lower()
+    if texto.startswith("max"):
+        return "max"
+    if texto.startswith("min"):
+        return "min"
+    raise ValueError(f"Sentido de optimización desconocido '{texto}'")
+
+
+def _cota_mps(modelo, campos):
+    tipo = campos[0].upper()
+    if tipo in ("UP", "LO", "FX", "LI", "UI"):
+        # (tipo, conjunto, columna, valor) o, sin conjunto, (tipo, columna, valor)
+        nombre, valor = (campos[2], campos[3]) if len(campos) >= 4 else (campos[1], campos[2])
+        valor = _numero(valor)
+        if tipo in ("UP", "UI"):
+            if valor < 0 and modelo.columnas.get(nombre) not in modelo.cotas_inferiores:
+                # Convención MPS: UP negativo sin cota inferior deja la variable sin cota inferior
+                modelo.fijar_cota(nombre, inferior=-np.inf)
+            modelo.fijar_cota(nombre, superior=valor)
+        elif tipo in ("LO", "LI"):
+            modelo.fijar_cota(nombre, inferior=valor)
+        else:
+            modelo.fijar_cota(nombre, inferior=valor, superior=valor)
+        if tipo in ("LI", "UI"):
+            modelo.enteras.add(modelo.columna(nombre))
+    elif tipo in ("FR", "MI", "PL", "BV"):
+        nombre = campos[2] if len(campos) >= 3 else campos[1]
+        if tipo in ("FR", "MI"):
+            modelo.fijar_cota(nombre, inferior=-np.inf)
+        elif tipo == "BV":
+            modelo.fijar_cota(nombre, inferior=0.0, superior=1.0)
+            modelo.enteras.add(modelo.columna(nombre))
+        else:
+            modelo.columna(nombre)
+    else:
+        raise ValueError(f"Tipo de cota desconocido '{campos[0]}'")
+
+
+def _aplicar_rangos(modelo, rangos):
+    """Convertir los RANGES en una segunda restricción sobre la misma fila"""
+    if not rangos:
+        return
+    # Copias: un array de C no puede crecer mientras NumPy comparte su memoria
+    filas = np.array(modelo.filas, dtype=np.int64)
+    columnas = np.array(modelo.indices_columnas, dtype=np.int64)
+    valores = np.array(modelo.valores, dtype=float)
+    orden = np.argsort(filas, kind="stable")
+    filas_ordenadas = filas[orden]
+    for fila, rango in rangos.items():
+        tipo, b = modelo.tipos[fila], modelo.b[fila]
+        if tipo == "<=":
+            nuevo = (">=", b - abs(rango))
+        elif tipo == ">=":
+            nuevo = ("<=", b + abs(rango))
+        elif rango >= 0:
+            modelo.tipos[fila] = ">="
+            nuevo = ("<=", b + rango)
+        else:
+            modelo.tipos[fila] = "<="
+            nuevo = (">=", b + rango)
+
+        copia = modelo.agregar_fila(f"{modelo.nombres_filas[fila]}_rango", *nuevo)
+        inicio, fin = np.searchsorted(filas_ordenadas, (fila, fila + 1))
+        for posicion in orden[inicio:fin]:
+            modelo.agregar_coeficiente(copia, int(columnas[posicion]), float(valores[posicion]))
+
+
+# Secciones del formato LP (se comparan en minúsculas y sin espacios repetidos)
+_SECCIONES_LP = {
+    "maximize": "max", "maximise": "max", "maximum": "max", "max": "max",
+    "minimize": "min", "minimise": "min", "minimum": "min", "min": "min",
+    "subject to": "restricciones", "such that": "restricciones", "st": "restricciones",
+    "s.t.": "restricciones", "st.": "restricciones",
+    "bounds": "cotas", "bound": "cotas",
+    "general": "enteras", "generals": "enteras", "gen": "enteras",
+    "integer": "enteras", "integers": "enteras",
+    "binary": "binarias", "binaries": "binarias", "bin": "binarias",
+    "end": "fin",
+}
+_ENCABEZADO_LP = re.compile(
+    r"\s*(subject\s+to|such\s+that|s\.t\.|st\.?|maximi[sz]e|maximum|max|minimi[sz]e|minimum|min|"
+    r"bounds?|generals?|gen|integers?|binary|binaries|bin|end)(?=\s|$)", re.IGNORECASE)
+_TOKEN_LP = re.compile(r"""\s*(?:
+    (?P<etiqueta>[^\s:+\-<>=*\d][^\s:+\-<>=*]*)\s*:
+  | (?P<operador><=|=<|>=|=>|<|>|=)
+  | (?P<numero>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|inf(?:inity)?(?![\w.]))
+  | (?P<signo>[+-])
+  | (?P<producto>\*)
+  | (?P<nombre>[^\s:+\-<>=*\d][^\s:+\-<>=*]*)
+)""", re.VERBOSE | re.IGNORECASE)
+_OPERADORES_LP = {"<=": "<=", "=<": "<=", "<": "<=", ">=": ">=", "=>": ">=", ">": ">=", "=": "="}
+
+
+def _tokens_lp(texto):
+    posicion = 0
+    texto = texto.rstrip()
+    while posicion < len(texto):
+        token = _TOKEN_LP.match(texto, posicion)
+        if not token:
+            raise ValueError(f"No se reconoce '{texto[posicion:].strip()[:20]}'")
+        posicion = token.end()
+        tipo = token.lastgroup
+        yield tipo, token.group(tipo)
+
+
+class _ExpresionLP:
+    """Expresión lineal del formato LP que se va completando token a token"""
+
+    def __init__(self):
+        self.terminos = []  # (nombre, coeficiente)
+        self.constante = 0.0
+        self.signo = 1.0
+        self.coeficiente = None
+        self.operador = None
+        self.rhs = None
+        self.etiqueta = None
+
+    def vacia(self):
+        return not self.terminos and self.coeficiente is None and self.operador is None and self.constante == 0
+
+    def agregar(self, tipo, valor):
+        if tipo == "etiqueta":
+            if not self.vacia():
+                raise ValueError(f"Etiqueta '{valor}:' en medio de una expresión")
+            self.etiqueta = valor
+        elif tipo == "signo":
+            self.signo *= -1.0 if valor == "-" else 1.0
+        elif tipo == "numero":
+            numero = self.signo * (np.inf if valor.lower().startswith("inf") else float(valor))
+            self.signo = 1.0
+            if self.operador is not None:
+                self.rhs = numero
+            elif self.coeficiente is not None:
+                raise ValueError(f"Dos números seguidos: {self.coeficiente} {valor}")
+            else:
+                self.coeficiente = numero
+        elif tipo == "nombre":
+            if self.operador is not None:
+                raise ValueError(f"El lado derecho debe ser un número y se encontró '{valor}'")
+            coef = self.signo * (1.0 if self.coeficiente is None else self.coeficiente)
+            self.terminos.append((valor, coef))
+            self.coeficiente = None
+            self.signo = 1.0
+        elif tipo == "operador":
+            self.cerrar_constante()
+            if self.operador is not None:
+                raise ValueError("Restricción con dos operadores")
+            self.operador = _OPERADORES_LP[valor]
+
+    def cerrar_constante(self):
+        if self.coeficiente is not None:
+            self.constante += self.coeficiente
+            self.coeficiente = None
+
+    def completa(self):
+        return self.operador is not None and self.rhs is not None
+
+
+def leer_lp(lineas):
+    """Leer un modelo en formato CPLEX-LP desde cualquier iterable de líneas
+
+    Las expresiones pueden ocupar varias líneas; una restricción termina al leer el número
+    del lado derecho. En Bounds se admiten 'x <= u', 'l <= x', 'l <= x <= u', 'x = v' y
+    'x free' (rechazada, como en MPS).
+    """
+    modelo = ModeloEnConstruccion()
+    seccion = None
+    actual = _ExpresionLP()
+    objetivo = None
+
+    for numero_linea, linea in enumerate(lineas, 1):
+        linea = linea.split("\\", 1)[0]
+        if not linea.strip():
+            continue
+        try:
+            encabezado = _ENCABEZADO_LP.match(linea)
+            if encabezado and (seccion != "restricciones" or actual.vacia()):
+                clave = " ".join(encabezado.group(1).lower().split())
+                nueva = _SECCIONES_LP[clave]
+                if nueva in ("max", "min"):
+                    modelo.tipo_optimizacion = nueva
+                    objetivo = actual = _ExpresionLP()
+                    nueva = "objetivo"
+                elif seccion == "objetivo":
+                    objetivo.cerrar_constante()
+                    actual = _ExpresionLP()
+                seccion = nueva
+                if seccion == "fin":
+                    break
+                linea = linea[encabezado.end():]
+                if not linea.strip():
+                    continue
+
+            if seccion == "objetivo":
+                for tipo, valor in _tokens_lp(linea):
+                    if tipo == "operador":
+                        raise ValueError("La función objetivo no puede tener operadores")
+                    objetivo.agregar(tipo, valor)
+            elif seccion == "restricciones":
+                for tipo, valor in _tokens_lp(linea):
+                    actual.agregar(tipo, valor)
+                    if actual.completa():
+                        _agregar_restriccion_lp(modelo, actual)
+                        actual = _ExpresionLP()
+            elif seccion == "cotas":
+                _cota_lp(modelo, list(_tokens_lp(linea)))
+            elif seccion in ("enteras", "binarias"):
+                for tipo, nombre in _tokens_lp(linea):
+                    if tipo != "nombre":
+                        raise ValueError(f"Se esperaba un nombre de variable y se encontró '{nombre}'")
+                    if seccion == "binarias":
+                        modelo.fijar_cota(nombre, inferior=0.0, superior=1.0)
+                    modelo.enteras.add(modelo.columna(nombre))
+            else:
+                raise ValueError("Texto antes de la sección Maximize/Minimize")
+        except ValueError as e:
+            raise ValueError(f"Línea {numero_linea} del LP: {str(e)}")
+
+    if not actual.vacia() and seccion == "restricciones":
+        raise ValueError("La última restricción del LP está incompleta")
+    if objetivo is None:
+        raise ValueError("El LP no tiene sección Maximize/Minimize")
+
+    objetivo.cerrar_constante()
+    for nombre, coef in objetivo.terminos:
+        modelo.agregar_costo(modelo.columna(nombre), coef)
+    modelo.constante_objetivo = objetivo.constante
+    return modelo.resultado("lp")
+
+
+def _agregar_restriccion_lp(modelo, expresion):
+    if not expresion.terminos:
+        raise ValueError("Restricción sin variables")
+    if not np.isfinite(expresion.rhs):
+        raise ValueError("El lado derecho de una restricción debe ser finito")
+    fila = modelo.agregar_fila(expresion.etiqueta or f"R{len(modelo.tipos) + 1}", expresion.operador,
+                               expresion.rhs - expresion.constante)
+    for nombre, coef in expresion.terminos:
+        modelo.agregar_coeficiente(fila, modelo.columna(nombre), coef)
+
+
+def _cota_lp(modelo, tokens):
+    # El signo se une al número siguiente
+    valores = []
+    signo = 1.0
+    for tipo, valor in tokens:
+        if tipo == "signo":
+            signo *= -1.0 if valor == "-" else 1.0
+        elif tipo == "numero":
+            valores.append(("numero", signo * (np.inf if valor.lower().startswith("inf") else float(valor))))
+            signo = 1.0
+        else:
+            valores.append((tipo, valor))
+    tipos = [tipo for tipo, _ in valores]
+
+    if tipos == ["nombre", "nombre"] and valores[1][1].lower() == "free":
+        modelo.fijar_cota(valores[0][1], inferior=-np.inf)
+    elif tipos == ["nombre", "operador", "numero"]:
+        _cota_lp_operador(modelo, valores[0][1], _OPERADORES_LP[valores[1][1]], valores[2][1])
+    elif tipos == ["numero", "operador", "nombre"]:
+        invertido = {"<=": ">=", ">=": "<=", "=": "="}[_OPERADORES_LP[valores[1][1]]]
+        _cota_lp_operador(modelo, valores[2][1], invertido, valores[0][1])
+    elif tipos == ["numero", "operador", "nombre", "operador", "numero"]:
+        invertido = {"<=": ">=", ">=": "<=", "=": "="}[_OPERADORES_LP[valores[1][1]]]
+        _cota_lp_operador(modelo, valores[2][1], invertido, valores[0][1])
+        _cota_lp_operador(modelo, valores[2][1], _OPERADORES_LP[valores[3][1]], valores[4][1])
+    else:
+        raise ValueError("Cota no reconocida")
+
+
+def _cota_lp_operador(modelo, nombre, operador, valor):
+    if operador == "<=":
+        modelo.fijar_cota(nombre, superior=valor)
+    elif operador == ">=":
+        modelo.fijar_cota(nombre, inferior=valor)
+    else:
+        modelo.fijar_cota(nombre, inferior=valor, superior=valor)
+
+
+def detectar_formato(nombre=None, primera_linea=""):
+    """Formato por la extensión del archivo (.mps, .lp, con o sin .gz) o por su contenido"""
+    if nombre:
+        nombre = nombre.lower()
+        if nombre.endswith(".gz"):
+            nombre = nombre[:-3]
+        if nombre.endswith(".mps"):
+            return "mps"
+        if nombre.endswith(".lp"):
+            return "lp"
+    palabra = primera_linea.split()[0].upper() if primera_linea.split() else ""
+    return "mps" if palabra in _SECCIONES_MPS else "lp"
+
+
+def abrir_texto(flujo):
+    """Envolver un flujo binario (archivo o subida) como texto, descomprimiendo gzip si hace falta"""
+    flujo = io.BufferedReader(flujo) if not hasattr(flujo, "peek") else flujo
+    if flujo.peek(2)[:2] == b"\x1f\x8b":
+        flujo = gzip.GzipFile(fileobj=flujo)
+    return io.TextIOWrapper(flujo, encoding="utf-8", errors="replace")
+
+
+def leer_modelo(flujo, formato=None, nombre=None):
+    """Leer un modelo desde un flujo binario; formato es 'mps', 'mps_fijo', 'lp' o None para detectarlo"""
+    if formato is not None and formato not in FORMATOS:
+        raise ValueError(f"Formato de modelo no soportado: {formato}")
+    texto = abrir_texto(flujo)
+
+    if formato is None:
+        # Se mira la primera línea con contenido sin perderla (ni los comentarios previos, para
+        # que los errores indiquen la línea correcta del archivo)
+        leidas = []
+        for linea in texto:
+            leidas.append(linea)
+            if linea.strip() and not linea.startswith(("*", "\\")):
+                break
+        formato = detectar_formato(nombre, leidas[-1] if leidas else "")
+        lineas = _encadenar(leidas, texto)
+    else:
+        lineas = texto
+
+    if formato == "lp":
+        return leer_lp(lineas)
+    return leer_mps(lineas, fijo=formato == "mps_fijo")
+
+
+def _encadenar(leidas, resto):
+    yield from leidas
+    yield from resto
+
+
+def leer_archivo(ruta, formato=None):
+    with open(ruta, "rb") as archivo:
+        return leer_modelo(archivo, formato, nombre=ruta)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolver un modelo MPS o LP con el SimplexSolver")
+    parser.add_argument("archivo")
+    parser.add_argument("--formato", choices=FORMATOS, help="Por defecto se deduce de la extensión")
+    parser.add_argument("--opciones", default="{}", help="JSON con opciones de /resolver (metodo, regla_precio, ...)")
+    parser.add_argument("--completo", action="store_true",
+                        help="Incluir tableaux, pasos y problema original en la salida")
+    args = parser.parse_args()
+
+    from simplex import resolver_modelo, resumir_resultado
+
+    try:
+        modelo = leer_archivo(args.archivo, args.formato)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    resultado, _ = resolver_modelo(modelo, {'cache': False, **json.loads(args.opciones)})
+
+    if not args.completo:
+        resumir_resultado(resultado)
+    print(json.dumps(resultado, indent=2, ensure_ascii=False))
+    return 0 if 'error' not in resultado else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
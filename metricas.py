@@ -0,0 +1,152 @@
+"""Métricas de /resolver en el formato de texto de Prometheus
+
+Contadores e histogramas propios (sin depender de prometheus_client) que se exponen en
+/metrics. Cada proceso lleva sus propias métricas: con varios workers, Prometheus debe
+consultar cada uno o sumar las series por instancia.
+"""
+import bisect
+import threading
+
+# Límites de las cubetas (el +Inf se añade al exportar)
+LIMITES_SEGUNDOS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+LIMITES_ITERACIONES = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+LIMITES_TAMANO = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 100000, 1000000)
+
+TIPO_CONTENIDO = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _etiquetas(nombres, valores, extra=None):
+    pares = [f'{nombre}="{_escapar(valor)}"' for nombre, valor in zip(nombres, valores)]
+    if extra is not None:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _numero(valor):
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+class Contador:
+    """Contador monótono con etiquetas opcionales"""
+
+    def __init__(self, nombre, ayuda, etiquetas=()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.etiquetas = tuple(etiquetas)
+        self.valores = {}  # Tupla de valores de etiquetas -> cuenta
+        self.bloqueo = threading.Lock()
+
+    def incrementar(self, cantidad=1, **etiquetas):
+        clave = tuple(str(etiquetas[nombre]) for nombre in self.etiquetas)
+        with self.bloqueo:
+            self.valores[clave] = self.valores.get(clave, 0) + cantidad
+
+    def exportar(self):
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} counter"]
+        with self.bloqueo:
+            for clave, valor in sorted(self.valores.items()):
+                lineas.append(f"{self.nombre}{_etiquetas(self.etiquetas, clave)} {_numero(valor)}")
+        return lineas
+
+
+class Histograma:
+    """Histograma acumulativo con cubetas fijas, suma y cuenta por serie de etiquetas"""
+
+    def __init__(self, nombre, ayuda, limites, etiquetas=()):
+        self.nombre = nombre
+        self.ayuda = ayuda
+        self.limites = tuple(sorted(limites))
+        self.etiquetas = tuple(etiquetas)
+        self.series = {}  # Tupla de valores de etiquetas -> [cuentas por cubeta (+Inf al final), suma]
+        self.bloqueo = threading.Lock()
+
+    def observar(self, valor, **etiquetas):
+        clave = tuple(str(etiquetas[nombre]) for nombre in self.etiquetas)
+        # Cubeta con el menor límite >= valor (le es inclusivo)
+        cubeta = bisect.bisect_left(self.limites, valor)
+        with self.bloqueo:
+            serie = self.series.get(clave)
+            if serie is None:
+                serie = self.series[clave] = [[0] * (len(self.limites) + 1), 0.0]
+            serie[0][cubeta] += 1
+            serie[1] += valor
+
+    def exportar(self):
+        lineas = [f"# HELP {self.nombre} {self.ayuda}", f"# TYPE {self.nombre} histogram"]
+        with self.bloqueo:
+            for clave, (cuentas, suma) in sorted(self.series.items()):
+                acumulado = 0
+                for limite, cuenta in zip(self.limites + ("+Inf",), cuentas):
+                    acumulado += cuenta
+                    le = f'le="{limite if limite == "+Inf" else _numero(limite)}"'
+                    lineas.append(f"{self.nombre}_bucket{_etiquetas(self.etiquetas, clave, le)} {acumulado}")
+                lineas.append(f"{self.nombre}_sum{_etiquetas(self.etiquetas, clave)} {_numero(suma)}")
+                lineas.append(f"{self.nombre}_count{_etiquetas(self.etiquetas, clave)} {acumulado}")
+        return lineas
+
+
+class MetricasResolucion:
+    """Métricas de las peticiones y resoluciones de la aplicación"""
+
+    def __init__(self, fases=()):
+        """fases son los nombres de las fases medidas (Estadisticas.FASES), para la ayuda"""
+        self.peticiones = Contador(
+            "simplex_peticiones_total", "Peticiones atendidas por ruta y código HTTP", ("ruta", "codigo"))
+        self.latencia = Histograma(
+            "simplex_peticion_segundos", "Duración de cada petición de principio a fin", LIMITES_SEGUNDOS, ("ruta",))
+        self.resultados = Contador(
+            "simplex_resultados_total", "Problemas resueltos por estado (optimo, infactible, no_acotado, ...)",
+            ("estado",))
+        self.aciertos_cache = Contador(
+            "simplex_resultados_cache_total", "Problemas respondidos desde la caché de resultados")
+        self.fases = Histograma(
+            "simplex_fase_segundos", "Tiempo de cada fase" + (f" ({', '.join(fases)})" if fases else ""),
+            LIMITES_SEGUNDOS, ("fase",))
+        self.iteraciones = Histograma(
+            "simplex_iteraciones", "Iteraciones por resolución", LIMITES_ITERACIONES)
+        self.filas = Histograma(
+            "simplex_tableau_filas", "Restricciones (m) del problema estandarizado", LIMITES_TAMANO)
+        self.columnas = Histograma(
+            "simplex_tableau_columnas", "Variables (n) del problema estandarizado, con holguras y artificiales",
+            LIMITES_TAMANO)
+
+    def registrar_peticion(self, ruta, codigo, segundos):
+        self.peticiones.incrementar(ruta=ruta, codigo=codigo)
+        self.latencia.observar(segundos, ruta=ruta)
+
+    def registrar_resolucion(self, resultado, solver=None):
+        """Registrar una respuesta de resolver; sin solver (lotes en otros procesos) solo se
+        registran el estado y las iteraciones"""
+        estado = resultado.get('estado', 'invalido' if 'error' in resultado else 'optimo')
+        self.resultados.incrementar(estado=estado)
+        if resultado.get('desde_cache'):
+            self.aciertos_cache.incrementar()
+            return
+        if 'iteraciones' in resultado:
+            self.iteraciones.observar(resultado['iteraciones'])
+        if solver is None:
+            return
+        for fase, segundos in solver.estadisticas.tiempos.items():
+            self.fases.observar(segundos, fase=fase)
+        if 'iteraciones' in resultado:
+            self.filas.observar(len(solver.b))
+            self.columnas.observar(len(solver.c))
+
+    def exportar(self, cache=None):
+        """Texto para /metrics; cache son las estadísticas de CacheResultados, si está activa"""
+        lineas = []
+        for metrica in (self.peticiones, self.latencia, self.resultados, self.aciertos_cache,
+                        self.fases, self.iteraciones, self.filas, self.columnas):
+            lineas.extend(metrica.exportar())
+        if cache is not None:
+            for clave, tipo, ayuda in (
+                    ('entradas', 'gauge', "Entradas en la caché de resultados"),
+                    ('bytes', 'gauge', "Bytes ocupados por la caché de resultados"),
+                    ('expulsiones', 'counter', "Entradas expulsadas de la caché de resultados")):
+                nombre = f"simplex_cache_{clave}" + ("_total" if tipo == 'counter' else "")
+                lineas.extend([f"# HELP {nombre} {ayuda}", f"# TYPE {nombre} {tipo}", f"{nombre} {cache[clave]}"])
+        return "\n".join(lineas) + "\n"
@@ -0,0 +1,275 @@
+"""Presolve: reducciones del modelo antes de estandarizar
+
+Trabaja sobre el problema tal como queda tras configurar (y, si se pidió, tras la dualidad):
+max/min c·x sujeto a A·x {<=, >=, =} b con x >= 0. Las reducciones se repiten hasta que
+ninguna cambia el modelo:
+
+- filas vacías: se comprueba 0 {<=, >=, =} b y se eliminan
+- filas redundantes o forzadas por el signo de sus coeficientes (con x >= 0, una fila
+  x1 + x2 <= 0 obliga a x1 = x2 = 0)
+- filas singleton: a·xj = b fija xj; una cota inferior positiva desplaza xj y la fila
+  desaparece; una cota superior se conserva como fila salvo xj <= 0, que la fija en cero
+- filas duplicadas: las filas proporcionales se combinan en una (o en dos si forman un rango)
+- columnas dominadas: si aumentar xj no mejora el objetivo ni ayuda a cumplir ninguna fila,
+  se fija xj = 0
+
+Las variables fijadas o desplazadas se sustituyen en b y en la constante del objetivo;
+Presolve.postsolve reconstruye los valores de todas las variables originales.
+"""
+import numpy as np
+
+TOLERANCIA = 1e-9
+
+# Reducciones que se cuentan en el resumen, en el orden en que se aplican
+REDUCCIONES = ('filas_vacias', 'filas_redundantes', 'filas_forzadas', 'filas_singleton',
+               'filas_duplicadas', 'variables_fijas', 'columnas_dominadas')
+
+
+class Presolve:
+    """Modelo reducido y mapa de postsolve
+
+    Tras ejecutar(), filas_conservadas y columnas_conservadas son los índices originales de
+    las filas y columnas del modelo reducido; desplazamiento[j] es el valor que se suma a la
+    variable original j (su valor fijo si la columna se eliminó) y constante lo que esas
+    sustituciones aportan a c·x. estado es 'infactible' o 'no_acotado' si el presolve ya
+    decide el problema, 'resuelto' si no queda nada por resolver y None en otro caso.
+    """
+
+    MAX_PASADAS = 20
+
+    def __init__(self, c, filas, columnas, valores, b, tipos, tipo):
+        self.c = np.asarray(c, dtype=float)
+        self.b = np.array(b, dtype=float)
+        self.tipos = np.array(tipos, dtype=object)
+        self.m, self.n = len(self.b), len(self.c)
+        # Costo en sentido de minimización
+        self.costo = self.c if tipo == "min" else -self.c
+
+        no_nulos = np.asarray(valores, dtype=float) != 0
+        self.filas = np.asarray(filas, dtype=np.int64)[no_nulos]
+        self.columnas = np.asarray(columnas, dtype=np.int64)[no_nulos]
+        self.valores = np.asarray(valores, dtype=float)[no_nulos]
+        # Entradas de cada columna (orden CSC) para sustituir una variable en b
+        self.orden_columnas = np.argsort(self.columnas, kind="stable")
+        self.inicio_columnas = np.searchsorted(self.columnas[self.orden_columnas], np.arange(self.n + 1))
+
+        self.fila_activa = np.ones(self.m, dtype=bool)
+        self.columna_activa = np.ones(self.n, dtype=bool)
+        self.desplazamiento = np.zeros(self.n)
+        self.constante = 0.0
+        self.estado = None
+        self.pasadas = 0
+        self.reducciones = dict.fromkeys(REDUCCIONES, 0)
+
+    def ejecutar(self):
+        """Aplicar las reducciones hasta que una pasada completa no cambie nada"""
+        pasos = (self.filas_vacias, self.filas_por_signo, self.filas_singleton,
+                 self.filas_duplicadas, self.columnas_dominadas)
+        while self.pasadas < self.MAX_PASADAS:
+            self.pasadas += 1
+            antes = sum(self.reducciones.values())
+            for paso in pasos:
+                paso()
+                if self.estado is not None:
+                    return self
+            if sum(self.reducciones.values()) == antes:
+                break
+
+        if not self.fila_activa.any():
+            # Sin filas, las columnas que quedan tienen costo negativo (las demás son dominadas)
+            self.estado = 'no_acotado' if self.columna_activa.any() else 'resuelto'
+        return self
+
+    @property
+    def filas_conservadas(self):
+        return np.flatnonzero(self.fila_activa)
+
+    @property
+    def columnas_conservadas(self):
+        return np.flatnonzero(self.columna_activa)
+
+    def entradas_activas(self):
+        """Máscara de las entradas de A en filas y columnas que siguen en el modelo"""
+        return self.fila_activa[self.filas] & self.columna_activa[self.columnas]
+
+    def conteos(self):
+        """(entradas activas, entradas por fila, entradas positivas por fila)"""
+        activas = self.entradas_activas()
+        cuenta = np.bincount(self.filas[activas], minlength=self.m)
+        positivas = np.bincount(self.filas[activas & (self.valores > 0)], minlength=self.m)
+        return activas, cuenta, positivas
+
+    def desplazar(self, j, valor):
+        """Sustituir xj = valor + xj' (xj' >= 0) en b y en la constante del objetivo"""
+        entradas = self.orden_columnas[self.inicio_columnas[j]:self.inicio_columnas[j + 1]]
+        np.subtract.at(self.b, self.filas[entradas], self.valores[entradas] * valor)
+        self.constante += self.c[j] * valor
+        self.desplazamiento[j] += valor
+
+    def fijar(self, j, valor=0.0):
+        """Eliminar la columna j con xj = valor"""
+        if valor:
+            self.desplazar(j, valor)
+        self.columna_activa[j] = False
+        self.reducciones['variables_fijas'] += 1
+
+    def filas_vacias(self):
+        _, cuenta, _ = self.conteos()
+        vacias = self.fila_activa & (cuenta == 0)
+        if not vacias.any():
+            return
+        b, tipos = self.b[vacias], self.tipos[vacias]
+        violada = (((tipos == "<=") & (b < -TOLERANCIA)) | ((tipos == ">=") & (b > TOLERANCIA))
+                   | ((tipos == "=") & (np.abs(b) > TOLERANCIA)))
+        if violada.any():
+            self.estado = 'infactible'
+            return
+        self.fila_activa[vacias] = False
+        self.reducciones['filas_vacias'] += int(vacias.sum())
+
+    def filas_por_signo(self):
+        """Con x >= 0, una fila con todos los coeficientes del mismo signo acota A·x por un lado
+        en cero: puede ser redundante, infactible o forzar a cero todas sus variables"""
+        activas, cuenta, positivas = self.conteos()
+        con_entradas = self.fila_activa & (cuenta > 0)
+        solo_positivos = con_entradas & (positivas == cuenta)  # A·x >= 0
+        solo_negativos = con_entradas & (positivas == 0)  # A·x <= 0
+        b, tipos = self.b, self.tipos
+        menor, mayor, igual = tipos == "<=", tipos == ">=", tipos == "="
+
+        redundantes = ((menor & solo_negativos & (b >= -TOLERANCIA))
+                       | (mayor & solo_positivos & (b <= TOLERANCIA)))
+        infactibles = (((menor | igual) & solo_positivos & (b < -TOLERANCIA))
+                       | ((mayor | igual) & solo_negativos & (b > TOLERANCIA)))
+        if infactibles.any():
+            self.estado = 'infactible'
+            return
+        forzadas = ((menor | igual) & solo_positivos | (mayor | igual) & solo_negativos) & (np.abs(b) <= TOLERANCIA)
+
+        fijadas = np.zeros(self.n, dtype=bool)
+        fijadas[self.columnas[activas & forzadas[self.filas]]] = True
+        self.columna_activa[fijadas] = False
+        self.reducciones['variables_fijas'] += int(fijadas.sum())
+        self.fila_activa[redundantes | forzadas] = False
+        self.reducciones['filas_redundantes'] += int(redundantes.sum())
+        self.reducciones['filas_forzadas'] += int(forzadas.sum())
+
+    def filas_singleton(self):
+        activas, cuenta, _ = self.conteos()
+        entradas = np.flatnonzero(activas & (cuenta[self.filas] == 1))
+        for i, j, a in zip(self.filas[entradas], self.columnas[entradas], self.valores[entradas]):
+            if not self.columna_activa[j]:
+                continue  # La fila quedó vacía; se revisa en la siguiente pasada
+            valor = self.b[i] / a
+            tipo = self.tipos[i]
+            if tipo == "=":
+                if valor < -TOLERANCIA:
+                    self.estado = 'infactible'
+                    return
+                self.fijar(j, max(valor, 0.0))
+            elif (tipo == "<=") == (a > 0):
+                # Cota superior xj <= valor: solo desaparece si fija la variable en cero
+                if valor < -TOLERANCIA:
+                    self.estado = 'infactible'
+                    return
+                if valor > TOLERANCIA:
+                    continue
+                self.fijar(j)
+            elif valor > TOLERANCIA:
+                # Cota inferior positiva: xj = valor + xj'
+                self.desplazar(j, valor)
+            self.fila_activa[i] = False
+            self.reducciones['filas_singleton'] += 1
+
+    def filas_duplicadas(self):
+        """Combinar filas proporcionales: cada una acota la misma expresión u = A_i·x / a_i1
+        (a_i1 es su primer coeficiente) y el grupo se queda con la intersección de las cotas"""
+        orden = np.flatnonzero(self.entradas_activas())
+        if not orden.size:
+            return
+        orden = orden[np.lexsort((self.columnas[orden], self.filas[orden]))]
+        filas, columnas, valores = self.filas[orden], self.columnas[orden], self.valores[orden]
+        inicios = np.flatnonzero(np.r_[True, filas[1:] != filas[:-1]])
+        primeros = valores[inicios]
+        normalizados = np.round(valores / np.repeat(primeros, np.diff(np.r_[inicios, len(filas)])), 9) + 0.0
+
+        grupos = {}
+        for k, inicio in enumerate(inicios):
+            fin = inicios[k + 1] if k + 1 < len(inicios) else len(filas)
+            clave = columnas[inicio:fin].tobytes() + normalizados[inicio:fin].tobytes()
+            grupos.setdefault(clave, []).append((filas[inicio], primeros[k]))
+
+        for grupo in grupos.values():
+            if len(grupo) > 1:
+                self.combinar_filas(grupo)
+                if self.estado is not None:
+                    return
+
+    def combinar_filas(self, grupo):
+        """Reducir un grupo de filas proporcionales [(fila, escala)] a lo <= u <= hi"""
+        lo, hi = -np.inf, np.inf
+        for i, escala in grupo:
+            cota = self.b[i] / escala
+            tipo = self.tipos[i]
+            if escala < 0 and tipo != "=":
+                tipo = ">=" if tipo == "<=" else "<="
+            if tipo != "<=":
+                lo = max(lo, cota)
+            if tipo != ">=":
+                hi = min(hi, cota)
+        if lo > hi + TOLERANCIA * max(1.0, abs(hi)):
+            self.estado = 'infactible'
+            return
+
+        # Cada cota que queda se escribe en la escala de la fila que la conserva
+        if np.isfinite(hi) and hi - lo <= TOLERANCIA * max(1.0, abs(hi)):
+            cotas = [("=", lo)]
+        else:
+            cotas = [(tipo, cota) for tipo, cota in (("<=", hi), (">=", lo)) if np.isfinite(cota)]
+        for (i, escala), (tipo, cota) in zip(grupo, cotas):
+            if escala < 0 and tipo != "=":
+                tipo = ">=" if tipo == "<=" else "<="
+            self.tipos[i] = tipo
+            self.b[i] = cota * escala
+        for i, _ in grupo[len(cotas):]:
+            self.fila_activa[i] = False
+        self.reducciones['filas_duplicadas'] += len(grupo) - len(cotas)
+
+    def columnas_dominadas(self):
+        """xj = 0 si su costo no es negativo y en ninguna fila un xj mayor ayuda a cumplirla"""
+        activas = self.entradas_activas()
+        # Tipo de cada entrada, comparando por fila (los tipos son objetos)
+        igual, menor, mayor = ((self.tipos == tipo)[self.filas] for tipo in ("=", "<=", ">="))
+        ayuda = activas & (igual | (menor & (self.valores < 0)) | (mayor & (self.valores > 0)))
+        dominadas = (self.columna_activa & (self.costo >= 0)
+                     & (np.bincount(self.columnas[ayuda], minlength=self.n) == 0))
+        self.columna_activa[dominadas] = False
+        self.reducciones['columnas_dominadas'] += int(dominadas.sum())
+
+    def modelo_reducido(self):
+        """(c, (filas, columnas, valores), b, tipos) del modelo reducido, renumerado"""
+        filas, columnas = self.filas_conservadas, self.columnas_conservadas
+        nueva_fila = np.full(self.m, -1)
+        nueva_fila[filas] = np.arange(len(filas))
+        nueva_columna = np.full(self.n, -1)
+        nueva_columna[columnas] = np.arange(len(columnas))
+        activas = self.entradas_activas()
+        tripletes = (nueva_fila[self.filas[activas]], nueva_columna[self.columnas[activas]],
+                     self.valores[activas])
+        return self.c[columnas], tripletes, self.b[filas] + 0.0, self.tipos[filas].tolist()
+
+    def postsolve(self, x_reducido):
+        """Valores de todas las variables originales a partir de los del modelo reducido"""
+        x = self.desplazamiento.copy()
+        x[self.columnas_conservadas] += x_reducido
+        return x
+
+    def resumen(self):
+        return {
+            'filas_originales': self.m,
+            'filas': int(self.fila_activa.sum()),
+            'columnas_originales': self.n,
+            'columnas': int(self.columna_activa.sum()),
+            'reducciones': {nombre: cuenta for nombre, cuenta in self.reducciones.items() if cuenta},
+            'pasadas': self.pasadas
+        }
@@ -0,0 +1,123 @@
+"""Punto interior primal-dual (predictor-corrector de Mehrotra) para min cᵀx con A·x = b, x >= 0
+
+Cada iteración factoriza con Cholesky las ecuaciones normales A·diag(x/s)·Aᵀ y las usa dos
+veces: el paso afín (predictor) estima cuánto bajaría μ = xᵀs/n yendo directo a la frontera,
+y el corrector apunta a σ·μ con σ = (μ_afín/μ)³ y compensa el término de segundo orden
+Δx_afín·Δs_afín. El número de iteraciones casi no depende del tamaño del modelo (decenas),
+a cambio de que cada una cueste O(m²·n).
+
+El punto de partida no necesita ser factible: los residuos primal y dual se reducen junto
+con la brecha. En un problema infactible o no acotado los iterados crecen sin límite o no
+convergen; el llamador decide entonces con el simplex.
+"""
+import numpy as np
+
+TOLERANCIA = 1e-8  # Residuos y brecha relativos para declarar el óptimo
+MAX_ITERACIONES = 100
+PISO_INICIAL = 1e-2  # Mínimo de cada componente del punto inicial, relativo a la mayor
+ETA = 0.99  # Fracción del paso hasta la frontera de x >= 0 y s >= 0
+DIVERGENCIA = 1e12  # |x| o |y| por encima de esto (relativo a b y c) se toma como infactible o no acotado
+ESTANCAMIENTO = 1e3  # Residuos por encima de ESTANCAMIENTO·TOLERANCIA con la brecha ya cerrada: no hay progreso
+
+
+def _factorizar(M):
+    """Inversa del factor de Cholesky de M; si las filas de A son dependientes (M singular) se
+    regulariza la diagonal hasta que la factorización funciona"""
+    diagonal = float(np.max(np.abs(np.diag(M)), initial=1.0))
+    regularizacion = 0.0
+    identidad = np.eye(len(M))
+    while True:
+        try:
+            L = np.linalg.cholesky(M + regularizacion * identidad)
+            return np.linalg.inv(L)
+        except np.linalg.LinAlgError:
+            if regularizacion > 1e-2 * diagonal:
+                raise
+            regularizacion = max(regularizacion * 100, 1e-14 * diagonal)
+
+
+def _resolver(L_inv, v):
+    """M⁻¹·v con M = L·Lᵀ"""
+    return L_inv.T @ (L_inv @ v)
+
+
+def _paso_maximo(v, dv):
+    """Mayor α con v + α·dv >= 0 (inf si dv no tiene componentes negativas)"""
+    negativos = dv < 0
+    if not negativos.any():
+        return np.inf
+    return float(np.min(-v[negativos] / dv[negativos]))
+
+
+def mehrotra(A, b, c, max_iteraciones=MAX_ITERACIONES, tolerancia=TOLERANCIA, detener=None):
+    """Resolver min cᵀx con A·x = b, x >= 0 (A densa m × n)
+
+    detener es un callable que se consulta antes de cada iteración; si devuelve True se
+    abandona. Devuelve (x, y, s, iteraciones, estado) con estado 'optimo', 'divergente' o
+    'estancado' (probablemente infactible o no acotado), 'limite' o 'detenido'.
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.asarray(b, dtype=float)
+    c = np.asarray(c, dtype=float)
+    m, n = A.shape
+    escala_b = 1.0 + np.linalg.norm(b)
+    escala_c = 1.0 + np.linalg.norm(c)
+
+    # Punto inicial de Mehrotra: mínimos cuadrados desplazados al interior
+    L_inv = _factorizar(A @ A.T)
+    x = A.T @ _resolver(L_inv, b)
+    y = _resolver(L_inv, A @ c)
+    s = c - A.T @ y
+    x += max(-1.5 * float(np.min(x, initial=0.0)), 0.0)
+    s += max(-1.5 * float(np.min(s, initial=0.0)), 0.0)
+    # Si x o s quedaron sobre la frontera (s = 0 cuando c está en la imagen de Aᵀ) se separan de ella
+    x = np.maximum(x, PISO_INICIAL * (1.0 + np.max(x, initial=0.0)))
+    s = np.maximum(s, PISO_INICIAL * (1.0 + np.max(s, initial=0.0)))
+    producto = x @ s
+    x += 0.5 * producto / s.sum()
+    s += 0.5 * producto / x.sum()
+
+    iteracion = 0
+    while True:
+        residuo_primal = b - A @ x
+        residuo_dual = c - A.T @ y - s
+        objetivo_primal, objetivo_dual = c @ x, b @ y
+        error_primal = np.linalg.norm(residuo_primal) / (tolerancia * escala_b)
+        error_dual = np.linalg.norm(residuo_dual) / (tolerancia * escala_c)
+        if (error_primal <= 1 and error_dual <= 1
+                and abs(objetivo_primal - objetivo_dual) <= tolerancia * (1.0 + abs(objetivo_primal))):
+            return x, y, s, iteracion, 'optimo'
+        # Con xᵀs casi cero los pasos ya no pueden reducir los residuos (típico de un problema infactible)
+        if x @ s <= tolerancia * (1.0 + abs(objetivo_primal)) and max(error_primal, error_dual) > ESTANCAMIENTO:
+            return x, y, s, iteracion, 'estancado'
+        if np.max(np.abs(x), initial=0.0) > DIVERGENCIA * escala_b or np.max(np.abs(y), initial=0.0) > DIVERGENCIA * escala_c:
+            return x, y, s, iteracion, 'divergente'
+        if iteracion >= max_iteraciones:
+            return x, y, s, iteracion, 'limite'
+        if detener is not None and detener():
+            return x, y, s, iteracion, 'detenido'
+        iteracion += 1
+
+        mu = x @ s / n
+        d = x / s
+        L_inv = _factorizar((A * d) @ A.T)
+
+        def direccion(complementariedad):
+            # S·Δx + X·Δs = complementariedad, A·Δx = rp, Aᵀ·Δy + Δs = rd
+            dy = _resolver(L_inv, residuo_primal - A @ ((complementariedad - x * residuo_dual) / s))
+            ds = residuo_dual - A.T @ dy
+            dx = (complementariedad - x * ds) / s
+            return dx, dy, ds
+
+        # Predictor (afín)
+        dx_afin, _, ds_afin = direccion(-x * s)
+        alfa_p, alfa_d = min(1.0, _paso_maximo(x, dx_afin)), min(1.0, _paso_maximo(s, ds_afin))
+        mu_afin = (x + alfa_p * dx_afin) @ (s + alfa_d * ds_afin) / n
+        sigma = (mu_afin / mu) ** 3
+
+        # Corrector
+        dx, dy, ds = direccion(-x * s - dx_afin * ds_afin + sigma * mu)
+        alfa_p, alfa_d = min(1.0, ETA * _paso_maximo(x, dx)), min(1.0, ETA * _paso_maximo(s, ds))
+        x = x + alfa_p * dx
+        y = y + alfa_d * dy
+        s = s + alfa_d * ds
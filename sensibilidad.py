@@ -0,0 +1,62 @@
+"""Análisis de sensibilidad a partir de la base óptima
+
+Con la base B final, y = B⁻ᵀ·c_B son los precios sombra, d = c - Aᵀ·y los costos reducidos
+y las filas de B⁻¹·A y las columnas de B⁻¹ dan, con un cociente mínimo cada una, cuánto
+puede cambiar un costo o un término independiente sin que cambie la base:
+
+- costo de una variable no básica j: hasta que su costo reducido llegue a 0 (el otro
+  sentido no tiene límite)
+- costo de la básica de la fila r: cambiarlo en δ cambia cada dk en -δ·αrk; el límite es
+  el primer dk no básico que cambia de signo
+- término independiente i: cambiarlo en Δ cambia xB en Δ·B⁻¹·ei; el límite es la primera
+  básica que se hace negativa (las artificiales básicas deben quedarse en cero)
+
+Todo se calcula en el sentido MAX; en MIN se intercambian aumento y disminución.
+"""
+import numpy as np
+
+TOLERANCIA = 1e-10
+
+
+def _minimo_cociente(numeradores, denominadores, mascara):
+    """Mínimo por filas de numeradores/denominadores donde mascara (inf si no hay ninguno)"""
+    cocientes = np.full(denominadores.shape, np.inf)
+    np.divide(np.broadcast_to(numeradores, denominadores.shape), denominadores, out=cocientes, where=mascara)
+    # Un costo reducido o un valor básico apenas fuera de signo por redondeo da 0, no un negativo
+    return np.maximum(cocientes.min(axis=-1, initial=np.inf), 0.0)
+
+
+def rangos_costos(costos_reducidos, filas_basicas, candidatas, tipo):
+    """Aumento y disminución permitidos del costo de cada variable
+
+    costos_reducidos tiene una entrada por columna (0 en las básicas), filas_basicas son las
+    filas de B⁻¹·A de las básicas a analizar y candidatas marca las columnas no básicas que
+    pueden entrar a la base. Devuelve ((aumento, disminución) de las básicas, (aumento,
+    disminución) de todas las columnas como no básicas).
+    """
+    signo = 1.0 if tipo == "max" else -1.0
+    d = signo * np.asarray(costos_reducidos, dtype=float)
+    candidatas = np.asarray(candidatas, dtype=bool)
+
+    aumento_basicas = _minimo_cociente(d, filas_basicas, (filas_basicas < -TOLERANCIA) & candidatas)
+    disminucion_basicas = _minimo_cociente(-d, filas_basicas, (filas_basicas > TOLERANCIA) & candidatas)
+    aumento_no_basicas = np.maximum(-d, 0.0)
+    disminucion_no_basicas = np.full(len(d), np.inf)
+
+    if signo < 0:
+        return (disminucion_basicas, aumento_basicas), (disminucion_no_basicas, aumento_no_basicas)
+    return (aumento_basicas, disminucion_basicas), (aumento_no_basicas, disminucion_no_basicas)
+
+
+def rangos_rhs(valores_basicos, inversa, artificiales):
+    """Aumento y disminución permitidos del término independiente de cada fila
+
+    inversa es B⁻¹ y artificiales marca las filas cuya básica es artificial.
+    """
+    x = np.maximum(np.asarray(valores_basicos, dtype=float), 0.0)
+    columnas = np.asarray(inversa, dtype=float).T  # Fila i: B⁻¹·ei
+    fijas = np.asarray(artificiales, dtype=bool) & (np.abs(columnas) > TOLERANCIA)
+
+    aumento = _minimo_cociente(x, -columnas, (columnas < -TOLERANCIA) | fijas)
+    disminucion = _minimo_cociente(x, columnas, (columnas > TOLERANCIA) | fijas)
+    return aumento, disminucion
@@ -0,0 +1,4030 @@
+"""Núcleo del método Simplex, sin Flask
+
+Contiene el SimplexSolver y el flujo de /resolver (configuración, caché y lotes) para usarlo
+desde scripts y trabajos por lotes sin pagar el arranque de la aplicación web. Las
+dependencias que solo hacen falta en algunos caminos (pool de procesos, lectura de MPS/LP,
+argparse) se importan al usarlas.
+
+Uso:
+    python simplex.py problemas.ndjson > soluciones.ndjson
+    cat problemas.ndjson | python simplex.py --procesos 4
+    python simplex.py modelo.mps problema.json --opciones '{"metodo": "revisado"}'
+"""
+import time
+
+_INICIO_IMPORTACION = time.perf_counter()
+
+from collections import OrderedDict, deque
+import base64
+import contextlib
+import functools
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+
+import numpy as np
+
+# Los mensajes usan argumentos con % para que, con el nivel desactivado, no se formatee nada
+registro = logging.getLogger("simplex")
+
+_TIPOS_NATIVOS = (int, float, str, bool, type(None))
+
+
+def _pivotear(tableau, fila_pivote, col_pivote):
+    """Pivotear el tableau en (fila_pivote, col_pivote) como una actualización de rango 1"""
+    pivote = tableau[fila_pivote, col_pivote]
+    if abs(pivote) < 1e-10:
+        raise ValueError("Elemento pivote es cero")
+    
+    tableau[fila_pivote] /= pivote
+    
+    # Solo se actualizan las filas con factor distinto de cero
+    factores = tableau[:, col_pivote].copy()
+    factores[fila_pivote] = 0.0
+    filas = np.flatnonzero(factores)
+    if filas.size:
+        tableau[filas] -= np.outer(factores[filas], tableau[fila_pivote])
+
+class MatrizDispersa:
+    """Matriz dispersa en formato CSC (columnas comprimidas)"""
+    
+    def __init__(self, datos, indices, indptr, forma):
+        self.datos = np.asarray(datos, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)  # Fila de cada elemento
+        self.indptr = np.asarray(indptr, dtype=np.int64)    # Inicio de cada columna
+        self.forma = (int(forma[0]), int(forma[1]))
+        # Columna de cada elemento, para productos vectorizados con bincount
+        self.columnas_nnz = np.repeat(np.arange(self.forma[1]), np.diff(self.indptr))
+    
+    @classmethod
+    def desde_tripletes(cls, filas, columnas, valores, forma):
+        """Construir la matriz a partir de tripletes (fila, columna, valor)"""
+        filas = np.asarray(filas, dtype=np.int64)
+        columnas = np.asarray(columnas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=float)
+        
+        no_nulos = valores != 0
+        filas, columnas, valores = filas[no_nulos], columnas[no_nulos], valores[no_nulos]
+        
+        orden = np.lexsort((filas, columnas))
+        indptr = np.zeros(forma[1] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(columnas, minlength=forma[1]), out=indptr[1:])
+        return cls(valores[orden], filas[orden], indptr, forma)
+    
+    @classmethod
+    def desde_densa(cls, matriz):
+        matriz = np.asarray(matriz, dtype=float)
+        filas, columnas = np.nonzero(matriz)
+        return cls.desde_tripletes(filas, columnas, matriz[filas, columnas], matriz.shape)
+    
+    def __len__(self):
+        return self.forma[0]
+    
+    @property
+    def nnz(self):
+        return len(self.datos)
+    
+    def tripletes(self):
+        return self.indices, self.columnas_nnz, self.datos
+    
+    def a_densa(self):
+        matriz = np.zeros(self.forma)
+        matriz[self.indices, self.columnas_nnz] = self.datos
+        return matriz
+    
+    def columnas_densas(self, columnas):
+        """Submatriz densa (m × k) con las columnas indicadas"""
+        resultado = np.zeros((self.forma[0], len(columnas)))
+        for k, j in enumerate(columnas):
+            inicio, fin = self.indptr[j], self.indptr[j + 1]
+            resultado[self.indices[inicio:fin], k] = self.datos[inicio:fin]
+        return resultado
+    
+    def columna(self, j):
+        return self.columnas_densas([j])[:, 0]
+    
+    def producto(self, x):
+        """A·x"""
+        return np.bincount(self.indices, weights=self.datos * np.asarray(x)[self.columnas_nnz],
+                           minlength=self.forma[0])
+    
+    def producto_transpuesto(self, y):
+        """Aᵀ·y"""
+        return np.bincount(self.columnas_nnz, weights=self.datos * np.asarray(y)[self.indices],
+                           minlength=self.forma[1])
+    
+    def producto_izquierdo(self, Y):
+        """Y·A para Y densa (k × m)"""
+        Y = np.asarray(Y, dtype=float)
+        resultado = np.zeros((Y.shape[0], self.forma[1]))
+        no_vacias = np.diff(self.indptr) > 0
+        if self.nnz:
+            # Suma por columna de las contribuciones Y[:, fila]·valor de cada elemento
+            resultado[:, no_vacias] = np.add.reduceat(Y[:, self.indices] * self.datos,
+                                                      self.indptr[:-1][no_vacias], axis=1)
+        return resultado
+    
+    def transpuesta(self):
+        return MatrizDispersa.desde_tripletes(self.columnas_nnz, self.indices, self.datos,
+                                              (self.forma[1], self.forma[0]))
+    
+    def escalar_filas(self, factores):
+        """Multiplicar cada fila i por factores[i]"""
+        datos = self.datos * np.asarray(factores, dtype=float)[self.indices]
+        return MatrizDispersa(datos, self.indices, self.indptr, self.forma)
+    
+    def suma_cuadrados_columnas(self):
+        """||a_j||² de cada columna"""
+        return np.bincount(self.columnas_nnz, weights=self.datos ** 2, minlength=self.forma[1])
+    
+    def primeras_columnas(self, n):
+        """Submatriz con las primeras n columnas"""
+        fin = self.indptr[n]
+        return MatrizDispersa(self.datos[:fin], self.indices[:fin], self.indptr[:n + 1], (self.forma[0], n))
+    
+    def seleccionar_filas(self, origen, signos):
+        """Nueva matriz cuya fila k es signos[k] · fila origen[k] (admite filas repetidas)"""
+        origen = np.asarray(origen, dtype=np.int64)
+        signos = np.asarray(signos, dtype=float)
+        
+        # Cada elemento se copia una vez por cada fila nueva que lo usa
+        cuenta = np.bincount(origen, minlength=self.forma[0])
+        inicio = np.cumsum(cuenta) - cuenta
+        filas_ordenadas = np.argsort(origen, kind='stable')
+        
+        repeticiones = cuenta[self.indices]
+        elementos = np.repeat(np.arange(self.nnz), repeticiones)
+        posicion = np.arange(len(elementos)) - np.repeat(np.cumsum(repeticiones) - repeticiones, repeticiones)
+        filas_nuevas = filas_ordenadas[inicio[self.indices[elementos]] + posicion]
+        
+        return MatrizDispersa.desde_tripletes(filas_nuevas, self.columnas_nnz[elementos],
+                                              self.datos[elementos] * signos[filas_nuevas],
+                                              (len(origen), self.forma[1]))
+
+
+def _matriz_densa(A):
+    """Obtener A como arreglo denso de NumPy, sea dispersa o lista de listas"""
+    if isinstance(A, MatrizDispersa):
+        return A.a_densa()
+    return np.asarray(A, dtype=float)
+
+
+class FactorizacionLU:
+    """Factorización LU de la base con actualizaciones en forma producto (eta)"""
+    
+    def __init__(self, base, frecuencia_refactorizacion=50):
+        self.frecuencia_refactorizacion = frecuencia_refactorizacion
+        self.refactorizar(base)
+    
+    def refactorizar(self, base):
+        """Calcular P·B = L·U con pivoteo parcial y vaciar el archivo eta"""
+        U = np.array(base, dtype=float)
+        m = U.shape[0]
+        L = np.eye(m)
+        perm = np.arange(m)
+        
+        for k in range(m):
+            p = k + int(np.argmax(np.abs(U[k:, k])))
+            if abs(U[p, k]) < 1e-12:
+                raise ValueError("La matriz base es singular")
+            if p != k:
+                U[[k, p]] = U[[p, k]]
+                L[[k, p], :k] = L[[p, k], :k]
+                perm[[k, p]] = perm[[p, k]]
+            factores = U[k + 1:, k] / U[k, k]
+            L[k + 1:, k] = factores
+            # Como en _pivotear, solo se actualizan las filas con factor distinto de cero (y
+            # solo en las columnas no nulas de la fila pivote): una base de holguras no cuesta nada
+            filas = np.flatnonzero(factores)
+            if filas.size:
+                columnas = k + np.flatnonzero(U[k, k:])
+                if 4 * filas.size >= len(factores) and 4 * columnas.size >= m - k:
+                    U[k + 1:, k:] -= np.outer(factores, U[k, k:])  # Ya casi densa: sin indexado
+                else:
+                    U[np.ix_(k + 1 + filas, columnas)] -= np.outer(factores[filas], U[k, columnas])
+        
+        self.L = L
+        self.U = U
+        self.perm = perm
+        self.etas = []
+    
+    def necesita_refactorizar(self):
+        return len(self.etas) >= self.frecuencia_refactorizacion
+    
+    def actualizar(self, fila, columna):
+        """Registrar el cambio de base en la posición fila (columna = B⁻¹·a_entrante)"""
+        self.etas.append((fila, np.array(columna, dtype=float)))
+    
+    def resolver(self, v):
+        """FTRAN: resolver B·x = v"""
+        x = np.array(v, dtype=float)[self.perm]
+        m = len(x)
+        
+        # L·y = P·v (por columnas, saltando componentes nulas)
+        for i in range(m - 1):
+            if x[i] != 0.0:
+                x[i + 1:] -= self.L[i + 1:, i] * x[i]
+        # U·x = y
+        for i in range(m - 1, -1, -1):
+            x[i] /= self.U[i, i]
+            if x[i] != 0.0:
+                x[:i] -= self.U[:i, i] * x[i]
+        
+        # Aplicar las matrices eta en orden
+        for fila, alpha in self.etas:
+            x_r = x[fila] / alpha[fila]
+            if x_r != 0.0:
+                x -= alpha * x_r
+            x[fila] = x_r
+        return x
+    
+    def resolver_transpuesta(self, v):
+        """BTRAN: resolver Bᵀ·y = v"""
+        y = np.array(v, dtype=float)
+        
+        # Aplicar las matrices eta transpuestas en orden inverso
+        for fila, alpha in reversed(self.etas):
+            y[fila] = (y[fila] - (alpha @ y - alpha[fila] * y[fila])) / alpha[fila]
+        
+        m = len(y)
+        # Uᵀ·z = y
+        for i in range(m):
+            y[i] /= self.U[i, i]
+            if y[i] != 0.0:
+                y[i + 1:] -= self.U[i, i + 1:] * y[i]
+        # Lᵀ·w = z
+        for i in range(m - 1, 0, -1):
+            if y[i] != 0.0:
+                y[:i] -= self.L[i, :i] * y[i]
+        
+        resultado = np.empty(m)
+        resultado[self.perm] = y
+        return resultado
+
+
+def _elegir_ponderado(costos, pesos):
+    """Columna con mayor (Cj - Zj)² / peso entre las que mejoran Z (-1 si ninguna)"""
+    mejora = np.where(costos > 1e-10, costos ** 2 / pesos, -1.0)
+    col_pivote = int(np.argmax(mejora))
+    return col_pivote if costos[col_pivote] > 1e-10 else -1
+
+
+class ReglaPrecio:
+    """Regla de selección de la columna entrante (pricing)
+    
+    elegir() recibe los Cj - Zj orientados a MAX (positivo = mejora Z) y devuelve la
+    columna entrante o -1 si ninguna mejora. Las reglas con pesos (usa_fila_pivote)
+    reciben en actualizar() los datos del pivote antes de realizarlo.
+    """
+    usa_fila_pivote = False
+    
+    def reiniciar(self, num_variables, normas):
+        """Empezar una secuencia de pivotes; normas() devuelve 1 + ||B⁻¹·a_j||² de cada columna"""
+    
+    def elegir(self, costos):
+        raise NotImplementedError
+    
+    def actualizar(self, fila_pivote, col_pivote, col_saliente, alpha, fila, productos):
+        """alpha = B⁻¹·a_q, fila = fila del pivote en B⁻¹·A y productos(v) = (B⁻¹·A)ᵀ·v"""
+
+
+class PrecioDantzig(ReglaPrecio):
+    """Mayor Cj - Zj (regla clásica)"""
+    
+    def elegir(self, costos):
+        # argmax devuelve el primer índice en caso de empate
+        col_pivote = int(np.argmax(costos))
+        return col_pivote if costos[col_pivote] > 1e-10 else -1
+
+
+class PrecioSteepestEdge(ReglaPrecio):
+    """Mayor mejora por unidad de longitud de la arista: (Cj - Zj)² / γj con γj = 1 + ||B⁻¹·a_j||²
+    
+    Los pesos se actualizan en cada pivote con las fórmulas exactas de Goldfarb y Reid.
+    """
+    usa_fila_pivote = True
+    
+    def reiniciar(self, num_variables, normas):
+        self.pesos = np.asarray(normas(), dtype=float)
+    
+    def elegir(self, costos):
+        return _elegir_ponderado(costos, self.pesos)
+    
+    def actualizar(self, fila_pivote, col_pivote, col_saliente, alpha, fila, productos):
+        alpha_rq = alpha[fila_pivote]
+        beta = fila / alpha_rq
+        gamma_q = self.pesos[col_pivote]
+        
+        # γj' = γj - 2·βj·(α_j·α_q) + βj²·γq, acotado por debajo por 1 + βj²
+        self.pesos = np.maximum(self.pesos - 2.0 * beta * productos(alpha) + beta ** 2 * gamma_q,
+                                1.0 + beta ** 2)
+        self.pesos[col_saliente] = max(gamma_q / alpha_rq ** 2, 1.0)
+        self.pesos[col_pivote] = 1.0
+
+
+class PrecioDevex(ReglaPrecio):
+    """Aproximación de steepest edge con pesos de referencia (Forrest y Goldfarb)
+    
+    Solo necesita la fila del pivote; los pesos se reinician cuando crecen demasiado.
+    """
+    usa_fila_pivote = True
+    LIMITE_PESOS = 1e6
+    
+    def reiniciar(self, num_variables, normas):
+        self.pesos = np.ones(num_variables)
+    
+    def elegir(self, costos):
+        return _elegir_ponderado(costos, self.pesos)
+    
+    def actualizar(self, fila_pivote, col_pivote, col_saliente, alpha, fila, productos):
+        alpha_rq = alpha[fila_pivote]
+        peso_q = self.pesos[col_pivote]
+        
+        self.pesos = np.maximum(self.pesos, (fila / alpha_rq) ** 2 * peso_q)
+        self.pesos[col_saliente] = max(peso_q / alpha_rq ** 2, 1.0)
+        self.pesos[col_pivote] = 1.0
+        if self.pesos.max() > self.LIMITE_PESOS:
+            self.pesos[:] = 1.0  # Nuevo marco de referencia
+    
+
+class PrecioParcial(ReglaPrecio):
+    """Revisar un segmento de columnas por iteración y pasar al siguiente solo cuando
+    ninguna columna del segmento mejora Z"""
+    
+    def __init__(self, tamano_segmento=None):
+        self.tamano_segmento = tamano_segmento
+    
+    def reiniciar(self, num_variables, normas):
+        # Por defecto unos √n segmentos de √n columnas
+        self.tamano = self.tamano_segmento or max(10, int(np.ceil(np.sqrt(num_variables))))
+        self.inicio = 0
+    
+    def elegir(self, costos):
+        num_variables = len(costos)
+        for _ in range(-(-num_variables // self.tamano)):
+            segmento = costos[self.inicio:self.inicio + self.tamano]
+            col_pivote = int(np.argmax(segmento))
+            if segmento[col_pivote] > 1e-10:
+                return self.inicio + col_pivote
+            self.inicio = self.inicio + self.tamano if self.inicio + self.tamano < num_variables else 0
+        return -1
+
+
+class PrecioBland(ReglaPrecio):
+    """Primera columna que mejora Z (regla de Bland, junto con el desempate por menor índice)"""
+    
+    def elegir(self, costos):
+        candidatas = np.flatnonzero(costos > 1e-10)
+        return int(candidatas[0]) if candidatas.size else -1
+
+
+REGLAS_PRECIO = {
+    "dantzig": PrecioDantzig,
+    "steepest_edge": PrecioSteepestEdge,
+    "devex": PrecioDevex,
+    "parcial": PrecioParcial,
+    "bland": PrecioBland,
+}
+
+# Desempate de la prueba del cociente que usa cada estrategia anticiclado
+ANTICICLADO = {
+    "ninguno": "primero",
+    "bland": "bland",
+    "lexicografico": "lexicografico",
+    "perturbacion": "primero",
+}
+
+
+class Estadisticas:
+    """Tiempos por fase, contadores y traza opcional de una resolución
+    
+    Los tiempos son exclusivos: lo que tarda una fase anidada (la serialización dentro de la
+    resolución, por ejemplo) solo se cuenta en ella. traza es un callable que recibe un dict
+    por evento (cada fase y cada pivote); con None no se construye ningún evento.
+    """
+    FASES = ("parseo", "dualidad", "presolve", "escalado", "estandarizacion", "resolucion", "serializacion",
+             "sensibilidad", "parametrico")
+    
+    def __init__(self, traza=None):
+        self.tiempos = {}  # Fase -> segundos
+        self.contadores = {}
+        self.traza = traza
+        self.anidadas = []  # Por cada fase abierta, segundos gastados en sus fases anidadas
+    
+    @contextlib.contextmanager
+    def fase(self, nombre):
+        inicio = time.perf_counter()
+        self.anidadas.append(0.0)
+        try:
+            yield
+        finally:
+            duracion = time.perf_counter() - inicio
+            self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + duracion - self.anidadas.pop()
+            if self.anidadas:
+                self.anidadas[-1] += duracion
+            if self.traza is not None:
+                self.traza({'evento': 'fase', 'fase': nombre, 'ms': round(duracion * 1000, 3)})
+    
+    def agregar(self, nombre, segundos):
+        """Sumar a una fase un tiempo medido fuera de ella (la parte de un kernel compartido)"""
+        self.tiempos[nombre] = self.tiempos.get(nombre, 0.0) + segundos
+    
+    def contar(self, nombre, cantidad=1):
+        self.contadores[nombre] = self.contadores.get(nombre, 0) + cantidad
+    
+    def exportar(self):
+        return {
+            'tiempos_ms': {fase: round(segundos * 1000, 3) for fase, segundos in self.tiempos.items()},
+            'contadores': dict(self.contadores)
+        }
+
+
+def _fase(nombre):
+    """Decorador de métodos del SimplexSolver: medir la llamada como la fase nombre"""
+    def decorador(metodo):
+        @functools.wraps(metodo)
+        def medido(self, *args, **kwargs):
+            with self.estadisticas.fase(nombre):
+                return metodo(self, *args, **kwargs)
+        return medido
+    return decorador
+
+
+class HistorialTableau:
+    """Historial de iteraciones de una resolución según el modo pedido
+    
+    - completo: cada iteración con su tableau, Zj y Cj-Zj (comportamiento original)
+    - resumen: solo la última iteración
+    - ultimos: las k últimas iteraciones
+    - pivotes: solo la base y el pivote de cada iteración
+    
+    resumen y ultimos guardan copias NumPy y las convierten a listas al exportar. Fuera del
+    modo completo también se guardan el registro de pivotes y el tableau con que empieza cada
+    segmento (inicio, cambio de fase, perturbación retirada), con los que reproducir_iteracion
+    reconstruye cualquier iteración.
+    
+    El formato decide cómo viajan los tableaux:
+    - json: listas anidadas (comportamiento original)
+    - base64: cada matriz como float64 little-endian en base64 (ver codificar_matriz)
+    - delta: las iteraciones no llevan tableau, sino el índice de su segmento; el cliente lo
+      reconstruye con los segmentos y los pivotes de 'historial', que se envía en cualquier modo
+    - delta_base64: delta con los tableaux de los segmentos en base64
+    """
+    MODOS = {
+        "completo": "completo", "full": "completo",
+        "resumen": "resumen", "summary": "resumen",
+        "pivotes": "pivotes", "pivots-only": "pivotes",
+        "ultimos": "ultimos", "last-k": "ultimos",
+    }
+    FORMATOS = ("json", "base64", "delta", "delta_base64")
+    
+    def __init__(self, modo="completo", ultimos_k=5, formato="json"):
+        if modo not in self.MODOS:
+            raise ValueError(f"Modo de historial no soportado: {modo}")
+        if formato not in self.FORMATOS:
+            raise ValueError(f"Formato de historial no soportado: {formato}")
+        self.modo = self.MODOS[modo]
+        self.formato = formato
+        self.delta = formato.startswith("delta")
+        self.base64 = formato.endswith("base64")
+        self.reproducible = self.modo != "completo" or self.delta
+        if self.modo == "resumen":
+            self.entradas = deque(maxlen=1)
+        elif self.modo == "ultimos":
+            self.entradas = deque(maxlen=ultimos_k)
+        else:
+            self.entradas = []
+        self.pivotes = []  # (iteracion, fila_pivote, col_pivote)
+        self.segmentos = []
+    
+    def __len__(self):
+        return len(self.entradas)
+    
+    def conservadas(self):
+        """Cuántas de las últimas entradas se conservan (None si todas)"""
+        return getattr(self.entradas, "maxlen", None)
+    
+    def necesita_tableaux(self):
+        """Si las entradas intermedias guardan su tableau (y no solo la base y el pivote)"""
+        return not self.delta and self.modo in ("completo", "ultimos")
+    
+    def registrar_pivote(self, iteracion, fila_pivote, col_pivote):
+        """Anotar solo el pivote de una iteración cuya entrada no se conservaría"""
+        if self.reproducible:
+            self.pivotes.append((iteracion, fila_pivote, col_pivote))
+    
+    def registrar(self, solver, pivote, es_optimo=None):
+        """Registrar la iteración actual del solver"""
+        if es_optimo is None:
+            es_optimo = solver.es_optimo()
+        
+        if self.reproducible:
+            if 'col_pivote' in pivote:
+                self.pivotes.append((solver.iteracion, pivote['fila_pivote'], pivote['col_pivote']))
+            elif solver.tableau is not None:
+                self.segmentos.append({
+                    'indice_pivote': len(self.pivotes),
+                    'iteracion': solver.iteracion,
+                    'tableau': solver.tableau.copy(),
+                    'basic_vars': list(solver.basic_vars)
+                })
+        
+        if self.modo == "pivotes" or (self.delta and solver.tableau is not None):
+            entrada = {
+                'iteracion': solver.iteracion,
+                'basic_vars': list(solver.basic_vars),
+                'es_optimo': bool(es_optimo),
+                **solver.datos_fase(),
+                **pivote
+            }
+            if self.delta and self.segmentos:
+                # El cambio de fase repite el número de iteración; el segmento lo desambigua
+                entrada['segmento'] = len(self.segmentos) - 1
+            self.entradas.append(entrada)
+        elif self.modo == "completo":
+            self.entradas.append(solver.entrada_historial(
+                solver.iteracion, solver.tableau, solver.basic_vars, solver.c, es_optimo,
+                solver.datos_fase(), pivote, solver.x_basicas
+            ))
+        else:
+            # Copia cruda: la conversión a listas se hace solo para las que sobrevivan
+            self.entradas.append((
+                solver.iteracion,
+                None if solver.tableau is None else solver.tableau.copy(),
+                list(solver.basic_vars), solver.c, es_optimo, solver.datos_fase(), pivote,
+                None if solver.x_basicas is None else solver.x_basicas.copy()
+            ))
+    
+    def exportar(self, solver):
+        """Lista de iteraciones lista para JSON"""
+        return [entrada if isinstance(entrada, dict) else solver.entrada_historial(*entrada)
+                for entrada in self.entradas]
+    
+    def reproduccion(self):
+        """Segmentos y pivotes para reconstruir iteraciones (None en modo completo con formato
+        json o sin tableau)"""
+        if not self.segmentos:
+            return None
+        serializar = codificar_matriz if self.base64 else np.ndarray.tolist
+        return {
+            'modo': self.modo,
+            'segmentos': [{**segmento, 'tableau': serializar(segmento['tableau'])} for segmento in self.segmentos],
+            'pivotes': [list(pivote) for pivote in self.pivotes]
+        }
+    
+    def reproducir(self, iteracion, segmento=None):
+        return reproducir_iteracion({'segmentos': self.segmentos, 'pivotes': self.pivotes}, iteracion, segmento)
+
+
+def codificar_matriz(matriz):
+    """Matriz como float64 little-endian en base64, para no enviar listas anidadas en JSON"""
+    matriz = np.ascontiguousarray(matriz, dtype='<f8')
+    return {
+        'dtype': 'float64',
+        'forma': list(matriz.shape),
+        'datos': base64.b64encode(matriz.tobytes()).decode('ascii')
+    }
+
+
+def decodificar_matriz(matriz):
+    """Inversa de codificar_matriz; las listas anidadas se aceptan tal cual"""
+    if isinstance(matriz, dict):
+        return np.frombuffer(base64.b64decode(matriz['datos']), dtype='<f8').reshape(matriz['forma']).astype(float)
+    return np.array(matriz, dtype=float)
+
+
+def reproducir_iteracion(reproduccion, iteracion, segmento=None):
+    """Reconstruir (tableau, basic_vars) de una iteración a partir de los segmentos y el
+    registro de pivotes de un historial
+    
+    En las iteraciones que cierran un segmento (por ejemplo, el final de la fase I) se
+    devuelve el tableau con que empieza el segmento siguiente, salvo que se indique el
+    segmento (campo 'segmento' de las iteraciones en formato delta).
+    """
+    segmentos = reproduccion['segmentos']
+    if segmento is None:
+        indices = [k for k, datos in enumerate(segmentos) if datos['iteracion'] <= iteracion]
+    else:
+        indices = [segmento] if 0 <= segmento < len(segmentos) and segmentos[segmento]['iteracion'] <= iteracion else []
+    if not indices:
+        raise ValueError(f"La iteración {iteracion} no está en el historial")
+    
+    k = indices[-1]
+    fin = segmentos[k + 1]['indice_pivote'] if k + 1 < len(segmentos) else len(reproduccion['pivotes'])
+    tableau = decodificar_matriz(segmentos[k]['tableau'])
+    basic_vars = list(segmentos[k]['basic_vars'])
+    for iteracion_pivote, fila_pivote, col_pivote in reproduccion['pivotes'][segmentos[k]['indice_pivote']:fin]:
+        if iteracion_pivote > iteracion:
+            break
+        _pivotear(tableau, int(fila_pivote), int(col_pivote))
+        basic_vars[int(fila_pivote)] = int(col_pivote)
+    return tableau, basic_vars
+
+
+# Término lineal: signo, coeficiente (admite notación científica), '*' opcional y variable
+_NUMERO = r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+_NOMBRE = r"[^\W\d]\w*"
+_TERMINO = re.compile(rf"\s*([+-]?)\s*({_NUMERO})?\s*(\*)?\s*({_NOMBRE})?\s*")
+# Expresión bien formada completa, para validarla con una sola llamada antes de extraer los términos
+_TERMINO_VALIDO = rf"(?:{_NUMERO}\s*\*?\s*{_NOMBRE}|{_NUMERO}|{_NOMBRE})"
+_EXPRESION = re.compile(rf"\s*[+-]?\s*{_TERMINO_VALIDO}(?:\s*[+-]\s*{_TERMINO_VALIDO})*\s*")
+# Sobre una expresión ya validada basta un patrón más simple (y más rápido) para extraer los términos
+_TERMINO_VALIDADO = re.compile(rf"([+-]?)\s*([\d.]+(?:[eE][+-]?\d+)?)?\s*\*?\s*({_NOMBRE})?\s*")
+_VARIABLE_X = re.compile(r"[xX]([1-9]\d*)")
+_OPERADOR = re.compile(r"<=|>=|=")
+
+
+def _parsear_terminos(expresion):
+    """Recorrer los términos uno a uno sumando repetidas y constantes; los errores indican
+    el término o la posición que falla"""
+    terminos = {}
+    constante = 0.0
+    for k, termino in enumerate(_TERMINO.finditer(expresion)):
+        inicio = termino.start()
+        if termino.end() == inicio:
+            # Coincidencia vacía: fin del texto o un carácter que no forma ningún término
+            if inicio == len(expresion):
+                break
+            raise ValueError(f"Carácter inesperado '{expresion[inicio]}' en la posición {inicio + 1}")
+        
+        signo, numero, producto, nombre = termino.groups()
+        if (numero is None and nombre is None) or (producto and not (numero and nombre)):
+            raise ValueError(f"Término incompleto '{termino.group().strip()}'")
+        if k and not signo:
+            raise ValueError(f"Falta un operador + o - antes de '{termino.group().strip()}'")
+        
+        coef = float(numero) if numero else 1.0
+        if signo == '-':
+            coef = -coef
+        if nombre is None:
+            constante += coef
+            continue
+        if nombre[0] == 'X' and _VARIABLE_X.fullmatch(nombre):
+            nombre = nombre.lower()
+        terminos[nombre] = terminos.get(nombre, 0.0) + coef
+    
+    return terminos, constante
+
+
+# Sentidos de restricción aceptados en la entrada matricial además de <=, >= y =
+ALIAS_TIPOS_RESTRICCION = {"L": "<=", "G": ">=", "E": "=", "==": "="}
+
+
+def _vector_finito(valores, nombre):
+    """Vector 1-D de floats finitos, o ValueError indicando la primera posición que falla"""
+    try:
+        vector = np.asarray(valores, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError(f"{nombre} debe ser una lista de números")
+    if vector.ndim != 1:
+        raise ValueError(f"{nombre} debe ser una lista de números")
+    no_finitos = np.flatnonzero(~np.isfinite(vector))
+    if no_finitos.size:
+        raise ValueError(f"{nombre} contiene un valor no finito en la posición {no_finitos[0] + 1}")
+    return vector
+
+
+def _tripletes_validos(A, num_restricciones, num_variables):
+    """Validar A en tripletes {forma, filas, columnas, valores} y sumar los repetidos"""
+    try:
+        forma = tuple(int(dim) for dim in A.get('forma', (num_restricciones, num_variables)))
+        filas = np.asarray(A['filas'])
+        columnas = np.asarray(A['columnas'])
+        valores = np.asarray(A['valores'], dtype=float)
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("A en tripletes debe tener 'filas', 'columnas' y 'valores' numéricos")
+    if forma != (num_restricciones, num_variables):
+        raise ValueError(f"A debe tener forma {num_restricciones}x{num_variables} (filas de b x columnas de c)")
+    if not (filas.ndim == columnas.ndim == valores.ndim == 1 and len(filas) == len(columnas) == len(valores)):
+        raise ValueError("'filas', 'columnas' y 'valores' de A deben tener la misma longitud")
+    if filas.size and not (np.issubdtype(filas.dtype, np.integer) and np.issubdtype(columnas.dtype, np.integer)):
+        raise ValueError("'filas' y 'columnas' de A deben ser enteros")
+    
+    fuera = np.flatnonzero((filas < 0) | (filas >= num_restricciones) | (columnas < 0) | (columnas >= num_variables))
+    if fuera.size:
+        raise ValueError(f"El triplete {fuera[0] + 1} de A está fuera de la matriz: "
+                         f"({filas[fuera[0]]}, {columnas[fuera[0]]})")
+    no_finitos = np.flatnonzero(~np.isfinite(valores))
+    if no_finitos.size:
+        raise ValueError(f"El triplete {no_finitos[0] + 1} de A tiene un valor no finito")
+    
+    # Repetidos: se suman sobre el índice lineal de cada posición
+    lineales, inversos = np.unique(filas.astype(np.int64) * num_variables + columnas.astype(np.int64),
+                                   return_inverse=True)
+    sumas = np.bincount(inversos.ravel(), weights=valores, minlength=len(lineales))
+    return lineales // num_variables, lineales % num_variables, sumas
+
+
+# Estado de la respuesta para cada error del solver; el resto de errores son 'error'
+ESTADOS_ERROR = {
+    'Problema no acotado': 'no_acotado',
+    'Problema sin solución factible': 'infactible',
+}
+
+# Estados de una resolución detenida antes del óptimo (se devuelve la base alcanzada)
+MENSAJES_INTERRUPCION = {
+    'limite_iteraciones': 'Se alcanzó el máximo número de iteraciones',
+    'limite_tiempo': 'Se agotó el tiempo límite de resolución',
+    'cancelado': 'La resolución fue cancelada',
+}
+
+
+class SimplexSolver:
+    METODOS = ("tableau", "revisado", "punto_interior")
+    ALGORITMOS = ("primal", "dual")
+    ARTIFICIALES = ("big_m", "dos_fases")
+    
+    def __init__(self, metodo="tableau", disperso=False, algoritmo="primal", artificiales="big_m",
+                 regla_precio="dantzig", anticiclado="ninguno", modo_historial="completo", ultimos_k=5,
+                 formato_historial="json", traza=None, cancelacion=None):
+        if metodo not in self.METODOS:
+            raise ValueError(f"Método no soportado: {metodo}")
+        if algoritmo not in self.ALGORITMOS:
+            raise ValueError(f"Algoritmo no soportado: {algoritmo}")
+        if artificiales not in self.ARTIFICIALES:
+            raise ValueError(f"Manejo de artificiales no soportado: {artificiales}")
+        if regla_precio not in REGLAS_PRECIO:
+            raise ValueError(f"Regla de precio no soportada: {regla_precio}")
+        if anticiclado not in ANTICICLADO:
+            raise ValueError(f"Estrategia anticiclado no soportada: {anticiclado}")
+        if anticiclado == "bland":
+            regla_precio = "bland"  # Bland fija tanto la columna entrante como la saliente
+        if modo_historial not in HistorialTableau.MODOS:
+            raise ValueError(f"Modo de historial no soportado: {modo_historial}")
+        if isinstance(ultimos_k, bool) or not isinstance(ultimos_k, int) or ultimos_k < 1:
+            raise ValueError("ultimos_k debe ser un entero positivo")
+        if formato_historial not in HistorialTableau.FORMATOS:
+            raise ValueError(f"Formato de historial no soportado: {formato_historial}")
+        self.metodo = metodo  # "tableau", "revisado" o "punto_interior"
+        self.algoritmo = algoritmo  # "primal" o "dual" (sin artificiales para las restricciones >=)
+        self.artificiales = artificiales  # "big_m" o "dos_fases"
+        self.regla_precio = regla_precio  # Nombre de la regla en REGLAS_PRECIO
+        self.precio = REGLAS_PRECIO[regla_precio]()
+        self.anticiclado = anticiclado  # "ninguno", "bland", "lexicografico" o "perturbacion"
+        self.desempate = ANTICICLADO[anticiclado]  # Regla para empates en el cociente mínimo
+        self.modo_historial = modo_historial  # Qué iteraciones se guardan (ver HistorialTableau)
+        self.ultimos_k = ultimos_k
+        self.formato_historial = formato_historial  # Cómo viajan los tableaux en la respuesta
+        self.disperso = disperso  # Guardar A como MatrizDispersa en lugar de listas
+        self.c = []  # Coeficientes de la función objetivo
+        self.A = []  # Matriz de restricciones
+        self.b = []  # Vector de términos independientes
+        self.tipos_restricciones = []  # "<=", ">=", "="
+        self.tipo = ""  # "max" o "min"
+        self.variables_originales = 0
+        self.nombres_variables = None  # Nombres de las variables originales si no son x1, x2, ...
+        self.constante_objetivo = 0.0  # Término constante de la función objetivo, se suma a Z
+        self.tableau = None
+        self.basic_vars = []
+        self.iteracion = 0
+        self.variables_holgura = 0
+        self.variables_excedente = 0
+        self.variables_artificiales = 0
+        self.M = 1000  # Valor grande para variables artificiales
+        self.es_dual = False
+        self.presolve = None  # presolve.Presolve aplicado antes de estandarizar (mapa de postsolve)
+        self.escalado = None  # Método de escalado aplicado ("geometrico" o "equilibrio")
+        self.escala_filas = None  # Factores r de las filas (b' = r·b)
+        self.escala_columnas = None  # Factores s de las variables originales (x = s·x' / kb)
+        self.escala_objetivo = 1.0  # Factor kc de c (c' = kc·s·c)
+        self.escala_rhs = 1.0  # Factor kb de b (b' = kb·r·b)
+        self.escala_estandarizada = None  # Factor de cada columna estandarizada para desescalar su valor
+        self.filas_invertidas = None  # Máscara de las filas que estandarizar multiplicó por -1
+        self.sensibilidad = False  # Agregar el análisis de sensibilidad a la solución óptima
+        self.parametrico = None  # (parámetro, dirección, desde, hasta) del barrido paramétrico
+        self.crossover = True  # Con punto_interior, pasar del punto óptimo a una base con el simplex revisado
+        self.punto_interior = None  # Iteraciones y estado de la última resolución por punto interior
+        self.pasos_solucion = []
+        self.problema_original = {}
+        self.x_basicas = None  # Valores de las variables básicas en el método revisado
+        self.frecuencia_refactorizacion = 50  # Pivotes entre refactorizaciones LU
+        self.max_iteraciones = 100
+        self.limite_tiempo_ms = None  # Tiempo máximo de resolución; None sin límite
+        self.plazo = None  # time.perf_counter() en que se agota limite_tiempo_ms
+        self.cancelacion = cancelacion if cancelacion is not None else threading.Event()
+        self.interrupcion = None  # Clave de MENSAJES_INTERRUPCION si se detuvo antes del óptimo
+        self.base_inicial_aplicada = None  # None si no se pidió arranque en caliente
+        self.fase = None  # 1 o 2 durante el método de dos fases
+        self.restricciones_redundantes = []  # Filas eliminadas al terminar la fase I
+        self.inicio_resolucion = None  # time.perf_counter() al empezar resolver()
+        self.base_referencia = []  # Base al empezar a iterar (columnas de B⁻¹ para el desempate lexicográfico)
+        self.bases_degeneradas = set()  # Bases visitadas en la racha actual de pivotes degenerados
+        self.pivotes_degenerados = 0
+        self.ciclo_detectado = None  # Iteración en la que se detectó un ciclo
+        self.estadisticas = Estadisticas(traza)  # Tiempos por fase, contadores de pivotes y traza
+    
+    def convertir_numpy_a_python(self, obj):
+        """Convertir objetos NumPy a tipos nativos de Python para JSON"""
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        elif isinstance(obj, MatrizDispersa):
+            filas, columnas, valores = obj.tripletes()
+            return {
+                'forma': list(obj.forma),
+                'filas': filas.tolist(),
+                'columnas': columnas.tolist(),
+                'valores': valores.tolist()
+            }
+        elif isinstance(obj, np.integer):
+            return int(obj)
+        elif isinstance(obj, np.floating):
+            return float(obj)
+        elif isinstance(obj, dict):
+            return {key: self.convertir_numpy_a_python(value) for key, value in obj.items()}
+        elif isinstance(obj, list):
+            # Los escalares nativos se copian sin una llamada recursiva por elemento
+            return [item if type(item) in _TIPOS_NATIVOS else self.convertir_numpy_a_python(item)
+                    for item in obj]
+        else:
+            return obj
+    
+    def parsear_expresion(self, expresion):
+        """Parsear una expresión lineal
+        
+        Devuelve ({variable: coeficiente}, constante): las variables repetidas se suman y los
+        términos sin variable se acumulan en la constante.
+        """
+        try:
+            if not _EXPRESION.fullmatch(expresion):
+                # Vacía o mal formada: el recorrido término a término localiza el error
+                return _parsear_terminos(expresion)
+            
+            # Expresión válida: todos los términos se extraen de una vez (el último es el vacío final)
+            encontrados = _TERMINO_VALIDADO.findall(expresion)[:-1]
+            nombres = [nombre for _, _, nombre in encontrados]
+            terminos = dict(zip(nombres, [float(signo + (numero or '1')) for signo, numero, _ in encontrados]))
+            if len(terminos) < len(nombres) or '' in terminos or 'X' in expresion:
+                # Variables repetidas, constantes o nombres X1 que hay que unificar con x1
+                return _parsear_terminos(expresion)
+            return terminos, 0.0
+        except Exception as e:
+            raise ValueError(f"Error al parsear expresión '{expresion}': {str(e)}")
+    
+    def parsear_restriccion(self, restriccion):
+        """Parsear una restricción completa
+        
+        Las variables y constantes pueden estar en ambos lados: se pasan las variables a la
+        izquierda y las constantes a la derecha. Si el término independiente queda negativo, la
+        restricción se multiplica por -1 (invirtiendo la desigualdad) para que sea no negativo.
+        """
+        try:
+            operadores = _OPERADOR.findall(restriccion)
+            if not operadores:
+                raise ValueError("No se encontró un operador válido (<=, >=, =)")
+            if len(operadores) != 1:
+                raise ValueError("Formato de restricción inválido")
+            
+            operador = operadores[0]
+            lado_izq, lado_der = _OPERADOR.split(restriccion)
+            terminos, constante_izq = self.parsear_expresion(lado_izq)
+            terminos_der, constante_der = self.parsear_expresion(lado_der)
+            
+            for nombre, coef in terminos_der.items():
+                terminos[nombre] = terminos.get(nombre, 0.0) - coef
+            if not terminos:
+                raise ValueError("No se encontraron variables en la restricción")
+            
+            valor_der = constante_der - constante_izq
+            if valor_der < 0:
+                terminos = {nombre: -coef for nombre, coef in terminos.items()}
+                valor_der = -valor_der
+                operador = {'<=': '>=', '>=': '<=', '=': '='}[operador]
+            
+            return terminos, operador, valor_der + 0.0
+        except Exception as e:
+            raise ValueError(f"Error al parsear restricción '{restriccion}': {str(e)}")
+    
+    def asignar_columnas(self, expresiones):
+        """Columna de cada variable de las expresiones parseadas
+        
+        Si todas se llaman x1, x2, ... la columna es su índice (x3 sola implica x1 y x2 con
+        coeficiente 0). Con cualquier otro nombre, las columnas siguen el orden de aparición y
+        los nombres se guardan en nombres_variables.
+        """
+        nombres = dict.fromkeys(nombre for terminos in expresiones for nombre in terminos)
+        indices = [_VARIABLE_X.fullmatch(nombre) for nombre in nombres]
+        if all(indices):
+            self.nombres_variables = None
+            return {nombre: int(indice.group(1)) - 1 for nombre, indice in zip(nombres, indices)}
+        
+        self.nombres_variables = list(nombres)
+        return {nombre: j for j, nombre in enumerate(nombres)}
+    
+    @_fase("parseo")
+    def configurar_problema(self, funcion_objetivo, tipo_optimizacion, restricciones):
+        """Configurar el problema desde la interfaz web"""
+        try:
+            registro.debug("=== CONFIGURANDO PROBLEMA ===")
+            registro.debug("Función objetivo: %s", funcion_objetivo)
+            registro.debug("Tipo: %s", tipo_optimizacion)
+            registro.debug("Restricciones: %s", restricciones)
+            
+            self.tipo = tipo_optimizacion
+            self.pasos_solucion = []
+            
+            # Parsear función objetivo
+            terminos_objetivo, self.constante_objetivo = self.parsear_expresion(funcion_objetivo)
+            if not terminos_objetivo:
+                raise ValueError("No se encontraron variables en la función objetivo")
+            
+            # Parsear restricciones
+            filas = [self.parsear_restriccion(restriccion) for restriccion in restricciones if restriccion.strip()]
+            self.tipos_restricciones = [operador for _, operador, _ in filas]
+            
+            columnas = self.asignar_columnas([terminos_objetivo] + [terminos for terminos, _, _ in filas])
+            self.variables_originales = max(columnas.values()) + 1
+            num_restricciones = len(filas)
+            
+            c = np.zeros(self.variables_originales)
+            c[[columnas[nombre] for nombre in terminos_objetivo]] = list(terminos_objetivo.values())
+            b = np.fromiter((valor for _, _, valor in filas), dtype=float, count=num_restricciones)
+            
+            forma = (num_restricciones, self.variables_originales)
+            if self.disperso:
+                # Tripletes (fila, columna, valor) de todas las restricciones, sin duplicados por fila
+                longitudes = [len(terminos) for terminos, _, _ in filas]
+                total = sum(longitudes)
+                indices_filas = np.repeat(np.arange(num_restricciones), longitudes)
+                indices_columnas = np.fromiter((columnas[nombre] for terminos, _, _ in filas for nombre in terminos),
+                                               dtype=np.int64, count=total)
+                valores = np.fromiter((coef for terminos, _, _ in filas for coef in terminos.values()),
+                                      dtype=float, count=total)
+                self.A = MatrizDispersa.desde_tripletes(indices_filas, indices_columnas, valores, forma)
+                A_original = self.convertir_numpy_a_python(self.A)
+            else:
+                # Filas reservadas de una vez con ceros; solo se escriben los términos presentes
+                self.A = [[0] * self.variables_originales for _ in range(num_restricciones)]
+                for fila, (terminos, _, _) in zip(self.A, filas):
+                    for nombre, coef in terminos.items():
+                        fila[columnas[nombre]] = coef
+                # Copia para el problema original y el primer paso
+                A_original = [fila.copy() for fila in self.A]
+            self.c = c.tolist()
+            self.b = b.tolist()
+            
+            self.guardar_problema_original(A_original)
+            registro.debug("=== FIN CONFIGURACIÓN ===")
+                
+        except Exception as e:
+            registro.error("Error en configurar_problema: %s", e)
+            raise ValueError(f"Error al configurar problema: {str(e)}")
+    
+    def guardar_problema_original(self, A_original):
+        """Guardar el problema recién configurado en problema_original y como primer paso"""
+        self.problema_original = {
+            'c': self.c.copy(),
+            'A': A_original,
+            'b': self.b.copy(),
+            'tipos': self.tipos_restricciones.copy(),
+            'tipo_opt': self.tipo
+        }
+        if self.nombres_variables:
+            self.problema_original['nombres_variables'] = list(self.nombres_variables)
+        if self.constante_objetivo:
+            self.problema_original['constante_objetivo'] = self.constante_objetivo
+        
+        self.pasos_solucion.append({
+            'tipo': 'original',
+            'titulo': 'Problema Original',
+            'c': self.c.copy(),
+            'A': self.A if self.disperso else A_original,
+            'b': self.b.copy(),
+            'tipos': self.tipos_restricciones.copy(),
+            'tipo_opt': self.tipo
+        })
+    
+    @_fase("parseo")
+    def configurar_problema_matricial(self, c, A, b, tipos, tipo_optimizacion,
+                                      nombres_variables=None, constante_objetivo=0.0):
+        """Configurar el problema directamente desde arreglos, sin pasar por texto
+        
+        A puede ser densa (lista de filas) o tripletes {forma, filas, columnas, valores}, el
+        mismo formato con que se devuelven las matrices dispersas; los tripletes repetidos se
+        suman. Las comprobaciones son vectorizadas y el primer fallo se informa con su posición.
+        Como en el parseo de texto, las filas con b negativo se multiplican por -1.
+        """
+        registro.debug("=== CONFIGURANDO PROBLEMA MATRICIAL ===")
+        if tipo_optimizacion not in ("max", "min"):
+            raise ValueError("tipo_optimizacion debe ser 'max' o 'min'")
+        
+        c = _vector_finito(c, "c")
+        b = _vector_finito(b, "b")
+        num_variables, num_restricciones = len(c), len(b)
+        if num_variables == 0:
+            raise ValueError("c debe tener al menos un coeficiente")
+        if num_restricciones == 0:
+            raise ValueError("Debe proporcionar al menos una restricción")
+        
+        if not isinstance(tipos, (list, tuple)):
+            raise ValueError("tipos debe ser una lista con el sentido de cada restricción")
+        tipos = np.asarray([ALIAS_TIPOS_RESTRICCION.get(tipo, tipo) if isinstance(tipo, str) else tipo
+                            for tipo in tipos], dtype=object)
+        if tipos.shape != (num_restricciones,):
+            raise ValueError(f"tipos debe tener {num_restricciones} elementos, uno por fila de b")
+        no_validos = np.flatnonzero(~np.isin(tipos, ("<=", ">=", "=")))
+        if no_validos.size:
+            raise ValueError(f"Tipo de restricción no válido en la fila {no_validos[0] + 1}: "
+                             f"{tipos[no_validos[0]]!r} (use <=, >= o =)")
+        
+        if isinstance(A, dict):
+            filas, columnas, valores = _tripletes_validos(A, num_restricciones, num_variables)
+        else:
+            try:
+                densa = np.asarray(A, dtype=float)
+            except (TypeError, ValueError):
+                raise ValueError("A debe ser una matriz numérica con filas de la misma longitud")
+            if densa.shape != (num_restricciones, num_variables):
+                raise ValueError(f"A debe tener forma {num_restricciones}x{num_variables} "
+                                 f"(filas de b x columnas de c) y tiene {'x'.join(map(str, densa.shape))}")
+            no_finitos = np.argwhere(~np.isfinite(densa))
+            if no_finitos.size:
+                raise ValueError(f"A contiene un valor no finito en la fila {no_finitos[0][0] + 1}, "
+                                 f"columna {no_finitos[0][1] + 1}")
+            filas, columnas = np.nonzero(densa)
+            valores = densa[filas, columnas]
+        
+        if nombres_variables is not None:
+            if (not isinstance(nombres_variables, list) or len(nombres_variables) != num_variables
+                    or not all(isinstance(nombre, str) and nombre for nombre in nombres_variables)
+                    or len(set(nombres_variables)) != num_variables):
+                raise ValueError(f"nombres_variables debe ser una lista de {num_variables} nombres distintos")
+        constante_objetivo = float(constante_objetivo)
+        if not np.isfinite(constante_objetivo):
+            raise ValueError("constante_objetivo debe ser finita")
+        
+        # b >= 0: las filas con b negativo cambian de signo y de sentido
+        negativas = b < 0
+        if negativas.any():
+            b = np.where(negativas, -b, b)
+            valores = np.where(negativas[filas], -valores, valores)
+            tipos = np.where(negativas & (tipos == "<="), ">=",
+                             np.where(negativas & (tipos == ">="), "<=", tipos))
+        
+        self.tipo = tipo_optimizacion
+        self.pasos_solucion = []
+        self.nombres_variables = nombres_variables
+        self.constante_objetivo = constante_objetivo
+        self.variables_originales = num_variables
+        self.c = (c + 0.0).tolist()
+        self.b = (b + 0.0).tolist()
+        self.tipos_restricciones = tipos.tolist()
+        
+        forma = (num_restricciones, num_variables)
+        if self.disperso:
+            self.A = MatrizDispersa.desde_tripletes(filas, columnas, valores, forma)
+            A_original = self.convertir_numpy_a_python(self.A)
+        else:
+            densa = np.zeros(forma)
+            densa[filas, columnas] = valores
+            self.A = densa.tolist()
+            A_original = densa.tolist()
+        
+        self.guardar_problema_original(A_original)
+        registro.debug("=== FIN CONFIGURACIÓN ===")
+    
+    @_fase("dualidad")
+    def aplicar_dualidad(self):
+        """Aplicar dualidad correctamente"""
+        try:
+            registro.debug("=== APLICANDO DUALIDAD ===")
+            
+            # Guardar el problema original
+            c_original = self.c.copy()
+            b_original = self.b.copy()
+            tipos_original = self.tipos_restricciones.copy()
+            tipo_original = self.tipo
+            
+            # PASO 1: Convertir a forma estándar para dualidad
+            registro.debug("Paso 1: Convertir problema %s a forma estándar", tipo_original.upper())
+            
+            # Para MAX todas las restricciones deben ser <=, para MIN deben ser >=
+            tipo_objetivo = "<=" if tipo_original == "max" else ">="
+            
+            # Cada restricción convertida es signo * (fila de origen)
+            origen = []
+            signos = []
+            for i, tipo in enumerate(tipos_original):
+                if tipo == "=":
+                    # Igualdad: crear dos restricciones
+                    origen.extend([i, i])
+                    signos.extend([1, -1])
+                elif tipo == tipo_objetivo:
+                    origen.append(i)
+                    signos.append(1)
+                else:
+                    # Invertir el sentido multiplicando por -1
+                    origen.append(i)
+                    signos.append(-1)
+            
+            b_convertida = [signo * b_original[i] for i, signo in zip(origen, signos)]
+            tipos_convertida = [tipo_objetivo] * len(origen)
+            
+            if self.disperso:
+                A_convertida = self.A.seleccionar_filas(origen, signos)
+            else:
+                A_convertida = [[signo * coef for coef in self.A[i]] for i, signo in zip(origen, signos)]
+            
+            # Guardar paso de conversión
+            self.pasos_solucion.append({
+                'tipo': 'dualidad_paso1',
+                'titulo': f'Paso 1: Conversión a forma estándar para dualidad',
+                'c': c_original,
+                'A': A_convertida,
+                'b': b_convertida,
+                'tipos': tipos_convertida,
+                'tipo_opt': tipo_original
+            })
+            
+            # PASO 2: Crear el problema dual
+            registro.debug("Paso 2: Crear problema dual")
+            
+            # Cambiar tipo de optimización
+            nuevo_tipo = "min" if tipo_original == "max" else "max"
+            
+            # Los coeficientes del dual son los términos independientes del primal
+            c_dual = b_convertida.copy()
+            
+            # Transponer la matriz A
+            num_variables_original = len(c_original)
+            
+            if self.disperso:
+                A_dual = A_convertida.transpuesta()
+            else:
+                A_dual = [list(fila) for fila in zip(*A_convertida)] if A_convertida else []
+            
+            # Los términos independientes del dual son los coeficientes del primal
+            b_dual = c_original.copy()
+            
+            # Determinar tipos de restricciones del dual
+            if tipo_original == "max":
+                # MAX → MIN: restricciones del dual son >=
+                tipos_dual = [">=" for _ in range(num_variables_original)]
+            else:  # "min"
+                # MIN → MAX: restricciones del dual son <=
+                tipos_dual = ["<=" for _ in range(num_variables_original)]
+            
+            # Guardar paso del dual
+            self.pasos_solucion.append({
+                'tipo': 'dualidad_final',
+                'titulo': f'Paso 2: Problema Dual ({nuevo_tipo.upper()})',
+                'c': c_dual,
+                'A': A_dual,
+                'b': b_dual,
+                'tipos': tipos_dual,
+                'tipo_opt': nuevo_tipo
+            })
+            
+            # IMPORTANTE: Actualizar el solver con el problema dual
+            # Ahora el problema dual se trata como un problema primal normal
+            self.c = c_dual
+            self.A = A_dual
+            self.b = b_dual
+            self.tipos_restricciones = tipos_dual
+            self.tipo = nuevo_tipo
+            self.variables_originales = len(self.c)
+            self.es_dual = True
+            
+            registro.debug("=== DUALIDAD APLICADA CORRECTAMENTE ===")
+            
+        except Exception as e:
+            registro.error("Error en aplicar_dualidad: %s", e)
+            raise ValueError(f"Error al aplicar dualidad: {str(e)}")
+    
+    @_fase("presolve")
+    def aplicar_presolve(self):
+        """Reducir el modelo antes de estandarizar (ver presolve.py)
+        
+        Las columnas que quedan son variables_originales del modelo reducido; self.presolve
+        guarda a qué fila y variable original corresponde cada una y los valores de las que se
+        eliminaron. Lo que aportan las variables fijadas se suma a constante_objetivo. Si el
+        presolve ya decide el problema (infactible, no acotado o sin nada por resolver), el
+        modelo no se toca y resolver() devuelve directamente el resultado.
+        """
+        from presolve import Presolve
+        
+        if isinstance(self.A, MatrizDispersa):
+            filas, columnas, valores = self.A.tripletes()
+        else:
+            densa = _matriz_densa(self.A).reshape(len(self.b), -1)
+            filas, columnas = np.nonzero(densa)
+            valores = densa[filas, columnas]
+        self.presolve = Presolve(self.c[:self.variables_originales], filas, columnas, valores,
+                                 self.b, self.tipos_restricciones, self.tipo).ejecutar()
+        resumen = self.presolve.resumen()
+        registro.debug("Presolve: %s", resumen)
+        if self.presolve.estado in ('infactible', 'no_acotado'):
+            return
+        
+        c, (filas, columnas, valores), b, tipos = self.presolve.modelo_reducido()
+        forma = (len(b), len(c))
+        if self.disperso:
+            self.A = MatrizDispersa.desde_tripletes(filas, columnas, valores, forma)
+        else:
+            densa = np.zeros(forma)
+            densa[filas, columnas] = valores
+            self.A = densa.tolist()
+        self.c = c.tolist()
+        self.b = b.tolist()
+        self.tipos_restricciones = tipos
+        self.variables_originales = len(c)
+        self.constante_objetivo += self.presolve.constante
+        
+        self.pasos_solucion.append({
+            'tipo': 'presolve',
+            'titulo': (f"Presolve: {resumen['filas']} de {resumen['filas_originales']} restricciones y "
+                       f"{resumen['columnas']} de {resumen['columnas_originales']} variables"),
+            'c': self.c.copy(),
+            'A': self.A if self.disperso else [fila.copy() for fila in self.A],
+            'b': self.b.copy(),
+            'tipos': self.tipos_restricciones.copy(),
+            'tipo_opt': self.tipo,
+            'columnas': self.presolve.columnas_conservadas.tolist()
+        })
+    
+    @_fase("escalado")
+    def aplicar_escalado(self, metodo):
+        """Escalar filas y columnas de A antes de estandarizar (ver escalado.py)
+        
+        Las tolerancias fijas del pivoteo (1e-10) trabajan así sobre coeficientes de magnitud
+        parecida; c y b también se llevan a valores de orden 1. Z y los valores de la solución
+        se desescalan en obtener_solucion_completa; los tableaux quedan en unidades escaladas.
+        """
+        from escalado import factor_vector, factores_escalado
+        
+        if isinstance(self.A, MatrizDispersa):
+            filas, columnas, valores = self.A.tripletes()
+        else:
+            densa = _matriz_densa(self.A).reshape(len(self.b), -1)
+            filas, columnas = np.nonzero(densa)
+            valores = densa[filas, columnas]
+        forma = (len(self.b), self.variables_originales)
+        r, s = factores_escalado(filas, columnas, valores, forma, metodo)
+        
+        valores = valores * r[filas] * s[columnas]
+        if self.disperso:
+            self.A = MatrizDispersa.desde_tripletes(filas, columnas, valores, forma)
+        else:
+            densa = np.zeros(forma)
+            densa[filas, columnas] = valores
+            self.A = densa.tolist()
+        c = np.asarray(self.c[:self.variables_originales], dtype=float) * s
+        b = np.asarray(self.b, dtype=float) * r
+        self.escala_objetivo, self.escala_rhs = factor_vector(c), factor_vector(b)
+        self.c = (c * self.escala_objetivo).tolist()
+        self.b = (b * self.escala_rhs).tolist()
+        self.escalado, self.escala_filas, self.escala_columnas = metodo, r, s
+        registro.debug("Escalado %s: filas %s, columnas %s", metodo, r, s)
+        
+        self.pasos_solucion.append({
+            'tipo': 'escalado',
+            'titulo': f'Modelo Escalado ({metodo})',
+            'c': self.c.copy(),
+            'A': self.A if self.disperso else [fila.copy() for fila in self.A],
+            'b': self.b.copy(),
+            'tipos': self.tipos_restricciones.copy(),
+            'tipo_opt': self.tipo,
+            'escala_filas': r.tolist(),
+            'escala_columnas': s.tolist(),
+            'escala_objetivo': self.escala_objetivo,
+            'escala_rhs': self.escala_rhs
+        })
+    
+    def escalas_estandarizadas(self):
+        """Factor que devuelve cada columna estandarizada a las unidades originales: sj/kb en las
+        variables originales y 1/(kb·ri) en la holgura, el excedente o la artificial de la fila i"""
+        escalas = np.ones(len(self.c))
+        escalas[:self.variables_originales] = self.escala_columnas
+        if isinstance(self.A, MatrizDispersa):
+            # Cada columna auxiliar tiene una sola entrada (CSC)
+            fila_de = self.A.indices[self.A.indptr[self.variables_originales:-1]]
+        else:
+            fila_de = np.argmax(_matriz_densa(self.A)[:, self.variables_originales:] != 0, axis=0)
+        escalas[self.variables_originales:] = 1 / self.escala_filas[fila_de]
+        return escalas / self.escala_rhs
+    
+    def configurar_parametrico(self, parametro, direccion, desde=0.0, hasta=None):
+        """Preparar el barrido de b(t) = b + t·d o c(t) = c + t·d para t entre desde y hasta
+        
+        El problema se desplaza a t = desde, que es el que resuelve resolver(); después
+        barrido_parametrico() recorre los puntos de quiebre desde esa base óptima.
+        """
+        if parametro not in ("b", "c"):
+            raise ValueError("El parámetro del barrido debe ser 'b' o 'c'")
+        direccion = _vector_finito(direccion, "La dirección del barrido")
+        esperado = len(self.b) if parametro == "b" else len(self.c)
+        if len(direccion) != esperado:
+            raise ValueError(f"La dirección del barrido debe tener {esperado} valores")
+        for valor, nombre in ((desde, 'desde'), (hasta, 'hasta')):
+            if isinstance(valor, bool) or not isinstance(valor, (int, float)) or not np.isfinite(valor):
+                raise ValueError(f"'{nombre}' del barrido debe ser un número")
+        if hasta < desde:
+            raise ValueError("'hasta' del barrido no puede ser menor que 'desde'")
+        
+        if parametro == "b":
+            self.b = (np.asarray(self.b, dtype=float) + desde * direccion).tolist()
+        else:
+            self.c = (np.asarray(self.c, dtype=float) + desde * direccion).tolist()
+        self.parametrico = (parametro, direccion, float(desde), float(hasta))
+    
+    @_fase("estandarizacion")
+    def estandarizar(self):
+        """Estandarización del modelo - CORREGIDA PARA MANEJAR TODOS LOS CASOS"""
+        try:
+            registro.debug("=== ESTANDARIZANDO ===")
+            registro.debug("Restricciones a estandarizar: %s", self.tipos_restricciones)
+            registro.debug("Matriz A: %s", self.A)
+            registro.debug("Vector b: %s", self.b)
+            
+            if self.algoritmo == "dual" and not self.base_holgura_es_factible_dual():
+                registro.info("La base de holguras no es dual factible, se usa el simplex primal")
+                self.algoritmo = "primal"
+            
+            # Filas a multiplicar por -1: en el primal las de b negativo; en el dual las >=,
+            # que pasan a <= con holgura básica (b puede quedar negativo) y sin artificial
+            invertir = self.filas_a_invertir()
+            self.filas_invertidas = invertir
+            if self.disperso:
+                # Multiplicar por -1 todas las filas a invertir de una vez
+                self.A = self.A.escalar_filas(np.where(invertir, -1.0, 1.0))
+            
+            for i, b_val in enumerate(self.b):
+                if invertir[i]:
+                    if b_val < 0:
+                        registro.debug("Término independiente negativo en restricción %s: %s", i+1, b_val)
+                    # Multiplicar la restricción por -1
+                    if not self.disperso:
+                        for j in range(len(self.A[i])):
+                            self.A[i][j] = -self.A[i][j]
+                    self.b[i] = -self.b[i]
+                    # Cambiar el tipo de restricción
+                    if self.tipos_restricciones[i] == "<=":
+                        self.tipos_restricciones[i] = ">="
+                    elif self.tipos_restricciones[i] == ">=":
+                        self.tipos_restricciones[i] = "<="
+                    registro.debug("Restricción %s corregida: %s %s", i+1, self.tipos_restricciones[i], self.b[i])
+    
+            # Resetear contadores
+            self.variables_holgura = 0
+            self.variables_excedente = 0  
+            self.variables_artificiales = 0
+            
+            # Contar variables adicionales necesarias (con los tipos ya corregidos)
+            for tipo in self.tipos_restricciones:
+                if tipo == "<=":
+                    self.variables_holgura += 1
+                elif tipo == ">=":
+                    self.variables_excedente += 1
+                    self.variables_artificiales += 1
+                elif tipo == "=":
+                    self.variables_artificiales += 1
+    
+            registro.debug("Variables adicionales: holgura=%s, excedente=%s, artificiales=%s",
+                           self.variables_holgura, self.variables_excedente, self.variables_artificiales)
+    
+            # Crear función objetivo estandarizada
+            total_vars = (self.variables_originales + self.variables_holgura + 
+                         self.variables_excedente + self.variables_artificiales)
+    
+            registro.debug("Total de variables en el modelo estandarizado: %s", total_vars)
+            
+            c_estandarizado = [0.0] * total_vars
+    
+            # Coeficientes de variables originales
+            for i in range(min(self.variables_originales, len(self.c))):
+                c_estandarizado[i] = self.c[i]
+    
+            # Variables de holgura: coeficiente 0
+            var_index = self.variables_originales
+            for i in range(self.variables_holgura):
+                if var_index < total_vars:
+                    c_estandarizado[var_index] = 0.0
+                    var_index += 1
+    
+            # Variables de excedente: coeficiente 0
+            for i in range(self.variables_excedente):
+                if var_index < total_vars:
+                    c_estandarizado[var_index] = 0.0
+                    var_index += 1
+    
+            # Variables artificiales: coeficiente M o -M según el tipo (0 en dos fases)
+            for i in range(self.variables_artificiales):
+                if var_index < total_vars:
+                    c_estandarizado[var_index] = self.costo_artificial()
+                    var_index += 1
+    
+            if self.disperso:
+                A_estandarizada, basic_vars_iniciales = self.estandarizar_disperso(total_vars)
+            else:
+                A_estandarizada, basic_vars_iniciales, c_estandarizado, total_vars = \
+                    self.estandarizar_denso(c_estandarizado, total_vars)
+    
+            # Guardar modelo estandarizado
+            self.pasos_solucion.append({
+                'tipo': 'estandarizado',
+                'titulo': 'Modelo Estandarizado',
+                'c': c_estandarizado,
+                'A': A_estandarizada,
+                'b': self.b,
+                'tipos': ['=' for _ in range(len(self.b))],
+                'tipo_opt': self.tipo,
+                'variables_originales': self.variables_originales,
+                'variables_holgura': self.variables_holgura,
+                'variables_excedente': self.variables_excedente,
+                'variables_artificiales': self.variables_artificiales
+            })
+    
+            # Actualizar el solver
+            self.c = c_estandarizado
+            self.A = A_estandarizada
+            self.basic_vars = basic_vars_iniciales
+            if self.escalado is not None:
+                self.escala_estandarizada = self.escalas_estandarizadas()
+    
+            registro.debug("Estandarización completada exitosamente.")
+            registro.debug("Total variables finales: %s", len(self.c))
+            registro.debug("Variables básicas finales: %s", self.basic_vars)
+            registro.debug("=== FIN ESTANDARIZACIÓN ===")
+    
+            return self.crear_tableau_inicial()
+    
+        except Exception as e:
+            registro.exception("Error en estandarizar: %s", e)
+            raise ValueError(f"Error al estandarizar: {str(e)}")
+    
+    def costo_artificial(self):
+        """Costo de las variables artificiales: ±M con Big-M, 0 con dos fases (la fase I usa su propio objetivo)"""
+        if self.artificiales == "dos_fases":
+            return 0.0
+        return self.M if self.tipo == "min" else -self.M
+    
+    def inicio_artificiales(self):
+        """Índice de la primera columna artificial (siempre van al final)"""
+        return self.variables_originales + self.variables_holgura + self.variables_excedente
+    
+    def filas_a_invertir(self):
+        """Máscara de las restricciones que estandarizar multiplica por -1"""
+        b = np.asarray(self.b, dtype=float)
+        tipos = np.asarray(self.tipos_restricciones)
+        if self.algoritmo == "dual":
+            return (tipos == ">=") | ((tipos == "=") & (b < 0))
+        return b < 0
+    
+    def base_holgura_es_factible_dual(self):
+        """Verificar si la base inicial del simplex dual (holguras y artificiales de las
+        igualdades) cumple la condición de optimalidad, es decir, si es dual factible"""
+        b = np.asarray(self.b, dtype=float)
+        tipos = np.asarray(self.tipos_restricciones)
+        if self.artificiales == "dos_fases" and np.any(tipos == "="):
+            # La fase I partiría de una base con holguras negativas
+            return False
+        
+        # Costos básicos de cada fila ya orientada: 0 para holguras, ±M para artificiales
+        cb = np.where(tipos == "=", self.costo_artificial(), 0.0) * np.where(b < 0, -1.0, 1.0)
+        if isinstance(self.A, MatrizDispersa):
+            zj = self.A.producto_transpuesto(cb)
+        else:
+            zj = cb @ np.asarray(self.A, dtype=float).reshape(len(self.b), -1)
+        
+        cj_zj = np.zeros(self.variables_originales)
+        cj_zj[:len(self.c)] = self.c[:self.variables_originales]
+        cj_zj -= zj[:self.variables_originales]
+        if self.tipo == "max":
+            return not np.any(cj_zj > 1e-10)
+        return not np.any(cj_zj < -1e-10)
+    
+    def estandarizar_disperso(self, total_vars):
+        """Agregar holguras, excedentes y artificiales como bloques identidad dispersos"""
+        filas = np.arange(len(self.b))
+        tipos = np.asarray(self.tipos_restricciones)
+        con_holgura = tipos == "<="
+        con_excedente = tipos == ">="
+        con_artificial = tipos != "<="
+        
+        # Columna asignada a cada restricción según su tipo
+        inicio_excedente = self.variables_originales + self.variables_holgura
+        inicio_artificial = inicio_excedente + self.variables_excedente
+        col_holgura = self.variables_originales + np.cumsum(con_holgura) - 1
+        col_excedente = inicio_excedente + np.cumsum(con_excedente) - 1
+        col_artificial = inicio_artificial + np.cumsum(con_artificial) - 1
+        
+        filas_A, columnas_A, valores_A = self.A.tripletes()
+        A_estandarizada = MatrizDispersa.desde_tripletes(
+            np.concatenate([filas_A, filas[con_holgura], filas[con_excedente], filas[con_artificial]]),
+            np.concatenate([columnas_A, col_holgura[con_holgura], col_excedente[con_excedente],
+                            col_artificial[con_artificial]]),
+            np.concatenate([valores_A, np.ones(self.variables_holgura), -np.ones(self.variables_excedente),
+                            np.ones(self.variables_artificiales)]),
+            (len(self.b), total_vars)
+        )
+        basic_vars_iniciales = np.where(con_holgura, col_holgura, col_artificial).tolist()
+        
+        registro.debug("Variables básicas iniciales: %s", basic_vars_iniciales)
+        registro.debug("Elementos distintos de cero: %s", A_estandarizada.nnz)
+        return A_estandarizada, basic_vars_iniciales
+    
+    def estandarizar_denso(self, c_estandarizado, total_vars):
+        """Construir la matriz A estandarizada como lista de listas"""
+        # Crear matriz A estandarizada
+        A_estandarizada = []
+        basic_vars_iniciales = []
+    
+        # Inicializar matriz con las dimensiones correctas
+        for i in range(len(self.A)):
+            nueva_restriccion = [0.0] * total_vars
+            # Copiar coeficientes originales
+            for j in range(min(self.variables_originales, len(self.A[i]))):
+                nueva_restriccion[j] = self.A[i][j]
+            A_estandarizada.append(nueva_restriccion)
+    
+        # Llenar las columnas de variables adicionales
+        contador_holgura = 0
+        contador_excedente = 0
+        contador_artificial = 0
+    
+        registro.debug("=== PROCESANDO RESTRICCIONES ===")
+        for i, tipo in enumerate(self.tipos_restricciones):
+            registro.debug("Restricción %s: tipo=%s", i+1, tipo)
+            
+            if i >= len(A_estandarizada):
+                registro.error("Índice de restricción %s fuera de rango", i)
+                continue
+            
+            if tipo == "<=":
+                # Variable de holgura
+                col_index = self.variables_originales + contador_holgura
+                if col_index < total_vars:
+                    A_estandarizada[i][col_index] = 1.0
+                    basic_vars_iniciales.append(col_index)
+                    registro.debug("Agregada variable de holgura S%s en columna %s", contador_holgura+1, col_index)
+                contador_holgura += 1
+            
+            elif tipo == ">=":
+                # Variable de excedente (negativa) y artificial
+                col_excedente = self.variables_originales + self.variables_holgura + contador_excedente
+                col_artificial = (self.variables_originales + self.variables_holgura + 
+                                self.variables_excedente + contador_artificial)
+                
+                if col_excedente < total_vars:
+                    A_estandarizada[i][col_excedente] = -1.0  # Variable de excedente
+                    registro.debug("Agregada variable de excedente -S%s en columna %s",
+                                   self.variables_holgura + contador_excedente + 1, col_excedente)
+                
+                if col_artificial < total_vars:
+                    A_estandarizada[i][col_artificial] = 1.0   # Variable artificial
+                    basic_vars_iniciales.append(col_artificial)
+                    registro.debug("Agregada variable artificial A%s en columna %s", contador_artificial+1, col_artificial)
+                
+                contador_excedente += 1
+                contador_artificial += 1
+                
+            elif tipo == "=":
+                # Solo variable artificial
+                col_artificial = (self.variables_originales + self.variables_holgura + 
+                                self.variables_excedente + contador_artificial)
+                if col_artificial < total_vars:
+                    A_estandarizada[i][col_artificial] = 1.0
+                    basic_vars_iniciales.append(col_artificial)
+                    registro.debug("Agregada variable artificial A%s en columna %s", contador_artificial+1, col_artificial)
+                contador_artificial += 1
+    
+        registro.debug("Variables básicas iniciales: %s", basic_vars_iniciales)
+        registro.debug("Número de restricciones: %s", len(self.A))
+        registro.debug("Número de variables básicas: %s", len(basic_vars_iniciales))
+        
+        # VERIFICACIÓN CRÍTICA: Asegurar que tenemos suficientes variables básicas
+        if len(basic_vars_iniciales) < len(self.A):
+            registro.warning("Faltan variables básicas. Agregando variables artificiales adicionales...")
+            
+            # Agregar variables artificiales adicionales donde sea necesario
+            for i in range(len(self.A)):
+                # Verificar si esta restricción ya tiene una variable básica
+                tiene_basica = False
+                for var_basica in basic_vars_iniciales:
+                    if A_estandarizada[i][var_basica] == 1.0:
+                        # Verificar que es la única 1 en esa columna
+                        es_unica = True
+                        for k in range(len(A_estandarizada)):
+                            if k != i and A_estandarizada[k][var_basica] != 0:
+                                es_unica = False
+                                break
+                        if es_unica:
+                            tiene_basica = True
+                            break
+                
+                if not tiene_basica:
+                    # Agregar variable artificial adicional
+                    if total_vars < len(c_estandarizado):
+                        # Extender matrices si es necesario
+                        for row in A_estandarizada:
+                            row.append(0.0)
+                        c_estandarizado.append(self.costo_artificial())
+                        total_vars += 1
+                    else:
+                        # Usar una columna existente
+                        nueva_col = len(c_estandarizado)
+                        for row in A_estandarizada:
+                            row.append(0.0)
+                        c_estandarizado.append(self.costo_artificial())
+                        A_estandarizada[i][nueva_col] = 1.0
+                        basic_vars_iniciales.append(nueva_col)
+                        self.variables_artificiales += 1
+                        registro.debug("Agregada variable artificial adicional A%s para restricción %s",
+                                       self.variables_artificiales, i+1)
+    
+        # Verificar que ahora tenemos el número correcto de variables básicas
+        if len(basic_vars_iniciales) != len(self.A):
+            registro.error("Aún no coinciden las variables básicas (%s) con restricciones (%s)",
+                           len(basic_vars_iniciales), len(self.A))
+            # Como último recurso, agregar variables artificiales hasta completar
+            while len(basic_vars_iniciales) < len(self.A):
+                fila_sin_basica = len(basic_vars_iniciales)
+                nueva_col = len(c_estandarizado)
+                
+                # Extender todas las filas
+                for row in A_estandarizada:
+                    row.append(0.0)
+                c_estandarizado.append(self.costo_artificial())
+                
+                # Asignar la variable artificial a la fila correspondiente
+                A_estandarizada[fila_sin_basica][nueva_col] = 1.0
+                basic_vars_iniciales.append(nueva_col)
+                self.variables_artificiales += 1
+                registro.debug("Agregada variable artificial de emergencia A%s para restricción %s",
+                               self.variables_artificiales, fila_sin_basica+1)
+    
+        return A_estandarizada, basic_vars_iniciales, c_estandarizado, total_vars
+    
+    def crear_tableau_inicial(self):
+        """Crear el tableau inicial del simplex"""
+        try:
+            registro.debug("=== CREANDO TABLEAU INICIAL ===")
+            num_restricciones = len(self.A)
+            num_variables = len(self.c)
+            
+            registro.debug("Dimensiones: %s restricciones, %s variables", num_restricciones, num_variables)
+            registro.debug("Variables básicas: %s", self.basic_vars)
+            
+            # Verificar dimensiones
+            if len(self.basic_vars) != num_restricciones:
+                raise ValueError(f"Número de variables básicas ({len(self.basic_vars)}) no coincide con número de restricciones ({num_restricciones})")
+            
+            # El método revisado (y el punto interior, que termina en él) no construye el tableau denso
+            if self.metodo != "tableau":
+                self.tableau = None
+                return True
+            
+            # Crear tableau
+            self.tableau = np.zeros((num_restricciones + 1, num_variables + 1))
+            self.tableau[:num_restricciones, :num_variables] = _matriz_densa(self.A)
+            self.tableau[:num_restricciones, num_variables] = self.b
+            
+            # Llenar fila Z (Cj - Zj) y valor Z
+            self.calcular_fila_z()
+            
+            registro.debug("Tableau inicial creado exitosamente")
+            registro.debug("Forma del tableau: %s", self.tableau.shape)
+            return True
+            
+        except Exception as e:
+            registro.error("Error en crear_tableau_inicial: %s", e)
+            raise ValueError(f"Error al crear tableau inicial: {str(e)}")
+    
+    def calcular_fila_z(self):
+        """Recalcular la fila Z (Cj - Zj) y el valor Z a partir de las filas de restricciones"""
+        num_restricciones = len(self.A)
+        num_variables = len(self.c)
+        
+        c = np.asarray(self.c, dtype=float)
+        cb = c[self.basic_vars]
+        self.tableau[num_restricciones, :num_variables] = c - cb @ self.tableau[:num_restricciones, :num_variables]
+        self.tableau[num_restricciones, num_variables] = cb @ self.tableau[:num_restricciones, num_variables]
+    
+    def indices_base(self, base):
+        """Convertir una base dada por índices o por nombres (X1, S2, A1...) en índices de columna"""
+        num_restricciones = len(self.A)
+        num_variables = len(self.c)
+        nombres = {self.obtener_nombre_variable_ordenado(j): j for j in range(num_variables)}
+        
+        indices = []
+        for var in base:
+            if isinstance(var, str):
+                if var.upper() not in nombres:
+                    raise ValueError(f"Variable desconocida en la base inicial: {var}")
+                indices.append(nombres[var.upper()])
+            else:
+                indices.append(int(var))
+        
+        if len(indices) != num_restricciones:
+            raise ValueError(f"La base inicial debe tener {num_restricciones} variables")
+        if len(set(indices)) != len(indices) or min(indices) < 0 or max(indices) >= num_variables:
+            raise ValueError("La base inicial tiene variables repetidas o fuera de rango")
+        return indices
+    
+    @_fase("estandarizacion")
+    def aplicar_base_inicial(self, base):
+        """Reconstruir el tableau a partir de una base previa (arranque en caliente)
+        
+        Si la base dejó de ser factible (por ejemplo, tras cambiar b o agregar una
+        restricción) pero sigue siendo dual factible, se conserva y resolver() la
+        repara con pivotes del simplex dual. Devuelve False y conserva la base de
+        holguras/artificiales si no es factible ni primal ni dual.
+        """
+        indices = self.indices_base(base)
+        num_variables = len(self.c)
+        
+        if isinstance(self.A, MatrizDispersa):
+            B = self.A.columnas_densas(indices)
+        else:
+            B = _matriz_densa(self.A)[:, indices]
+        
+        # Una base casi singular pasa np.linalg.solve con valores absurdos y luego la rechaza
+        # la factorización LU del método revisado: se rechaza aquí igual en ambos métodos
+        try:
+            if np.linalg.cond(B) > 1e12:
+                raise np.linalg.LinAlgError
+            x_basicas = np.linalg.solve(B, np.asarray(self.b, dtype=float))
+            factible = not np.any(x_basicas < -1e-9) or self.base_es_factible_dual(B, indices)
+        except np.linalg.LinAlgError:
+            raise ValueError("La base inicial es singular")
+        
+        if not factible:
+            registro.info("Base inicial no factible: se usa la base de holguras y artificiales")
+            self.base_inicial_aplicada = False
+            return False
+        
+        self.basic_vars = indices
+        if self.metodo == "tableau":
+            # Filas del tableau: B⁻¹·[A | b]
+            A = _matriz_densa(self.A)
+            self.tableau[:len(indices)] = np.linalg.solve(B, np.column_stack([A, self.b]))
+            self.tableau[:len(indices), indices] = np.eye(len(indices))
+            self.calcular_fila_z()
+        
+        if registro.isEnabledFor(logging.DEBUG):
+            registro.debug("Base inicial aplicada: %s", [self.obtener_nombre_variable_ordenado(j) for j in indices])
+        self.base_inicial_aplicada = True
+        return True
+    
+    def base_es_factible_dual(self, B, indices):
+        """Verificar que los costos reducidos d = c - Aᵀ·y, con y = B⁻ᵀ·c_B, no mejoran Z"""
+        c = np.asarray(self.c, dtype=float)
+        y = np.linalg.solve(B.T, c[indices])
+        if isinstance(self.A, MatrizDispersa):
+            costos_reducidos = c - self.A.producto_transpuesto(y)
+        else:
+            costos_reducidos = c - _matriz_densa(self.A).T @ y
+        costos_reducidos[indices] = 0.0
+        if self.tipo == "max":
+            return not np.any(costos_reducidos > 1e-9)
+        return not np.any(costos_reducidos < -1e-9)
+    
+    def es_optimo(self):
+        """Verificar si la solución es óptima (factible primal y dual)"""
+        return self.es_factible_dual() and self.es_factible_primal()
+    
+    def es_factible_primal(self):
+        """Verificar que ninguna variable básica sea negativa"""
+        return not np.any(self.obtener_valores_basicos() < -1e-10)
+    
+    def es_factible_dual(self):
+        """Verificar que ningún Cj - Zj pueda mejorar Z"""
+        try:
+            num_restricciones = len(self.A)
+            num_variables = len(self.c)
+            fila_z = self.tableau[num_restricciones, :num_variables]
+            
+            if self.tipo == "max":
+                return not np.any(fila_z > 1e-10)
+            return not np.any(fila_z < -1e-10)
+        except:
+            return False
+    
+    def encontrar_columna_pivote(self):
+        """Encontrar la columna pivote"""
+        try:
+            num_restricciones = len(self.A)
+            num_variables = len(self.c)
+            fila_z = self.tableau[num_restricciones, :num_variables]
+            
+            # La regla de precio trabaja siempre como MAX
+            return self.precio.elegir(fila_z if self.tipo == "max" else -fila_z)
+        except:
+            return -1
+    
+    def encontrar_fila_pivote(self, col_pivote):
+        """Encontrar la fila pivote usando la prueba del cociente mínimo"""
+        try:
+            num_restricciones = len(self.A)
+            num_variables = len(self.c)
+            
+            columna = self.tableau[:num_restricciones, col_pivote]
+            bi = self.tableau[:num_restricciones, num_variables]
+            
+            # Solo considerar coeficientes positivos con cociente no negativo
+            ratios = np.full(num_restricciones, np.inf)
+            positivos = columna > 1e-10
+            ratios[positivos] = bi[positivos] / columna[positivos]
+            ratios[ratios < -1e-10] = np.inf
+            
+            fila_pivote = int(np.argmin(ratios))
+            if not np.isfinite(ratios[fila_pivote]):
+                return -1
+            return self.desempatar_filas(ratios, fila_pivote, columna,
+                                         lambda i: self.tableau[i, self.base_referencia])
+        except:
+            return -1
+    
+    def desempatar_filas(self, ratios, fila_pivote, alpha, fila_inversa):
+        """Elegir entre las filas empatadas en el cociente mínimo según la estrategia anticiclado
+        
+        fila_inversa(i) devuelve la fila i de B⁻¹·B0, con B0 la base al empezar a iterar.
+        """
+        if self.desempate == "primero":
+            return fila_pivote
+        empatadas = np.flatnonzero(ratios <= ratios[fila_pivote] + 1e-10)
+        if len(empatadas) == 1:
+            return fila_pivote
+        
+        if self.desempate == "bland":
+            # Sale la variable básica de menor índice
+            return int(min(empatadas, key=lambda i: self.basic_vars[i]))
+        
+        # Lexicográfico: comparar las filas de B⁻¹·B0 divididas por el pivote, columna a columna
+        claves = np.array([fila_inversa(i) for i in empatadas]) / alpha[empatadas, None]
+        for k in range(claves.shape[1]):
+            quedan = claves[:, k] <= claves[:, k].min() + 1e-10
+            empatadas, claves = empatadas[quedan], claves[quedan]
+            if len(empatadas) == 1:
+                break
+        return int(empatadas[0])
+    
+    def iniciar_anticiclado(self):
+        """Fijar la base de referencia y vaciar el registro de bases degeneradas"""
+        self.base_referencia = list(self.basic_vars)
+        self.bases_degeneradas = set()
+    
+    def vigilar_ciclo(self, degenerado):
+        """Detectar ciclos: una base que se repite dentro de una racha de pivotes degenerados
+        
+        Al detectarlo se pasa a la regla de Bland, que garantiza terminar.
+        """
+        if not degenerado:
+            self.bases_degeneradas.clear()
+            return
+        
+        self.pivotes_degenerados += 1
+        base = frozenset(self.basic_vars)
+        if base in self.bases_degeneradas and self.ciclo_detectado is None:
+            registro.info("Ciclo detectado en la iteración %s: se cambia a la regla de Bland", self.iteracion)
+            self.ciclo_detectado = self.iteracion
+            self.desempate = "bland"
+            self.regla_precio = "bland"
+            self.precio = PrecioBland()
+        self.bases_degeneradas.add(base)
+    
+    def perturbacion_rhs(self, valores):
+        """Perturbación acotada y determinista de los valores básicos: δi ∈ [0.5, 1]·1e-7·(1 + |bi|)"""
+        rng = np.random.default_rng(0)
+        return 1e-7 * (1.0 + np.abs(valores)) * rng.uniform(0.5, 1.0, len(valores))
+    
+    def encontrar_fila_pivote_dual(self):
+        """Simplex dual: sale la variable básica con el bi más negativo (-1 si no hay ninguno)"""
+        bi = self.obtener_valores_basicos()
+        fila_pivote = int(np.argmin(bi))
+        return fila_pivote if bi[fila_pivote] < -1e-10 else -1
+    
+    def encontrar_columna_pivote_dual(self, fila_pivote):
+        """Simplex dual: prueba del cociente entre la fila Z y los coeficientes negativos de la fila pivote"""
+        try:
+            num_restricciones = len(self.A)
+            num_variables = len(self.c)
+            
+            fila = self.tableau[fila_pivote, :num_variables]
+            fila_z = self.tableau[num_restricciones, :num_variables]
+            if self.tipo == "min":
+                fila_z = -fila_z
+            
+            # Con la base dual factible fila_z <= 0, así que los cocientes son no negativos
+            ratios = np.full(num_variables, np.inf)
+            negativos = fila < -1e-10
+            ratios[negativos] = fila_z[negativos] / fila[negativos]
+            
+            col_pivote = int(np.argmin(ratios))
+            return col_pivote if np.isfinite(ratios[col_pivote]) else -1
+        except:
+            return -1
+    
+    def operaciones_fila(self, fila_pivote, col_pivote):
+        """Realizar operaciones de fila para el pivoteo"""
+        try:
+            # Hacer que el elemento pivote sea 1 y ceros en el resto de la columna
+            _pivotear(self.tableau, fila_pivote, col_pivote)
+            
+            # Actualizar variable básica
+            self.basic_vars[fila_pivote] = col_pivote
+            
+        except Exception as e:
+            raise ValueError(f"Error en operaciones de fila: {str(e)}")
+    
+    def calcular_zj_y_cj_zj(self, tableau=None, c=None, basic_vars=None):
+        """Calcular valores Zj y Cj-Zj para mostrar en el tableau (por defecto, el actual)"""
+        try:
+            tableau = self.tableau if tableau is None else tableau
+            c = np.asarray(self.c if c is None else c, dtype=float)
+            basic_vars = self.basic_vars if basic_vars is None else basic_vars
+            num_restricciones = len(basic_vars)
+            num_variables = len(c)
+            
+            cb = c[basic_vars]
+            
+            # Zj de cada columna, Cj - Zj y Zj de la columna de solución (bi)
+            zj = cb @ tableau[:num_restricciones, :num_variables]
+            cj_zj = c - zj
+            zj_bi = cb @ tableau[:num_restricciones, num_variables]
+            
+            return zj.tolist(), cj_zj.tolist(), float(zj_bi)
+            
+        except Exception as e:
+            registro.error("Error en calcular_zj_y_cj_zj: %s", e)
+            return [], [], 0
+    
+    
+    def obtener_nombre_variable_ordenado(self, index):
+        """Obtener el nombre de la variable según su índice"""
+        try:
+            if index < self.variables_originales:
+                if self.presolve is not None:
+                    index = int(self.presolve.columnas_conservadas[index])
+                return self.nombre_variable_original(index)
+        
+            # Variables adicionales
+            index_adj = index - self.variables_originales
+        
+            # Variables S (holgura y excedente)
+            total_s = self.variables_holgura + self.variables_excedente
+            if index_adj < total_s:
+                return f"S{index_adj + 1}"
+        
+            # Variables A (artificiales)
+            index_adj -= total_s
+            return f"A{index_adj + 1}"
+        except Exception as e:
+            registro.error("Error en obtener_nombre_variable_ordenado: %s", e)
+            return f"V{index + 1}"
+    
+    def nombre_variable_original(self, index):
+        """Nombre de la variable original index (antes del presolve)"""
+        if self.es_dual:
+            return f"Y{index + 1}"
+        elif self.nombres_variables:
+            return self.nombres_variables[index]
+        return f"X{index + 1}"
+    
+    def valores_postsolve(self, valores_basicos):
+        """Valores de todas las variables originales a partir de la base actual del modelo reducido"""
+        x_reducido = np.zeros(self.variables_originales)
+        for fila, j in enumerate(self.basic_vars):
+            if j < self.variables_originales:
+                x_reducido[j] = valores_basicos[fila]
+        return self.presolve.postsolve(x_reducido)
+    
+    def obtener_valores_basicos(self):
+        """Valores actuales de las variables básicas (columna bi)"""
+        if self.tableau is None:
+            return self.x_basicas
+        return self.tableau[:len(self.A), len(self.c)]
+    
+    def valor_funcion_contiene_M(self):
+        """Verificar si el valor de la función óptima contiene M, es decir, si queda
+        alguna variable artificial básica con valor positivo"""
+        try:
+            basicas = np.asarray(self.basic_vars)
+            valores = self.obtener_valores_basicos()
+            
+            # Se identifican por columna y no por costo, para no confundir costos reales grandes con M
+            return bool(np.any((basicas >= self.inicio_artificiales()) & (valores > 1e-10)))
+        except:
+            return False
+    
+    def verificar_no_acotado(self, col_pivote):
+        """Verificar si el problema es no acotado"""
+        try:
+            num_restricciones = len(self.A)
+            
+            return not np.any(self.tableau[:num_restricciones, col_pivote] > 1e-10)
+        except:
+            return False
+    
+    @_fase("resolucion")
+    def resolver(self):
+        """Resolver el problema usando el método simplex"""
+        self.inicio_resolucion = time.perf_counter()
+        self.interrupcion = None
+        if self.limite_tiempo_ms is not None:
+            self.plazo = self.inicio_resolucion + self.limite_tiempo_ms / 1000
+        if self.presolve is not None and self.presolve.estado is not None:
+            return self.resultado_presolve()
+        if self.metodo == "punto_interior":
+            return self.resolver_punto_interior()
+        if self.artificiales == "dos_fases":
+            return self.resolver_dos_fases()
+        if self.metodo == "revisado":
+            return self.resolver_revisado()
+        
+        try:
+            registro.debug("=== RESOLVIENDO CON SIMPLEX ===")
+            self.iteracion = 0
+            tableaux = self.nuevo_historial()
+            
+            error = self.iterar_tableau(tableaux)
+            if error:
+                return error
+            
+            return self.finalizar_tableau(tableaux)
+            
+        except Exception as e:
+            registro.error("Error en resolver: %s", e)
+            return {
+                'error': f'Error al resolver: {str(e)}',
+                'estado': 'error',
+                'pasos_solucion': self.convertir_numpy_a_python(self.pasos_solucion) if hasattr(self, 'pasos_solucion') else [],
+                'tableaux': [],
+                'problema_original': self.problema_original if hasattr(self, 'problema_original') else {}
+            }
+    
+    def iterar_tableau(self, tableaux):
+        """Pivotear el tableau hasta el óptimo o el límite de iteraciones
+        
+        Devuelve None al terminar o la respuesta de error si el problema es no acotado o infactible.
+        """
+        num_restricciones = len(self.A)
+        num_variables = len(self.c)
+        self.precio.reiniciar(
+            num_variables,
+            lambda: 1.0 + np.sum(self.tableau[:num_restricciones, :num_variables] ** 2, axis=0)
+        )
+        
+        self.iniciar_anticiclado()
+        
+        if self.anticiclado == "perturbacion":
+            # Perturbar bi para que ningún vértice sea degenerado; se retira al terminar
+            bi_original = self.tableau[:num_restricciones, num_variables].copy()
+            self.tableau[:num_restricciones, num_variables] += self.perturbacion_rhs(bi_original)
+            self.calcular_fila_z()
+        
+        # Guardar tableau inicial
+        self.registrar_tableau(tableaux)
+        error = self.pivotear_tableau(tableaux)
+        
+        if self.anticiclado == "perturbacion" and error is None:
+            # bi real de la base final: B⁻¹·b = (B⁻¹·B0)·(B0⁻¹·b); si queda algún valor
+            # negativo, el simplex dual lo corrige (la base sigue siendo dual factible)
+            restricciones = self.tableau[:num_restricciones, self.base_referencia]
+            self.tableau[:num_restricciones, num_variables] = restricciones @ bi_original
+            self.calcular_fila_z()
+            self.registrar_tableau(tableaux, perturbacion_retirada=True)
+            error = self.pivotear_tableau(tableaux)
+        return error
+    
+    def pivotear_tableau(self, tableaux):
+        """Bucle de pivoteo del tableau (primal o dual según la factibilidad de la base)"""
+        num_restricciones = len(self.A)
+        num_variables = len(self.c)
+        
+        while True:
+            # Con algún bi negativo se pivotea con el simplex dual hasta recuperar la factibilidad
+            fila_dual = self.encontrar_fila_pivote_dual()
+            if fila_dual == -1 and self.es_factible_dual():
+                break
+            if self.presupuesto_agotado():
+                break
+            self.iteracion += 1
+            
+            if fila_dual != -1:
+                if not self.es_factible_dual():
+                    return self.resultado_error('La base no es factible ni primal ni dual', tableaux)
+                
+                fila_pivote = fila_dual
+                col_pivote = self.encontrar_columna_pivote_dual(fila_pivote)
+                if col_pivote == -1:
+                    return self.resultado_error('Problema sin solución factible', tableaux)
+                tipo_pivote = {'tipo_pivote': 'dual'}
+            else:
+                # Encontrar columna pivote
+                col_pivote = self.encontrar_columna_pivote()
+                if col_pivote == -1:
+                    break
+                
+                # Verificar si es no acotado
+                if self.verificar_no_acotado(col_pivote):
+                    return self.resultado_error('Problema no acotado', tableaux)
+                
+                # Encontrar fila pivote
+                fila_pivote = self.encontrar_fila_pivote(col_pivote)
+                if fila_pivote == -1:
+                    return self.resultado_error('Problema no acotado', tableaux)
+                tipo_pivote = {}
+            
+            degenerado = fila_dual == -1 and self.tableau[fila_pivote, num_variables] <= 1e-10
+            
+            if self.precio.usa_fila_pivote:
+                restricciones = self.tableau[:num_restricciones, :num_variables]
+                self.precio.actualizar(
+                    fila_pivote, col_pivote, self.basic_vars[fila_pivote],
+                    self.tableau[:num_restricciones, col_pivote].copy(),
+                    self.tableau[fila_pivote, :num_variables].copy(),
+                    lambda v: restricciones.T @ v
+                )
+            
+            # Guardar información de las variables que entran y salen
+            var_entrante = self.obtener_nombre_variable_ordenado(col_pivote)
+            var_saliente = self.obtener_nombre_variable_ordenado(self.basic_vars[fila_pivote])
+            
+            # Realizar operaciones de fila
+            self.operaciones_fila(fila_pivote, col_pivote)
+            self.vigilar_ciclo(degenerado)
+            self.registrar_pivote(fila_pivote, col_pivote, var_entrante, var_saliente, dual=fila_dual != -1)
+            
+            # Guardar tableau de esta iteración
+            self.registrar_tableau(
+                tableaux,
+                col_pivote=col_pivote,
+                fila_pivote=fila_pivote,
+                var_entrante=var_entrante,
+                var_saliente=var_saliente,
+                **tipo_pivote
+            )
+        return None
+    
+    def resolver_dos_fases(self):
+        """Resolver con el método de dos fases en lugar de Big-M
+        
+        La fase I minimiza la suma de las artificiales. Si llega a cero se sacan de la
+        base, se eliminan sus columnas y la fase II continúa desde esa base con los
+        costos reales sobre un tableau más pequeño.
+        """
+        try:
+            registro.debug("=== RESOLVIENDO CON DOS FASES ===")
+            self.iteracion = 0
+            tableaux = self.nuevo_historial()
+            iterar = self.iterar_revisado if self.tableau is None else self.iterar_tableau
+            inicio_artificiales = self.inicio_artificiales()
+            
+            if any(j >= inicio_artificiales for j in self.basic_vars):
+                # Fase I: MIN suma de artificiales
+                c_real, tipo_real = self.c, self.tipo
+                self.c = [0.0] * inicio_artificiales + [1.0] * (len(c_real) - inicio_artificiales)
+                self.tipo = "min"
+                self.fase = 1
+                if self.tableau is not None:
+                    self.calcular_fila_z()
+                
+                error = iterar(tableaux)
+                self.c, self.tipo = c_real, tipo_real
+                if error:
+                    return error
+                if self.interrupcion:
+                    return self.resultado_interrumpido(tableaux)
+                
+                artificiales_basicas = np.asarray(self.basic_vars) >= inicio_artificiales
+                suma_artificiales = float(np.sum(self.obtener_valores_basicos()[artificiales_basicas]))
+                if suma_artificiales > 1e-9 * max(1.0, float(np.max(np.abs(self.b)))):
+                    return self.resultado_error('Problema sin solución factible', tableaux)
+                
+                self.expulsar_artificiales(inicio_artificiales)
+            
+            # Fase II: costos reales y sin columnas artificiales
+            self.eliminar_columnas_artificiales(inicio_artificiales)
+            self.fase = 2
+            if self.tableau is not None:
+                self.calcular_fila_z()
+            
+            error = iterar(tableaux)
+            if error:
+                return error
+            if self.tableau is not None:
+                return self.finalizar_tableau(tableaux)
+            if self.interrupcion:
+                return self.resultado_interrumpido(tableaux)
+            return self.obtener_solucion_completa(tableaux)
+            
+        except Exception as e:
+            registro.error("Error en resolver_dos_fases: %s", e)
+            return self.resultado_error(f'Error al resolver: {str(e)}', [])
+    
+    def fila_de_base(self, fila):
+        """Fila del tableau (B⁻¹·A) correspondiente a la variable básica de la fila indicada"""
+        if self.tableau is not None:
+            return self.tableau[fila, :len(self.c)]
+        
+        e_r = np.zeros(len(self.basic_vars))
+        e_r[fila] = 1.0
+        if isinstance(self.A, MatrizDispersa):
+            B = self.A.columnas_densas(self.basic_vars)
+            producto_transpuesto = self.A.producto_transpuesto
+        else:
+            A = np.asarray(self.A, dtype=float)
+            B = A[:, self.basic_vars]
+            producto_transpuesto = lambda y: A.T @ y
+        return producto_transpuesto(FactorizacionLU(B).resolver_transpuesta(e_r))
+    
+    def expulsar_artificiales(self, inicio_artificiales):
+        """Sacar de la base las artificiales que terminaron la fase I en cero
+        
+        Cada una se cambia por cualquier columna no artificial con coeficiente distinto
+        de cero en su fila (pivote degenerado). Si no hay ninguna, la restricción es
+        combinación de las demás y se elimina.
+        """
+        redundantes = []
+        for fila, var in enumerate(self.basic_vars):
+            if var < inicio_artificiales:
+                continue
+            
+            candidatas = np.flatnonzero(np.abs(self.fila_de_base(fila)[:inicio_artificiales]) > 1e-10)
+            if not candidatas.size:
+                redundantes.append(fila)
+            elif self.tableau is not None:
+                self.operaciones_fila(fila, int(candidatas[0]))
+            else:
+                self.basic_vars[fila] = int(candidatas[0])
+        
+        if redundantes:
+            registro.info("Restricciones redundantes eliminadas: %s", [i + 1 for i in redundantes])
+            self.restricciones_redundantes = [i + 1 for i in redundantes]
+            conservar = [i for i in range(len(self.basic_vars)) if i not in redundantes]
+            if isinstance(self.A, MatrizDispersa):
+                self.A = self.A.seleccionar_filas(conservar, np.ones(len(conservar)))
+            else:
+                self.A = [self.A[i] for i in conservar]
+            self.b = [self.b[i] for i in conservar]
+            self.tipos_restricciones = [self.tipos_restricciones[i] for i in conservar]
+            self.basic_vars = [self.basic_vars[i] for i in conservar]
+            if self.tableau is not None:
+                self.tableau = self.tableau[conservar + [len(self.tableau) - 1]]
+    
+    def eliminar_columnas_artificiales(self, inicio_artificiales):
+        """Quitar las columnas artificiales de c, A y el tableau"""
+        num_variables = len(self.c)
+        if inicio_artificiales == num_variables:
+            return
+        
+        self.c = list(self.c[:inicio_artificiales])
+        if isinstance(self.A, MatrizDispersa):
+            self.A = self.A.primeras_columnas(inicio_artificiales)
+        else:
+            self.A = [fila[:inicio_artificiales] for fila in self.A]
+        if self.tableau is not None:
+            self.tableau = np.hstack([self.tableau[:, :inicio_artificiales], self.tableau[:, num_variables:]])
+    
+    def datos_fase(self):
+        """Fase y costos vigentes para el historial del método de dos fases"""
+        if self.fase is None:
+            return {}
+        return {'fase': self.fase, 'cj': self.convertir_numpy_a_python(self.c)}
+    
+    def nuevo_historial(self):
+        return HistorialTableau(self.modo_historial, self.ultimos_k, self.formato_historial)
+    
+    def registrar_tableau(self, tableaux, **pivote):
+        """Registrar la iteración actual en el historial"""
+        tableaux.registrar(self, pivote)
+    
+    def entrada_historial(self, iteracion, tableau, basic_vars, c, es_optimo, datos_fase, pivote, x_basicas):
+        """Iteración del historial: el tableau junto con sus valores Zj y Cj-Zj, o en el
+        método revisado la base y sus valores"""
+        if tableau is None:
+            return {
+                'iteracion': iteracion,
+                'basic_vars': list(basic_vars),
+                'es_optimo': bool(es_optimo),
+                **datos_fase,
+                'bi': x_basicas.tolist(),
+                **pivote
+            }
+        
+        zj_values, cj_zj_values, zj_bi = self.calcular_zj_y_cj_zj(tableau, c, basic_vars)
+        return {
+            'iteracion': iteracion,
+            'tableau': (codificar_matriz(tableau) if self.formato_historial == "base64"
+                        else self.convertir_numpy_a_python(tableau)),
+            'basic_vars': list(basic_vars),
+            'es_optimo': es_optimo,
+            **datos_fase,
+            **pivote,
+            'zj_values': zj_values,
+            'cj_zj_values': cj_zj_values,
+            'zj_bi': zj_bi
+        }
+    
+    def finalizar_tableau(self, tableaux):
+        """Construir el resultado una vez terminadas las iteraciones del tableau"""
+        if self.interrupcion:
+            return self.resultado_interrumpido(tableaux)
+        
+        # Verificar si hay solución factible
+        if self.es_optimo() and self.valor_funcion_contiene_M():
+            return self.resultado_error('Problema sin solución factible', tableaux)
+        
+        return self.obtener_solucion_completa(tableaux)
+    
+    def resolver_revisado(self):
+        """Resolver con el simplex revisado: solo se mantiene la factorización de la base"""
+        try:
+            registro.debug("=== RESOLVIENDO CON SIMPLEX REVISADO ===")
+            self.iteracion = 0
+            tableaux = self.nuevo_historial()
+            
+            error = self.iterar_revisado(tableaux)
+            if error:
+                return error
+            if self.interrupcion:
+                return self.resultado_interrumpido(tableaux)
+            
+            # Verificar si hay solución factible
+            if self.valor_funcion_contiene_M():
+                return self.resultado_error('Problema sin solución factible', tableaux)
+            
+            return self.obtener_solucion_completa(tableaux)
+            
+        except Exception as e:
+            registro.error("Error en resolver_revisado: %s", e)
+            return self.resultado_error(f'Error al resolver: {str(e)}', [])
+    
+    def resolver_punto_interior(self):
+        """Resolver con el punto interior de Mehrotra y, con crossover, terminar en una base
+        
+        El punto interior trabaja sobre las columnas sin artificiales. Su punto óptimo da la
+        base inicial del simplex revisado, que solo necesita unos pocos pivotes para llegar a
+        un vértice (base_final, sensibilidad, barrido paramétrico). Si no converge (problema
+        infactible o no acotado, o sin progreso) se resuelve con el simplex desde la base de
+        holguras y artificiales, que es quien da el diagnóstico.
+        """
+        from punto_interior import mehrotra
+        
+        try:
+            registro.debug("=== RESOLVIENDO CON PUNTO INTERIOR ===")
+            self.iteracion = 0
+            num_columnas = self.inicio_artificiales()
+            A = _matriz_densa(self.A)
+            b = np.asarray(self.b, dtype=float)
+            c = np.asarray(self.c, dtype=float)[:num_columnas]
+            
+            def detener():
+                if self.presupuesto_agotado():
+                    return True
+                self.iteracion += 1
+                return False
+            
+            x, _, s, iteraciones, estado = mehrotra(A[:, :num_columnas], b, -c if self.tipo == "max" else c,
+                                                     detener=detener)
+            self.punto_interior = {'iteraciones': iteraciones, 'estado': estado}
+            registro.debug("Punto interior: %s en %s iteraciones", estado, iteraciones)
+            
+            if estado == 'detenido':
+                # Sin base propia: se informa la de holguras y artificiales
+                self.x_basicas = np.linalg.solve(A[:, self.basic_vars], b)
+                resultado = self.resultado_interrumpido(self.nuevo_historial())
+            elif estado == 'optimo' and not self.crossover:
+                resultado = self.solucion_punto_interior(x)
+            else:
+                if estado == 'optimo':
+                    self.punto_interior['crossover'] = self.aplicar_base_inicial(
+                        self.base_desde_punto_interior(A, x, s))
+                    self.base_inicial_aplicada = None  # La base no la pidió el cliente
+                    # El problema ya es factible: el crossover sigue como la fase II de dos fases,
+                    # sin las columnas artificiales, que con Big-M podrían volver a entrar en la base
+                    resultado = self.resolver_dos_fases()
+                else:
+                    registro.info("El punto interior no convergió (%s): se resuelve con el simplex", estado)
+                    resultado = self.resolver_dos_fases() if self.artificiales == "dos_fases" else self.resolver_revisado()
+                if 'iteraciones' in resultado:
+                    # Iteraciones del punto interior más los pivotes del simplex que lo sigue
+                    resultado['iteraciones'] += iteraciones
+            
+            resultado['punto_interior'] = self.punto_interior
+            return resultado
+        
+        except Exception as e:
+            registro.error("Error en resolver_punto_interior: %s", e)
+            return self.resultado_error(f'Error al resolver: {str(e)}', [])
+    
+    def base_desde_punto_interior(self, A, x, s):
+        """Base de columnas linealmente independientes para el crossover
+        
+        Van primero las columnas del soporte del punto óptimo (x > s, ordenadas por x/s) y se
+        completa con la columna unitaria inicial de cada fila; la independencia se comprueba
+        ortogonalizando cada candidata contra las ya elegidas.
+        """
+        num_restricciones = A.shape[0]
+        orden = np.argsort(-(x / s), kind="stable")
+        candidatas = [int(j) for j in orden if x[j] > s[j]] + list(self.basic_vars)
+        
+        Q = np.zeros((num_restricciones, num_restricciones))
+        base = []
+        for j in candidatas:
+            if len(base) == num_restricciones:
+                break
+            if j in base:
+                continue
+            columna = A[:, j]
+            elegidas = Q[:, :len(base)]
+            residuo = columna - elegidas @ (elegidas.T @ columna)
+            residuo -= elegidas @ (elegidas.T @ residuo)  # Segunda pasada por estabilidad
+            norma = np.linalg.norm(residuo)
+            if norma > 1e-7 * np.linalg.norm(columna):
+                Q[:, len(base)] = residuo / norma
+                base.append(j)
+        return base
+    
+    @_fase("serializacion")
+    def solucion_punto_interior(self, x):
+        """Solución del punto interior sin crossover: sin base, las variables con valor positivo
+        se informan como básicas"""
+        valores = x if self.escala_estandarizada is None else x * self.escala_estandarizada[:len(x)]
+        
+        c = np.asarray(self.c, dtype=float)[:len(x)]
+        z_optimo = c @ x
+        if self.escalado is not None:
+            z_optimo /= self.escala_objetivo * self.escala_rhs
+        
+        # Con presolve, las variables originales van con sus valores reconstruidos y sus nombres de antes
+        if self.presolve is not None:
+            x_original = self.presolve.postsolve(valores[:self.variables_originales])
+            variables = [(self.nombre_variable_original(j), valor) for j, valor in enumerate(x_original)]
+        else:
+            variables = [(self.obtener_nombre_variable_ordenado(j), valores[j])
+                         for j in range(self.variables_originales)]
+        variables += [(self.obtener_nombre_variable_ordenado(j), valores[j])
+                      for j in range(self.variables_originales, len(x))]
+        
+        variables_basicas, variables_no_basicas = [], []
+        for nombre, valor in variables:
+            valor = round(float(valor), 4)
+            (variables_basicas if valor else variables_no_basicas).append({'nombre': nombre, 'valor': valor})
+        
+        resultado = {
+            'exito': True,
+            'estado': 'optimo',
+            'optimo': True,
+            'variables_basicas': variables_basicas,
+            'variables_no_basicas': variables_no_basicas,
+            'z_optimo': round(float(z_optimo + self.constante_objetivo), 4),
+            'tipo_optimizacion': self.tipo,
+            **self.campos_historial(self.nuevo_historial()),
+            'pasos_solucion': self.convertir_numpy_a_python(self.pasos_solucion),
+            'es_dual': self.es_dual,
+            'algoritmo': self.algoritmo,
+            'artificiales': self.artificiales,
+            'variables_originales': self.variables_originales,
+            'variables_holgura': self.variables_holgura,
+            'variables_excedente': self.variables_excedente,
+            'variables_artificiales': self.variables_artificiales,
+            'problema_original': self.problema_original
+        }
+        if self.presolve is not None:
+            resultado['presolve'] = {
+                **self.presolve.resumen(),
+                'variables_eliminadas': [self.nombre_variable_original(j)
+                                         for j in np.flatnonzero(~self.presolve.columna_activa)]
+            }
+        resultado.update(self.metricas_resolucion())
+        return resultado
+    
+    def iterar_revisado(self, tableaux):
+        """Iterar el simplex revisado desde la base actual hasta el óptimo
+        
+        Devuelve None al terminar o la respuesta de error si el problema es no acotado,
+        infactible o se alcanza el límite de iteraciones.
+        """
+        c = np.asarray(self.c, dtype=float)
+        b = np.asarray(self.b, dtype=float)
+        
+        # Acceso a columnas y Aᵀ·y sin densificar A cuando es dispersa
+        if isinstance(self.A, MatrizDispersa):
+            A = self.A
+            columnas = A.columnas_densas
+            producto_transpuesto = A.producto_transpuesto
+        else:
+            A = np.asarray(self.A, dtype=float)
+            columnas = lambda indices: A[:, indices]
+            producto_transpuesto = lambda y: A.T @ y
+        
+        self.iniciar_anticiclado()
+        base_referencia = columnas(self.base_referencia)
+        factorizacion = FactorizacionLU(base_referencia, self.frecuencia_refactorizacion)
+        
+        # Con perturbación se resuelve con b + B0·δ, de modo que B0⁻¹·b queda desplazado en δ
+        b_original = b
+        perturbado = self.anticiclado == "perturbacion"
+        if perturbado:
+            b = b + base_referencia @ self.perturbacion_rhs(factorizacion.resolver(b))
+        self.x_basicas = factorizacion.resolver(b)
+        
+        def normas():
+            base = columnas(self.basic_vars)
+            if np.array_equal(base, np.eye(len(base))):
+                # Base de holguras y artificiales: B⁻¹·A = A
+                if isinstance(A, MatrizDispersa):
+                    return 1.0 + A.suma_cuadrados_columnas()
+                return 1.0 + np.sum(A ** 2, axis=0)
+            return 1.0 + np.sum(np.linalg.solve(base, _matriz_densa(A)) ** 2, axis=0)
+        
+        def fila_tableau(fila_pivote):
+            # e_rᵀ·B⁻¹·A = (B⁻ᵀ·e_r)ᵀ·A
+            e_r = np.zeros(len(self.x_basicas))
+            e_r[fila_pivote] = 1.0
+            return producto_transpuesto(factorizacion.resolver_transpuesta(e_r))
+        
+        def fila_inversa(fila):
+            # e_rᵀ·B⁻¹·B0
+            e_r = np.zeros(len(self.x_basicas))
+            e_r[fila] = 1.0
+            return base_referencia.T @ factorizacion.resolver_transpuesta(e_r)
+        
+        self.precio.reiniciar(len(c), normas)
+        
+        ultimo_pivote = {}
+        while True:
+            # Costos reducidos: d = c - Aᵀ·y con y = B⁻ᵀ·c_B
+            y = factorizacion.resolver_transpuesta(c[self.basic_vars])
+            costos_reducidos = c - producto_transpuesto(y)
+            costos_reducidos[self.basic_vars] = 0.0
+            
+            # Simplex dual mientras alguna variable básica sea negativa
+            fila_dual = int(np.argmin(self.x_basicas))
+            factible_primal = self.x_basicas[fila_dual] >= -1e-10
+            
+            col_pivote = self.precio.elegir(costos_reducidos if self.tipo == "max" else -costos_reducidos)
+            factible_dual = col_pivote == -1
+            optimo = factible_primal and factible_dual
+            
+            # Registro de la iteración (sin tableau denso)
+            tableaux.registrar(self, ultimo_pivote, es_optimo=bool(optimo))
+            
+            if optimo and perturbado:
+                # Retirar la perturbación; si queda algún valor negativo sigue el simplex dual
+                b = b_original
+                self.x_basicas = factorizacion.resolver(b)
+                perturbado = False
+                ultimo_pivote = {'perturbacion_retirada': True}
+                continue
+            if optimo:
+                break
+            if self.presupuesto_agotado():
+                if perturbado:
+                    self.x_basicas = factorizacion.resolver(b_original)
+                break
+            
+            self.iteracion += 1
+            
+            if factible_primal:
+                # Columna entrante: α = B⁻¹·a_q
+                alpha = factorizacion.resolver(columnas([col_pivote])[:, 0])
+                ratios = np.full(len(alpha), np.inf)
+                positivos = alpha > 1e-10
+                ratios[positivos] = self.x_basicas[positivos] / alpha[positivos]
+                ratios[ratios < -1e-10] = np.inf
+                fila_pivote = int(np.argmin(ratios))
+                if not np.isfinite(ratios[fila_pivote]):
+                    return self.resultado_error('Problema no acotado', tableaux)
+                fila_pivote = self.desempatar_filas(ratios, fila_pivote, alpha, fila_inversa)
+                pivote_dual = {}
+            else:
+                if not factible_dual:
+                    return self.resultado_error('La base no es factible ni primal ni dual', tableaux)
+                
+                # Fila saliente del tableau
+                fila_pivote = fila_dual
+                fila = fila_tableau(fila_pivote)
+                fila[self.basic_vars] = 0.0
+                
+                # Prueba del cociente dual con los costos reducidos orientados a MAX
+                signo = 1.0 if self.tipo == "max" else -1.0
+                ratios = np.full(len(fila), np.inf)
+                negativos = fila < -1e-10
+                ratios[negativos] = signo * costos_reducidos[negativos] / fila[negativos]
+                col_pivote = int(np.argmin(ratios))
+                if not np.isfinite(ratios[col_pivote]):
+                    return self.resultado_error('Problema sin solución factible', tableaux)
+                
+                alpha = factorizacion.resolver(columnas([col_pivote])[:, 0])
+                pivote_dual = {'tipo_pivote': 'dual'}
+            
+            var_entrante = self.obtener_nombre_variable_ordenado(col_pivote)
+            var_saliente = self.obtener_nombre_variable_ordenado(self.basic_vars[fila_pivote])
+            
+            if self.precio.usa_fila_pivote:
+                self.precio.actualizar(
+                    fila_pivote, col_pivote, self.basic_vars[fila_pivote], alpha,
+                    fila if not factible_primal else fila_tableau(fila_pivote),
+                    lambda v: producto_transpuesto(factorizacion.resolver_transpuesta(v))
+                )
+            
+            # Actualizar valores básicos y la base
+            theta = self.x_basicas[fila_pivote] / alpha[fila_pivote]
+            self.x_basicas -= theta * alpha
+            self.x_basicas[fila_pivote] = theta
+            self.basic_vars[fila_pivote] = col_pivote
+            self.vigilar_ciclo(factible_primal and abs(theta) <= 1e-10)
+            self.registrar_pivote(fila_pivote, col_pivote, var_entrante, var_saliente, dual=not factible_primal)
+            
+            # Sin tiempo para refactorizar basta con la eta: el próximo paso del bucle corta
+            if factorizacion.necesita_refactorizar() and not self.plazo_agotado():
+                self.estadisticas.contar('refactorizaciones')
+                factorizacion.refactorizar(columnas(self.basic_vars))
+                self.x_basicas = factorizacion.resolver(b)
+            else:
+                factorizacion.actualizar(fila_pivote, alpha)
+            
+            ultimo_pivote = {
+                'col_pivote': col_pivote,
+                'fila_pivote': fila_pivote,
+                'var_entrante': var_entrante,
+                'var_saliente': var_saliente,
+                **pivote_dual
+            }
+        return None
+    
+    def registrar_pivote(self, fila_pivote, col_pivote, var_entrante, var_saliente, dual=False):
+        """Contar el pivote y, si hay traza, enviarle el evento"""
+        self.estadisticas.contar('pivotes_duales' if dual else 'pivotes')
+        if self.estadisticas.traza is not None:
+            self.estadisticas.traza({
+                'evento': 'pivote',
+                'iteracion': self.iteracion,
+                'fase': self.fase,
+                'tipo': 'dual' if dual else 'primal',
+                'fila': int(fila_pivote),
+                'columna': int(col_pivote),
+                'entra': var_entrante,
+                'sale': var_saliente
+            })
+    
+    def presupuesto_agotado(self):
+        """Comprobar, antes de cada pivote, la cancelación y los límites de iteraciones y tiempo
+        
+        Si alguno se agotó lo deja en self.interrupcion y devuelve True.
+        """
+        if self.cancelacion.is_set():
+            self.interrupcion = 'cancelado'
+        elif self.iteracion >= self.max_iteraciones:
+            self.interrupcion = 'limite_iteraciones'
+        elif self.plazo is not None and time.perf_counter() >= self.plazo:
+            self.interrupcion = 'limite_tiempo'
+        return self.interrupcion is not None
+    
+    def plazo_agotado(self):
+        """Cancelación o tiempo agotados, sin tocar self.interrupcion: para no empezar un paso
+        costoso (como refactorizar la base) que ya no cabe en el presupuesto"""
+        return self.cancelacion.is_set() or (self.plazo is not None and time.perf_counter() >= self.plazo)
+    
+    def cancelar(self):
+        """Pedir que resolver() se detenga antes del siguiente pivote (se puede llamar desde otro hilo)"""
+        self.cancelacion.set()
+    
+    def base_actual_factible(self):
+        """La base actual es una solución del problema: sin valores negativos ni artificiales positivas"""
+        valores = self.obtener_valores_basicos()
+        artificiales = np.asarray(self.basic_vars) >= self.inicio_artificiales()
+        return bool(not np.any(valores < -1e-10) and not np.any(valores[artificiales] > 1e-9))
+    
+    def resultado_interrumpido(self, tableaux):
+        """Solución de la última base alcanzada cuando se agota el presupuesto o se cancela
+        
+        Es un resultado con exito, pero con optimo False y el motivo en 'estado'; 'factible'
+        indica si la base ya era una solución factible (en el primal siempre es la mejor
+        encontrada hasta el momento). Si no lo es, z_optimo es None: el Z de la base incluiría
+        la penalización M de las artificiales o correspondería a valores negativos.
+        """
+        resultado = self.obtener_solucion_completa(tableaux)
+        if 'error' in resultado:
+            return resultado
+        factible = self.base_actual_factible()
+        mensaje = MENSAJES_INTERRUPCION[self.interrupcion]
+        if not factible:
+            resultado['z_optimo'] = None
+            mensaje += ' (aún sin una solución factible)'
+        resultado.update({
+            'estado': self.interrupcion,
+            'optimo': False,
+            'factible': factible,
+            'mensaje': mensaje
+        })
+        return resultado
+    
+    def resultado_presolve(self):
+        """Resultado de un problema que el presolve ya decidió sin necesidad de pivotear"""
+        if self.presolve.estado == 'infactible':
+            return self.resultado_error('Problema sin solución factible', [])
+        if self.presolve.estado == 'no_acotado':
+            return self.resultado_error('Problema no acotado', [])
+        # Todas las variables quedaron fijadas: no hay filas ni columnas que resolver
+        self.iteracion = 0
+        self.basic_vars = []
+        self.x_basicas = np.zeros(0)
+        return self.obtener_solucion_completa(self.nuevo_historial())
+    
+    @_fase("serializacion")
+    def resultado_error(self, mensaje, tableaux):
+        """Respuesta de error con los pasos y tableaux generados hasta el momento"""
+        return {
+            'error': mensaje,
+            'estado': ESTADOS_ERROR.get(mensaje, 'error'),
+            'pasos_solucion': self.convertir_numpy_a_python(self.pasos_solucion),
+            **self.campos_historial(tableaux),
+            'problema_original': self.problema_original,
+            **self.metricas_resolucion()
+        }
+    
+    def campos_historial(self, tableaux):
+        """'tableaux' exportados y, si el modo lo permite, los datos para reproducir iteraciones"""
+        if not isinstance(tableaux, HistorialTableau):
+            return {'tableaux': tableaux}
+        
+        campos = {'tableaux': tableaux.exportar(self)}
+        reproduccion = tableaux.reproduccion()
+        if reproduccion is not None:
+            # Costos vigentes para recalcular Zj en el cliente (la fase I los trae en cada iteración)
+            campos['historial'] = {**reproduccion, 'cj': self.convertir_numpy_a_python(self.c)}
+        if tableaux.formato != "json":
+            campos['formato_historial'] = tableaux.formato
+        return campos
+    
+    def metricas_resolucion(self):
+        """Regla de precio, iteraciones y tiempo de resolución para comparar reglas"""
+        metricas = {
+            'regla_precio': self.regla_precio,
+            'anticiclado': self.anticiclado,
+            'iteraciones': self.iteracion,
+            'pivotes_degenerados': self.pivotes_degenerados
+        }
+        if self.ciclo_detectado is not None:
+            metricas['ciclo_detectado'] = self.ciclo_detectado
+        if self.inicio_resolucion is not None:
+            metricas['tiempo_resolucion_ms'] = round((time.perf_counter() - self.inicio_resolucion) * 1000, 3)
+        return metricas
+    
+    def puede_apilarse(self):
+        """resolver_apilado solo cubre el caso base: tableau, Big-M, Dantzig, base inicial factible,
+        sin presolve y sin límite de tiempo (el kernel solo vigila las iteraciones)"""
+        return (self.metodo == "tableau" and self.artificiales == "big_m"
+                and self.regla_precio == "dantzig" and self.anticiclado == "ninguno"
+                and self.limite_tiempo_ms is None and self.presolve is None and self.es_factible_primal())
+    
+    def factores_unidades(self):
+        """Del solver al problema sin escalar: (fc, fb, filas) con c' = fc·c en cada variable
+        original y b' = fb·b en cada fila (fb negativo en las que estandarizar invirtió), y las
+        filas que siguen en el modelo tras la fase I; Z' = kc·kb·Z"""
+        fc = np.ones(self.variables_originales)
+        fb = np.where(self.filas_invertidas, -1.0, 1.0)
+        if self.escalado is not None:
+            fc = fc * self.escala_objetivo * self.escala_columnas
+            fb = fb * self.escala_rhs * self.escala_filas
+        filas = np.delete(np.arange(len(fb)), np.asarray(self.restricciones_redundantes, dtype=int) - 1)
+        return fc, fb, filas
+    
+    @_fase("sensibilidad")
+    def analisis_sensibilidad(self):
+        """Precios sombra, costos reducidos y aumentos y disminuciones permitidos de cada costo y
+        cada término independiente sin que cambie la base final (ver sensibilidad.py)
+        
+        Se devuelven en las unidades del problema sin escalar, con None para los rangos sin
+        límite, y las filas son las de problema_original (con el término independiente ya no
+        negativo). Las filas que la fase I eliminó por redundantes quedan con precio sombra y rangos 0.
+        """
+        from sensibilidad import rangos_costos, rangos_rhs
+        
+        basicas = np.asarray(self.basic_vars, dtype=int)
+        c = np.asarray(self.c, dtype=float)
+        if isinstance(self.A, MatrizDispersa):
+            B = self.A.columnas_densas(basicas)
+            producto_transpuesto, producto_izquierdo = self.A.producto_transpuesto, self.A.producto_izquierdo
+        else:
+            A = _matriz_densa(self.A)
+            B = A[:, basicas]
+            producto_transpuesto, producto_izquierdo = (lambda y: A.T @ y), (lambda Y: Y @ A)
+        inversa = np.linalg.inv(B)
+        
+        # Precios sombra y costos reducidos en las unidades del solver
+        y = inversa.T @ c[basicas]
+        costos_reducidos = c - producto_transpuesto(y)
+        costos_reducidos[basicas] = 0.0
+        
+        # Las artificiales no pueden volver a entrar a la base
+        candidatas = np.arange(len(c)) < self.inicio_artificiales()
+        candidatas[basicas] = False
+        filas_originales = np.flatnonzero(basicas < self.variables_originales)
+        (aumento_basicas, disminucion_basicas), (aumento_c, disminucion_c) = rangos_costos(
+            costos_reducidos, producto_izquierdo(inversa[filas_originales]), candidatas, self.tipo)
+        aumento_c[basicas[filas_originales]] = aumento_basicas
+        disminucion_c[basicas[filas_originales]] = disminucion_basicas
+        aumento_b, disminucion_b = rangos_rhs(
+            self.obtener_valores_basicos(), inversa, basicas >= self.inicio_artificiales())
+        
+        num_originales = self.variables_originales
+        fc, fb, filas = self.factores_unidades()
+        
+        precios, aumento, disminucion = np.zeros(len(fb)), np.zeros(len(fb)), np.zeros(len(fb))
+        precios[filas] = y * fb[filas] / (self.escala_objetivo * self.escala_rhs)
+        escala = np.abs(fb[filas])
+        aumento[filas] = np.where(fb[filas] > 0, aumento_b, disminucion_b) / escala
+        disminucion[filas] = np.where(fb[filas] > 0, disminucion_b, aumento_b) / escala
+        
+        def rango(valor):
+            return round(float(valor), 4) if np.isfinite(valor) else None
+        
+        return {
+            'variables': [{
+                'nombre': self.obtener_nombre_variable_ordenado(j),
+                'costo_reducido': round(float(costos_reducidos[j] / fc[j]), 4),
+                'aumento_permitido': rango(aumento_c[j] / fc[j]),
+                'disminucion_permitida': rango(disminucion_c[j] / fc[j])
+            } for j in range(num_originales)],
+            'restricciones': [{
+                'restriccion': i + 1,
+                'precio_sombra': round(float(precios[i]), 4),
+                'aumento_permitido': rango(aumento[i]),
+                'disminucion_permitida': rango(disminucion[i])
+            } for i in range(len(fb))]
+        }
+    
+    @_fase("parametrico")
+    def barrido_parametrico(self):
+        """Recorrer b(t) = b + t·d o c(t) = c + t·d desde la base óptima en t = desde hasta t = hasta
+        
+        Mientras la base no cambia, Z(t) es lineal. En cada punto de quiebre basta un pivote: del
+        simplex dual cuando una básica se haría negativa (barrido de b) o del primal cuando un
+        costo reducido cambia de signo (barrido de c). El barrido se detiene antes de hasta si el
+        problema deja de ser factible o acotado, o tras max_iteraciones pivotes.
+        """
+        parametro, direccion, desde, hasta = self.parametrico
+        c = np.asarray(self.c, dtype=float)
+        b = np.asarray(self.b, dtype=float)
+        if isinstance(self.A, MatrizDispersa):
+            columnas = self.A.columnas_densas
+            producto_transpuesto = self.A.producto_transpuesto
+        else:
+            A = _matriz_densa(self.A)
+            columnas = lambda indices: A[:, indices]
+            producto_transpuesto = lambda y: A.T @ y
+        
+        # Dirección en las unidades del solver
+        fc, fb, filas = self.factores_unidades()
+        escala_z = self.escala_objetivo * self.escala_rhs
+        if parametro == "b":
+            if self.restricciones_redundantes:
+                # Las filas eliminadas dejan de ser combinación de las demás al mover b
+                return {'error': 'El barrido de b no admite restricciones redundantes eliminadas en la fase I; '
+                                 'usar artificiales big_m'}
+            d = (fb * direccion)[filas]
+        else:
+            d = np.zeros(len(c))
+            d[:self.variables_originales] = fc * direccion
+        
+        basicas = list(self.basic_vars)
+        factorizacion = FactorizacionLU(columnas(basicas), self.frecuencia_refactorizacion)
+        inicio_artificiales = self.inicio_artificiales()
+        signo = 1.0 if self.tipo == "max" else -1.0
+        segmentos, estado, t, pivotes = [], 'optimo', desde, 0
+        
+        while True:
+            artificiales = np.asarray(basicas, dtype=int) >= inicio_artificiales
+            pasos = np.full(len(basicas), np.inf)
+            if parametro == "b":
+                x = factorizacion.resolver(b + (t - desde) * d)
+                dx = factorizacion.resolver(d)
+                y = factorizacion.resolver_transpuesta(c[basicas])
+                z, pendiente = y @ (b + (t - desde) * d), y @ d
+                # Las básicas no pueden bajar de 0; las artificiales tampoco pueden subir
+                bajan = dx < -1e-10
+                suben = artificiales & (dx > 1e-10)
+                pasos[bajan] = np.maximum(x[bajan], 0.0) / -dx[bajan]
+                pasos[suben] = np.maximum(-x[suben], 0.0) / dx[suben]
+                indice = int(np.argmin(pasos)) if len(pasos) else -1
+            else:
+                x = factorizacion.resolver(b)
+                cb = c[basicas] + (t - desde) * d[basicas]
+                z, pendiente = cb @ x, d[basicas] @ x
+                y = factorizacion.resolver_transpuesta(cb)
+                dy = factorizacion.resolver_transpuesta(d[basicas])
+                costos_reducidos = signo * (c + (t - desde) * d - producto_transpuesto(y))
+                cambios = signo * (d - producto_transpuesto(dy))
+                # Las no básicas (sin artificiales) dejan de ser óptimas cuando su costo reducido pasa de 0
+                candidatas = np.arange(len(c)) < inicio_artificiales
+                candidatas[basicas] = False
+                suben = candidatas & (cambios > 1e-10)
+                pasos = np.full(len(c), np.inf)
+                pasos[suben] = np.maximum(-costos_reducidos[suben], 0.0) / cambios[suben]
+                indice = int(np.argmin(pasos))
+            
+            fin = min(hasta, t + pasos[indice]) if indice != -1 else hasta
+            if fin - t > 1e-9 * max(1.0, abs(t)) or (desde == hasta and not segmentos):
+                segmentos.append({
+                    'desde': round(float(t), 4),
+                    'hasta': round(float(fin), 4),
+                    'z_desde': round(float(z / escala_z + self.constante_objetivo), 4),
+                    'z_hasta': round(float((z + pendiente * (fin - t)) / escala_z + self.constante_objetivo), 4),
+                    'pendiente': round(float(pendiente / escala_z), 4),
+                    'base': [self.obtener_nombre_variable_ordenado(j) for j in basicas]
+                })
+            t = fin
+            if t >= hasta:
+                break
+            if pivotes >= self.max_iteraciones:
+                estado = 'limite_iteraciones'
+                break
+            
+            if parametro == "b":
+                # Pivote dual: sale la básica de la fila indice
+                fila = indice
+                e_r = np.zeros(len(basicas))
+                e_r[fila] = 1.0
+                fila_tableau = producto_transpuesto(factorizacion.resolver_transpuesta(e_r))
+                costos_reducidos = c - producto_transpuesto(y)
+                candidatas = np.arange(len(c)) < inicio_artificiales
+                candidatas[basicas] = False
+                # Una básica que baja sale hacia 0 con αrj < 0; una artificial que sube, con αrj > 0
+                if suben[fila]:
+                    candidatas &= fila_tableau > 1e-10
+                else:
+                    candidatas &= fila_tableau < -1e-10
+                if not candidatas.any():
+                    estado = 'infactible'
+                    break
+                ratios = np.full(len(c), np.inf)
+                ratios[candidatas] = np.abs(costos_reducidos[candidatas] / fila_tableau[candidatas])
+                columna = int(np.argmin(ratios))
+                alpha = factorizacion.resolver(columnas([columna])[:, 0])
+            else:
+                # Pivote primal: entra la columna indice con la prueba del cociente mínimo
+                columna = indice
+                alpha = factorizacion.resolver(columnas([columna])[:, 0])
+                ratios = np.full(len(alpha), np.inf)
+                positivos = alpha > 1e-10
+                ratios[positivos] = np.maximum(x[positivos], 0.0) / alpha[positivos]
+                # Una artificial básica en 0 no puede crecer
+                ratios[artificiales & (alpha < -1e-10)] = 0.0
+                fila = int(np.argmin(ratios))
+                if not np.isfinite(ratios[fila]):
+                    estado = 'no_acotado'
+                    break
+            
+            basicas[fila] = columna
+            pivotes += 1
+            if factorizacion.necesita_refactorizar():
+                factorizacion.refactorizar(columnas(basicas))
+            else:
+                factorizacion.actualizar(fila, alpha)
+        
+        barrido = {
+            'parametro': parametro,
+            'desde': desde,
+            'hasta': hasta,
+            'estado': estado,
+            'pivotes': pivotes,
+            'segmentos': segmentos
+        }
+        if estado != 'optimo':
+            barrido['limite'] = round(float(t), 4)  # Hasta dónde se pudo recorrer
+        return barrido
+    
+    @_fase("serializacion")
+    def obtener_solucion_completa(self, tableaux):
+        """Obtener la solución completa con todos los detalles"""
+        try:
+            num_restricciones = len(self.A)
+            num_variables = len(self.c)
+        
+            valores_basicos = self.obtener_valores_basicos()
+            # Valores en las unidades del modelo sin escalar
+            valores = valores_basicos
+            if self.escala_estandarizada is not None:
+                valores = valores_basicos * self.escala_estandarizada[self.basic_vars]
+            # Con presolve, las variables originales se informan con sus valores reconstruidos
+            x_original = self.valores_postsolve(valores) if self.presolve is not None else None
+            columnas = self.presolve.columnas_conservadas if self.presolve is not None else None
+            
+            # Variables básicas
+            variables_basicas = []
+            for i in range(num_restricciones):
+                var_index = self.basic_vars[i]
+                valor = float(valores[i])
+                if x_original is not None and var_index < self.variables_originales:
+                    valor = float(x_original[columnas[var_index]])
+                var_name = self.obtener_nombre_variable_ordenado(var_index)
+                variables_basicas.append({
+                    'nombre': var_name,
+                    'valor': round(valor, 4)
+                })
+        
+            # Variables no básicas
+            variables_no_basicas = []
+            basicas = set(self.basic_vars)
+            for j in range(num_variables):
+                if j not in basicas:
+                    var_name = self.obtener_nombre_variable_ordenado(j)
+                    valor = 0
+                    if x_original is not None and j < self.variables_originales and x_original[columnas[j]]:
+                        valor = round(float(x_original[columnas[j]]), 4)  # Variable desplazada por el presolve
+                    variables_no_basicas.append({
+                        'nombre': var_name,
+                        'valor': valor
+                    })
+            
+            if x_original is not None:
+                # Las variables que eliminó el presolve van con su valor fijo
+                eliminadas = np.flatnonzero(~self.presolve.columna_activa)
+                variables_no_basicas.extend({'nombre': self.nombre_variable_original(j),
+                                             'valor': round(float(x_original[j]), 4)} for j in eliminadas)
+        
+            # Valor óptimo de Z
+            cb = np.asarray(self.c, dtype=float)[self.basic_vars]
+            if self.escalado is None:
+                z_optimo = cb @ valores_basicos + self.constante_objetivo
+            else:
+                # El costo ±M de las artificiales no lleva kc: cuentan con su valor desescalado
+                artificiales = np.asarray(self.basic_vars, dtype=int) >= self.inicio_artificiales()
+                z_optimo = (cb[~artificiales] @ valores_basicos[~artificiales] / (self.escala_objetivo * self.escala_rhs)
+                            + cb[artificiales] @ valores[artificiales] + self.constante_objetivo)
+        
+            # Convertir pasos_solucion a tipos Python
+            pasos_convertidos = self.convertir_numpy_a_python(self.pasos_solucion)
+        
+            # Añadir los valores de Cj a cada tableau (las iteraciones de la fase I ya traen los suyos)
+            historial = self.campos_historial(tableaux)
+            cj = self.convertir_numpy_a_python(self.c)
+            for tableau in historial['tableaux']:
+                tableau.setdefault('cj', cj)
+        
+            resultado = {
+                'exito': True,
+                'estado': 'optimo',
+                'optimo': True,
+                'variables_basicas': variables_basicas,
+                'variables_no_basicas': variables_no_basicas,
+                'z_optimo': round(float(z_optimo), 4),
+                'tipo_optimizacion': self.tipo,
+                **historial,
+                'pasos_solucion': pasos_convertidos,
+                'es_dual': self.es_dual,
+                'algoritmo': self.algoritmo,
+                'artificiales': self.artificiales,
+                'variables_originales': self.variables_originales,
+                'variables_holgura': self.variables_holgura,
+                'variables_excedente': self.variables_excedente,
+                'variables_artificiales': self.variables_artificiales,
+                'base_final': [self.obtener_nombre_variable_ordenado(j) for j in self.basic_vars],
+                'problema_original': self.problema_original
+            }
+            
+            if self.base_inicial_aplicada is not None:
+                resultado['base_inicial_aplicada'] = self.base_inicial_aplicada
+            if self.restricciones_redundantes:
+                resultado['restricciones_redundantes'] = self.restricciones_redundantes
+                if self.presolve is not None:
+                    # Numeradas como en el problema antes del presolve
+                    resultado['restricciones_redundantes'] = [
+                        int(self.presolve.filas_conservadas[i - 1]) + 1 for i in self.restricciones_redundantes]
+            if self.presolve is not None:
+                resultado['presolve'] = {
+                    **self.presolve.resumen(),
+                    'variables_eliminadas': [self.nombre_variable_original(j) for j in eliminadas]
+                }
+            if self.sensibilidad and self.interrupcion is None:
+                resultado['sensibilidad'] = self.analisis_sensibilidad()
+            if self.parametrico is not None and self.interrupcion is None:
+                resultado['parametrico'] = self.barrido_parametrico()
+            resultado.update(self.metricas_resolucion())
+        
+            return resultado
+        
+        except Exception as e:
+            registro.error("Error en obtener_solucion_completa: %s", e)
+            return {
+                'error': f'Error al obtener solución: {str(e)}',
+                'estado': 'error',
+                'pasos_solucion': self.convertir_numpy_a_python(self.pasos_solucion) if hasattr(self, 'pasos_solucion') else [],
+                'tableaux': [],
+                'problema_original': self.problema_original if hasattr(self, 'problema_original') else {}
+            }
+
+def _error_preparacion(solver, mensaje):
+    return {
+        'error': mensaje,
+        'estado': 'invalido',
+        'pasos_solucion': solver.convertir_numpy_a_python(solver.pasos_solucion) if hasattr(solver, 'pasos_solucion') else [],
+        'problema_original': solver.problema_original if hasattr(solver, 'problema_original') else {}
+    }, 400
+
+
+def preparar_solver(data):
+    """Validar el JSON de /resolver, configurar y estandarizar el problema
+    
+    Devuelve (solver, None) si todo fue bien o (None, (respuesta, código HTTP)) si hubo un error.
+    """
+    solver, error = configurar_solver(data)
+    if error:
+        return None, error
+    
+    error = estandarizar_solver(solver, data)
+    if error:
+        return None, error
+    return solver, None
+
+
+LIMITE_TIEMPO_MS_POR_DEFECTO = float(os.getenv("SIMPLEX_LIMITE_TIEMPO_MS", "0")) or None
+
+
+def configurar_solver(data, traza=None, cancelacion=None):
+    """Validar el JSON de /resolver y parsear el problema, sin estandarizarlo
+    
+    Devuelve (solver, None) o (None, (respuesta, código HTTP)), igual que preparar_solver.
+    traza (ver Estadisticas) y cancelacion (un threading.Event) se pasan al SimplexSolver.
+    """
+    if not data or not isinstance(data, dict):
+        return None, ({'error': 'No se recibieron datos'}, 400)
+    
+    # Entrada matricial: c, A, b y tipos (o sense) en lugar de texto
+    matricial = 'funcion_objetivo' not in data and 'c' in data
+    if matricial:
+        if 'tipos' not in data and 'sense' in data:
+            data = {**data, 'tipos': data['sense']}
+        faltantes = [campo for campo in ('A', 'b', 'tipos') if campo not in data]
+        if faltantes:
+            return None, ({'error': f"Faltan campos de la entrada matricial: {', '.join(faltantes)}"}, 400)
+    
+    elif 'funcion_objetivo' not in data:
+        return None, ({'error': 'Falta la función objetivo'}, 400)
+        
+    if 'tipo_optimizacion' not in data:
+        return None, ({'error': 'Falta el tipo de optimización'}, 400)
+    
+    if not matricial:
+        if 'restricciones' not in data:
+            return None, ({'error': 'Faltan las restricciones'}, 400)
+        
+        # Filtrar restricciones vacías
+        restricciones = [r.strip() for r in data['restricciones'] if r.strip()]
+        
+        if not restricciones:
+            return None, ({'error': 'Debe proporcionar al menos una restricción'}, 400)
+    
+    # El modo disperso usa por defecto el simplex revisado, que no densifica A
+    disperso = bool(data.get('disperso', False))
+    try:
+        solver = SimplexSolver(
+            metodo=data.get('metodo', 'revisado' if disperso else 'tableau'),
+            disperso=disperso,
+            algoritmo=data.get('algoritmo', 'primal'),
+            artificiales=data.get('artificiales', 'big_m'),
+            regla_precio=data.get('regla_precio', 'dantzig'),
+            anticiclado=data.get('anticiclado', 'ninguno'),
+            modo_historial=data.get('modo_historial', 'completo'),
+            ultimos_k=data.get('ultimos_k', 5),
+            formato_historial=data.get('formato_historial', 'json'),
+            traza=traza,
+            cancelacion=cancelacion
+        )
+    except ValueError as e:
+        return None, ({'error': str(e)}, 400)
+    
+    max_iteraciones = data.get('max_iteraciones', data.get('max_iterations'))
+    if max_iteraciones is not None:
+        if isinstance(max_iteraciones, bool) or not isinstance(max_iteraciones, int) or max_iteraciones < 1:
+            return None, ({'error': 'max_iteraciones debe ser un entero positivo'}, 400)
+        solver.max_iteraciones = max_iteraciones
+    
+    # Sin límite en el JSON se usa SIMPLEX_LIMITE_TIEMPO_MS (por ejemplo, el plazo de la plataforma)
+    limite_tiempo_ms = data.get('limite_tiempo_ms', data.get('time_limit_ms', LIMITE_TIEMPO_MS_POR_DEFECTO))
+    if limite_tiempo_ms is not None:
+        if isinstance(limite_tiempo_ms, bool) or not isinstance(limite_tiempo_ms, (int, float)) or not limite_tiempo_ms > 0:
+            return None, ({'error': 'limite_tiempo_ms debe ser un número positivo'}, 400)
+        solver.limite_tiempo_ms = float(limite_tiempo_ms)
+    
+    solver.sensibilidad = bool(data.get('sensibilidad', False))
+    solver.crossover = bool(data.get('crossover', True))
+    
+    try:
+        # Configurar el problema
+        if matricial:
+            solver.configurar_problema_matricial(
+                data['c'], data['A'], data['b'], data['tipos'], data['tipo_optimizacion'],
+                nombres_variables=data.get('nombres_variables'),
+                constante_objetivo=data.get('constante_objetivo', 0.0)
+            )
+        else:
+            solver.configurar_problema(
+                data['funcion_objetivo'].strip(),
+                data['tipo_optimizacion'],
+                restricciones
+            )
+        return solver, None
+        
+    except Exception as solver_error:
+        return None, _error_preparacion(solver, str(solver_error))
+
+
+def estandarizar_solver(solver, data):
+    """Aplicar la dualidad, el barrido paramétrico, el presolve, el escalado, estandarizar y la base inicial pedidas
+    en el JSON; devuelve el error como (respuesta, código HTTP) o None"""
+    try:
+        # La base inicial nombra columnas y filas del modelo completo
+        if data.get('presolve', False) and data.get('base_inicial'):
+            return _error_preparacion(solver, 'base_inicial no es compatible con presolve')
+        # Los rangos de las filas y columnas que elimina el presolve no salen de la base reducida
+        if data.get('presolve', False) and data.get('sensibilidad', False):
+            return _error_preparacion(solver, 'sensibilidad no es compatible con presolve')
+        if data.get('presolve', False) and data.get('parametrico'):
+            return _error_preparacion(solver, 'parametrico no es compatible con presolve')
+        # El punto interior elige su propia base y, sin crossover, no termina en ninguna
+        if solver.metodo == "punto_interior" and data.get('base_inicial'):
+            return _error_preparacion(solver, 'base_inicial no es compatible con punto_interior')
+        if solver.metodo == "punto_interior" and not solver.crossover and (solver.sensibilidad or data.get('parametrico')):
+            return _error_preparacion(solver, 'sensibilidad y parametrico necesitan crossover con punto_interior')
+        
+        # Aplicar dualidad si se solicita
+        if data.get('aplicar_dualidad', False):
+            solver.aplicar_dualidad()
+        
+        # El barrido paramétrico se refiere al modelo que se resuelve (el dual si se aplicó)
+        parametrico = data.get('parametrico')
+        if parametrico:
+            if not isinstance(parametrico, dict):
+                return _error_preparacion(solver, 'parametrico debe ser un objeto JSON')
+            solver.configurar_parametrico(parametrico.get('parametro'), parametrico.get('direccion'),
+                                          parametrico.get('desde', 0.0), parametrico.get('hasta'))
+        
+        if data.get('presolve', False):
+            solver.aplicar_presolve()
+            if solver.presolve.estado is not None:
+                return None  # resolver() devuelve el resultado sin estandarizar
+        
+        if data.get('escalado', 'ninguno') != 'ninguno':
+            solver.aplicar_escalado(data['escalado'])
+        
+        # Estandarizar
+        if not solver.estandarizar():
+            return _error_preparacion(solver, 'Error al estandarizar el problema')
+        
+        # Arrancar desde una base previa si se envía (por ejemplo, la base_final de otra solución)
+        if data.get('base_inicial'):
+            base = data['base_inicial']
+            if not isinstance(base, list) or not all(
+                    isinstance(var, str) or (isinstance(var, int) and not isinstance(var, bool)) for var in base):
+                return _error_preparacion(solver, 'base_inicial debe ser una lista de nombres (o índices) de variables')
+            solver.aplicar_base_inicial(base)
+        
+        return None
+        
+    except Exception as solver_error:
+        return _error_preparacion(solver, str(solver_error))
+
+
+# Campos del JSON que describen el problema o que no cambian la solución; el resto son
+# opciones que cambian la respuesta
+CAMPOS_PROBLEMA = ('funcion_objetivo', 'tipo_optimizacion', 'restricciones', 'c', 'A', 'b', 'tipos', 'sense',
+                   'nombres_variables', 'constante_objetivo', 'cache', 'estadisticas', 'limite_tiempo_ms',
+                   'time_limit_ms')
+
+# Resultados que dependen del reloj o de una cancelación y no se guardan en la caché
+ESTADOS_NO_CACHEABLES = ('limite_tiempo', 'cancelado')
+
+
+def huella_problema(solver, data):
+    """SHA-256 de la forma canónica del problema recién parseado (c, A, b, tipos, tipo de
+    optimización y dualidad) junto con las opciones de resolución del JSON
+    
+    Dos peticiones que escriben el mismo modelo de forma distinta (orden de los términos,
+    espacios, coeficientes repetidos) comparten huella.
+    """
+    opciones = {clave: valor for clave, valor in data.items() if clave not in CAMPOS_PROBLEMA}
+    opciones['aplicar_dualidad'] = bool(opciones.get('aplicar_dualidad', False))
+    cabecera = {
+        'tipo': solver.tipo,
+        'tipos': list(solver.tipos_restricciones),
+        'nombres': solver.nombres_variables,
+        'constante': solver.constante_objetivo,
+        'forma': [len(solver.b), solver.variables_originales],
+        'opciones': opciones
+    }
+    huella = hashlib.sha256(json.dumps(cabecera, sort_keys=True, default=str).encode())
+    
+    if isinstance(solver.A, MatrizDispersa):
+        # El CSC que se construye al configurar es canónico (ordenado y sin repetidos)
+        arreglos = (solver.c, solver.A.datos, solver.A.indices, solver.A.indptr, solver.b)
+    else:
+        arreglos = (solver.c, solver.A, solver.b)
+    for arreglo in arreglos:
+        # + 0.0 unifica -0.0 y 0.0
+        huella.update(np.ascontiguousarray(np.asarray(arreglo, dtype='<f8') + 0.0).tobytes())
+    return huella.hexdigest()
+
+
+class CacheResultados:
+    """Caché LRU de respuestas de /resolver con caducidad, opcionalmente respaldada en disco
+    
+    En memoria se guarda el JSON serializado de cada respuesta; se expulsan las menos usadas
+    al superar max_entradas o max_bytes. Con un directorio, cada respuesta también se escribe
+    en <huella>.json para compartirla entre procesos y workers; al pasar de max_archivos se
+    borran los archivos caducados y los más antiguos. La caducidad se mide siempre desde que
+    se resolvió el problema (la fecha del archivo), aunque la entrada pase del disco a memoria.
+    """
+    
+    def __init__(self, max_entradas=256, max_bytes=64 * 1024 * 1024, ttl=3600, directorio=None,
+                 max_archivos=1024):
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.ttl = ttl  # Segundos; None para no caducar
+        self.directorio = directorio
+        self.max_archivos = max_archivos
+        self.entradas = OrderedDict()  # huella -> (instante de guardado, JSON)
+        self.bytes = 0
+        self.aciertos = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self.cerrojo = threading.Lock()
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+    
+    @classmethod
+    def desde_entorno(cls):
+        """Caché configurada con SIMPLEX_CACHE_ENTRADAS, SIMPLEX_CACHE_BYTES, SIMPLEX_CACHE_TTL,
+        SIMPLEX_CACHE_DIR y SIMPLEX_CACHE_ARCHIVOS; None si SIMPLEX_CACHE_ENTRADAS es 0"""
+        max_entradas = int(os.getenv("SIMPLEX_CACHE_ENTRADAS", "256"))
+        if max_entradas <= 0:
+            return None
+        ttl = float(os.getenv("SIMPLEX_CACHE_TTL", "3600"))
+        return cls(
+            max_entradas=max_entradas,
+            max_bytes=int(os.getenv("SIMPLEX_CACHE_BYTES", str(64 * 1024 * 1024))),
+            ttl=ttl if ttl > 0 else None,
+            directorio=os.getenv("SIMPLEX_CACHE_DIR") or None,
+            max_archivos=max(1, int(os.getenv("SIMPLEX_CACHE_ARCHIVOS", "1024")))
+        )
+    
+    def caducada(self, instante):
+        return self.ttl is not None and time.time() - instante > self.ttl
+    
+    def ruta(self, huella):
+        return os.path.join(self.directorio, f"{huella}.json")
+    
+    def obtener(self, huella):
+        """Respuesta guardada para la huella (un dict nuevo en cada llamada) o None"""
+        with self.cerrojo:
+            entrada = self.entradas.get(huella)
+            if entrada is not None and self.caducada(entrada[0]):
+                self.quitar(huella)
+                entrada = None
+            if entrada is not None:
+                self.entradas.move_to_end(huella)
+                self.aciertos += 1
+                return json.loads(entrada[1])
+        
+        guardado = self.leer_disco(huella)
+        with self.cerrojo:
+            if guardado is None:
+                self.fallos += 1
+                return None
+            self.aciertos += 1
+            self.aciertos_disco += 1
+            # Con el instante del archivo: leerla no le da un TTL nuevo
+            self.insertar(huella, *guardado)
+        return json.loads(guardado[1])
+    
+    def guardar(self, huella, resultado):
+        texto = json.dumps(resultado)
+        instante = time.time()
+        with self.cerrojo:
+            self.insertar(huella, instante, texto)
+        if self.directorio:
+            # Escritura atómica para que otro worker nunca lea un archivo a medias
+            temporal = f"{self.ruta(huella)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporal, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+            os.replace(temporal, self.ruta(huella))
+            self.podar_disco()
+    
+    def leer_disco(self, huella):
+        """(instante de guardado, JSON) del archivo de la huella o None si no está o caducó"""
+        if not self.directorio:
+            return None
+        ruta = self.ruta(huella)
+        try:
+            instante = os.path.getmtime(ruta)
+            if self.caducada(instante):
+                os.remove(ruta)
+                return None
+            with open(ruta, encoding="utf-8") as archivo:
+                return instante, archivo.read()
+        except OSError:
+            return None
+    
+    def podar_disco(self):
+        """Si el directorio pasa de max_archivos, borrar los caducados y luego los más antiguos"""
+        try:
+            archivos = [entrada for entrada in os.scandir(self.directorio) if entrada.name.endswith(".json")]
+        except OSError:
+            return
+        if len(archivos) <= self.max_archivos:
+            return
+        fechas = []
+        for entrada in archivos:
+            try:
+                fechas.append((entrada.stat().st_mtime, entrada.path))
+            except OSError:
+                pass  # Otro worker ya lo borró
+        fechas.sort()
+        sobrantes = len(fechas) - self.max_archivos
+        for k, (instante, ruta) in enumerate(fechas):
+            if k >= sobrantes and not self.caducada(instante):
+                break
+            try:
+                os.remove(ruta)
+            except OSError:
+                pass
+    
+    def insertar(self, huella, instante, texto):
+        if huella in self.entradas:
+            self.quitar(huella)
+        if len(texto) > self.max_bytes:
+            return
+        self.entradas[huella] = (instante, texto)
+        self.bytes += len(texto)
+        while len(self.entradas) > self.max_entradas or self.bytes > self.max_bytes:
+            self.quitar(next(iter(self.entradas)))
+            self.expulsiones += 1
+    
+    def quitar(self, huella):
+        _, texto = self.entradas.pop(huella)
+        self.bytes -= len(texto)
+    
+    def limpiar(self):
+        """Vaciar la memoria y el directorio (los contadores se conservan)"""
+        with self.cerrojo:
+            self.entradas.clear()
+            self.bytes = 0
+        if self.directorio:
+            for nombre in os.listdir(self.directorio):
+                if nombre.endswith(".json"):
+                    try:
+                        os.remove(os.path.join(self.directorio, nombre))
+                    except OSError:
+                        pass
+    
+    def estadisticas(self):
+        with self.cerrojo:
+            consultas = self.aciertos + self.fallos
+            return {
+                'aciertos': self.aciertos,
+                'aciertos_disco': self.aciertos_disco,
+                'fallos': self.fallos,
+                'tasa_aciertos': round(self.aciertos / consultas, 4) if consultas else None,
+                'expulsiones': self.expulsiones,
+                'entradas': len(self.entradas),
+                'bytes': self.bytes,
+                'max_entradas': self.max_entradas,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'directorio': self.directorio,
+                'max_archivos': self.max_archivos
+            }
+
+
+CACHE_RESULTADOS = CacheResultados.desde_entorno()
+
+
+def _agregar_estadisticas(resultado, solver, data):
+    """Con "estadisticas": true en el JSON, añadir los tiempos por fase y los contadores"""
+    if data.get('estadisticas', False):
+        resultado['estadisticas'] = solver.estadisticas.exportar()
+    return resultado
+
+
+def resolver_desde_datos(data, traza=None, metricas=None, cancelacion=None):
+    """Resolver un problema a partir del JSON de /resolver; devuelve (resultado, código HTTP)
+    
+    La huella se calcula tras el parseo, así que un acierto en CACHE_RESULTADOS se ahorra la
+    dualidad, la estandarización y la resolución. "cache": false en el JSON la desactiva.
+    Con metricas (una metricas.MetricasResolucion) se registra el resultado de la petición;
+    cancelacion es un threading.Event que detiene la resolución antes del siguiente pivote.
+    """
+    solver, resultado, codigo = _resolver_datos(data, traza, cancelacion)
+    if metricas is not None:
+        metricas.registrar_resolucion(resultado, solver)
+    return resultado, codigo
+
+
+def _resolver_datos(data, traza, cancelacion):
+    """resolver_desde_datos devolviendo también el solver (None si la entrada no es válida)"""
+    solver, error = configurar_solver(data, traza, cancelacion)
+    if error:
+        return (None, *error)
+    
+    huella = None
+    if CACHE_RESULTADOS is not None and data.get('cache', True):
+        huella = huella_problema(solver, data)
+        resultado = CACHE_RESULTADOS.obtener(huella)
+        if resultado is not None:
+            resultado['desde_cache'] = True
+            return solver, _agregar_estadisticas(resultado, solver, data), 400 if 'error' in resultado else 200
+    
+    error = estandarizar_solver(solver, data)
+    if error:
+        return (solver, *error)
+    
+    resultado = solver.resolver()
+    if huella is not None and resultado.get('estado') not in ESTADOS_NO_CACHEABLES:
+        CACHE_RESULTADOS.guardar(huella, resultado)
+    return solver, _agregar_estadisticas(resultado, solver, data), 400 if 'error' in resultado else 200
+
+
+def resolver_apilado(solvers):
+    """Resolver a la vez varios problemas estandarizados cuyos tableaux tienen la misma forma
+    
+    Los K tableaux se apilan en un arreglo (K, m+1, n+1) y cada iteración pivotea todos los
+    problemas que siguen activos. Las reglas de pivoteo y las tolerancias son las mismas de
+    resolver(), por lo que cada resultado coincide con el que se obtiene resolviéndolo solo.
+    El kernel solo anota los pivotes; el historial, los nombres y los contadores de cada
+    problema se construyen después, y solo para las iteraciones que conserva su modo de
+    historial. Los problemas que detectan un ciclo (pasan a Bland) o llegan al límite de
+    iteraciones siguen solos desde su tableau apilado. Cada solver cuenta como resolución
+    su parte (1/K) del kernel compartido más lo que tarda su propio cierre.
+    """
+    T = np.stack([solver.tableau for solver in solvers])
+    bases_iniciales = [list(solver.basic_vars) for solver in solvers]
+    historiales = [solver.nuevo_historial() for solver in solvers]
+    
+    inicio = time.perf_counter()
+    pivotes, bloques, salidas = _pivotear_apilados(solvers, T, historiales)
+    cuota = (time.perf_counter() - inicio) / len(solvers)
+    
+    resultados = []
+    for k, solver in enumerate(solvers):
+        # tiempo_resolucion_ms también cuenta solo la parte del kernel de este problema
+        solver.inicio_resolucion = time.perf_counter() - cuota
+        solver.estadisticas.agregar("resolucion", cuota)
+        with solver.estadisticas.fase("resolucion"):
+            resultados.append(_cerrar_apilado(solver, historiales[k], T[k], bases_iniciales[k], pivotes[k],
+                                              bloques, salidas[k]))
+    return resultados
+
+
+def _pivotear_apilados(solvers, T, historiales):
+    """Bucle de pivoteo de resolver_apilado sobre el arreglo apilado T
+    
+    Dentro del bucle solo se trabaja con arreglos: de cada iteración se guardan los problemas
+    pivoteados, la fila, la columna y la variable saliente de cada uno y si su tableau quedó
+    óptimo; el bloque de tableaux pivoteados solo si algún historial guarda los intermedios.
+    Solo los pivotes degenerados pasan por vigilar_ciclo.
+    
+    Devuelve los pivotes de cada problema como (filas, columnas, salientes, óptimos,
+    posiciones en el bloque de cada iteración), los bloques y cómo salió cada problema del
+    kernel: None si terminó, 'no_acotado', o 'pendiente' si debe seguir solo.
+    """
+    num_restricciones = len(solvers[0].A)
+    num_variables = len(solvers[0].c)
+    limites = np.array([solver.max_iteraciones for solver in solvers])
+    
+    for solver, historial in zip(solvers, historiales):
+        solver.interrupcion = None
+        solver.iteracion = 0
+        solver.iniciar_anticiclado()
+        solver.registrar_tableau(historial)
+    
+    # Con el signo, MIN se trata como MAX al elegir la columna entrante
+    signos = np.array([1.0 if solver.tipo == "max" else -1.0 for solver in solvers])
+    bases = np.array([solver.basic_vars for solver in solvers], dtype=int).reshape(len(solvers), -1)
+    en_racha = np.zeros(len(solvers), dtype=bool)  # Con bases en la racha degenerada actual
+    guardar_bloques = any(historial.necesita_tableaux() for historial in historiales)
+    salidas = [None] * len(solvers)
+    registro_pivotes, bloques = [], []
+    
+    # Se pivotea en el sitio sobre W; las filas de los problemas que salen se copian a T y W solo
+    # se compacta cuando son mayoría, para no copiar todo el bloque en cada iteración
+    W = T
+    problema_de_fila = np.arange(len(solvers))
+    vivas = np.ones(len(solvers), dtype=bool)
+    filas_restricciones = np.arange(num_restricciones)
+    iteracion = 0
+    
+    def retirar(filas_w):
+        if W is not T:
+            T[problema_de_fila[filas_w]] = W[filas_w]
+        vivas[filas_w] = False
+    
+    while vivas.any():
+        if 2 * np.count_nonzero(vivas) < len(W):
+            W, problema_de_fila = W[vivas], problema_de_fila[vivas]
+            vivas = np.ones(len(W), dtype=bool)
+        filas_w = np.flatnonzero(vivas)
+        activos = problema_de_fila[filas_w]
+        
+        # Columna pivote de cada problema (primer índice en caso de empate)
+        fila_z = W[filas_w, num_restricciones, :num_variables] * signos[activos, None]
+        cols = np.argmax(fila_z, axis=1)
+        continuan = fila_z[np.arange(activos.size), cols] > 1e-10
+        retirar(filas_w[~continuan])
+        filas_w, activos, cols = filas_w[continuan], activos[continuan], cols[continuan]
+        if not activos.size:
+            break
+        # resolver() marca el límite después de comprobar el óptimo: siguen solos
+        agotados = iteracion >= limites[activos]
+        for k in activos[agotados]:
+            salidas[k] = 'pendiente'
+        retirar(filas_w[agotados])
+        filas_w, activos, cols = filas_w[~agotados], activos[~agotados], cols[~agotados]
+        if not activos.size:
+            break
+        iteracion += 1
+        
+        # Prueba del cociente mínimo con máscara por problema
+        columnas = W[filas_w[:, None], filas_restricciones[None, :], cols[:, None]]
+        bi = W[filas_w, :num_restricciones, num_variables]
+        ratios = np.full(columnas.shape, np.inf)
+        positivos = columnas > 1e-10
+        ratios[positivos] = bi[positivos] / columnas[positivos]
+        ratios[ratios < -1e-10] = np.inf
+        filas = np.argmin(ratios, axis=1)
+        
+        acotados = np.isfinite(ratios[np.arange(activos.size), filas])
+        for k in activos[~acotados]:
+            salidas[k] = 'no_acotado'
+        retirar(filas_w[~acotados])
+        filas_w, activos, cols, filas = filas_w[acotados], activos[acotados], cols[acotados], filas[acotados]
+        if not activos.size:
+            break
+        
+        # Pivote degenerado: sale una básica que ya vale cero (cociente mínimo nulo)
+        degenerados = bi[acotados][np.arange(activos.size), filas] <= 1e-10
+        salientes = bases[activos, filas]
+        bases[activos, filas] = cols
+        
+        # Pivoteo simultáneo: actualización de rango 1 sobre todo W; las filas que ya salieron
+        # se dividen entre 1 y se les resta 0
+        todas = np.arange(len(W))
+        fila_pivote = np.zeros(len(W), dtype=int)
+        fila_pivote[filas_w] = filas
+        col_pivote = np.zeros(len(W), dtype=int)
+        col_pivote[filas_w] = cols
+        divisores = np.ones(len(W))
+        divisores[filas_w] = W[filas_w, filas, cols]
+        W[todas, fila_pivote, :] /= divisores[:, None]
+        factores = W[todas, :, col_pivote]
+        factores[todas, fila_pivote] = 0.0
+        factores[~vivas] = 0.0
+        W -= factores[:, :, None] * W[todas, fila_pivote, :][:, None, :]
+        
+        # es_optimo() de cada tableau pivoteado, para su entrada del historial
+        optimos = (~np.any(W[filas_w, num_restricciones, :num_variables] * signos[activos, None] > 1e-10, axis=1)
+                   & ~np.any(W[filas_w, :num_restricciones, num_variables] < -1e-10, axis=1))
+        registro_pivotes.append((activos, filas, cols, salientes, optimos, np.arange(activos.size)))
+        if guardar_bloques:
+            bloques.append(W[filas_w])  # Copia: el indexado avanzado no devuelve una vista
+        
+        for k in activos[~degenerados & en_racha[activos]]:
+            solvers[k].bases_degeneradas.clear()
+        en_racha[activos] = degenerados
+        ciclos = []
+        for fila_w, k in zip(filas_w[degenerados], activos[degenerados]):
+            solver = solvers[k]
+            solver.iteracion = iteracion
+            solver.basic_vars = bases[k].tolist()
+            solver.vigilar_ciclo(True)
+            if solver.ciclo_detectado is not None:
+                # vigilar_ciclo pasó a Bland, que el kernel no aplica: sigue solo
+                salidas[k] = 'pendiente'
+                ciclos.append(fila_w)
+        retirar(np.asarray(ciclos, dtype=int))
+    
+    # Pivotes de cada problema en orden de iteración: la iteración i de un problema es la
+    # i-ésima global, porque un problema pivotea en todas hasta que sale del kernel
+    if registro_pivotes:
+        problemas, *campos = (np.concatenate(columna) for columna in zip(*registro_pivotes))
+        orden = np.argsort(problemas, kind="stable")
+        cortes = np.cumsum(np.bincount(problemas, minlength=len(solvers)))[:-1]
+        pivotes = list(zip(*(np.split(campo[orden], cortes) for campo in campos)))
+    else:
+        vacio = np.zeros(0, dtype=int)
+        pivotes = [(vacio,) * 5] * len(solvers)
+    return pivotes, bloques, salidas
+
+
+def _cerrar_apilado(solver, historial, tableau, base_inicial, pivotes, bloques, salida):
+    """Completar un problema tras el kernel apilado: historial, contadores y resultado"""
+    filas, columnas, salientes, optimos, posiciones = pivotes
+    num_pivotes = len(filas)
+    traza = solver.estadisticas.traza is not None
+    conservadas = historial.conservadas()
+    # Las entradas que el historial descartaría no se construyen (salvo si el problema sigue solo)
+    desde = 0 if conservadas is None or salida == 'pendiente' else max(0, num_pivotes - conservadas)
+    
+    base = list(base_inicial)
+    solver.basic_vars = base
+    for i, (fila_pivote, col_pivote, saliente) in enumerate(zip(filas.tolist(), columnas.tolist(),
+                                                                 salientes.tolist())):
+        base[fila_pivote] = col_pivote
+        solver.iteracion = i + 1
+        if i < desde and not traza:
+            historial.registrar_pivote(i + 1, fila_pivote, col_pivote)
+            continue
+        
+        var_entrante = solver.obtener_nombre_variable_ordenado(col_pivote)
+        var_saliente = solver.obtener_nombre_variable_ordenado(saliente)
+        if traza:
+            solver.registrar_pivote(fila_pivote, col_pivote, var_entrante, var_saliente)
+        if i < desde:
+            historial.registrar_pivote(i + 1, fila_pivote, col_pivote)
+            continue
+        # El tableau de la última iteración es el del problema en T; los anteriores, de su bloque
+        solver.tableau = tableau if i == num_pivotes - 1 or not bloques else bloques[i][posiciones[i]]
+        historial.registrar(solver, {
+            'col_pivote': col_pivote,
+            'fila_pivote': fila_pivote,
+            'var_entrante': var_entrante,
+            'var_saliente': var_saliente
+        }, es_optimo=bool(optimos[i]))
+    if num_pivotes and not traza:
+        solver.estadisticas.contar('pivotes', num_pivotes)
+    
+    # Cada solver se queda con una copia propia de su tableau final
+    solver.tableau = tableau.copy()
+    solver.iteracion = num_pivotes
+    if salida == 'no_acotado':
+        solver.iteracion += 1
+        return solver.resultado_error('Problema no acotado', historial)
+    if salida == 'pendiente':
+        error = solver.pivotear_tableau(historial)
+        if error:
+            return error
+    return solver.finalizar_tableau(historial)
+
+
+def _resolver_bloque(inicio, problemas, apilar=True):
+    """Resolver un bloque contiguo de problemas dentro de un proceso del pool
+    
+    Con apilar=True los problemas del bloque con tableaux de la misma forma se
+    resuelven juntos con resolver_apilado.
+    """
+    resultados = [None] * len(problemas)
+    solvers = [None] * len(problemas)
+    grupos = {}
+    for k, data in enumerate(problemas):
+        try:
+            solver, error = preparar_solver(data)
+        except Exception as e:
+            solver, error = None, ({'error': f'Error interno del servidor: {str(e)}', 'estado': 'error'}, 500)
+        
+        if error:
+            resultados[k] = error[0]
+            continue
+        solvers[k] = solver
+        if apilar and solver.puede_apilarse():
+            grupos.setdefault(solver.tableau.shape, []).append((k, solver))
+        else:
+            resultados[k] = solver.resolver()
+    
+    for miembros in grupos.values():
+        if len(miembros) == 1:
+            k, solver = miembros[0]
+            resultados[k] = solver.resolver()
+            continue
+        try:
+            resueltos = resolver_apilado([solver for _, solver in miembros])
+        except Exception as e:
+            resueltos = [{'error': f'Error al resolver: {str(e)}', 'estado': 'error'} for _ in miembros]
+        for (k, _), resultado in zip(miembros, resueltos):
+            resultados[k] = resultado
+    
+    for k, solver in enumerate(solvers):
+        if solver is not None:
+            _agregar_estadisticas(resultados[k], solver, problemas[k])
+    return [(inicio + k, resultado) for k, resultado in enumerate(resultados)]
+
+
+_pool_procesos = None
+
+
+def _obtener_pool():
+    """Pool único de _procesos_por_defecto() workers, compartido por todos los lotes para no
+    pagar el arranque de procesos en cada uno"""
+    global _pool_procesos
+    if _pool_procesos is None:
+        # Importar el pool cuesta varios ms (multiprocessing); solo se paga al usarlo
+        from concurrent.futures import ProcessPoolExecutor
+        _pool_procesos = ProcessPoolExecutor(max_workers=_procesos_por_defecto())
+    return _pool_procesos
+
+
+def _procesos_por_defecto():
+    return max(1, int(os.getenv("SIMPLEX_PROCESOS", os.cpu_count() or 1)))
+
+
+def resolver_lote_iterativo(problemas, procesos=None, apilar=True):
+    """Resolver varios problemas y producir (índice, resultado) a medida que terminan
+    
+    procesos se limita a SIMPLEX_PROCESOS (o al número de CPUs), que es el tamaño del pool.
+    """
+    problemas = list(problemas)
+    procesos = min(max(1, int(procesos or _procesos_por_defecto())), _procesos_por_defecto())
+    
+    if procesos == 1 or len(problemas) <= 1:
+        yield from _resolver_bloque(0, problemas, apilar)
+        return
+    
+    from concurrent.futures import as_completed
+    
+    # Se envían bloques para repartir el costo de comunicación entre procesos
+    tamano_bloque = max(1, len(problemas) // (procesos * 4))
+    pool = _obtener_pool()
+    futuros = [
+        pool.submit(_resolver_bloque, inicio, problemas[inicio:inicio + tamano_bloque], apilar)
+        for inicio in range(0, len(problemas), tamano_bloque)
+    ]
+    for futuro in as_completed(futuros):
+        yield from futuro.result()
+
+
+def resolver_lote(problemas, procesos=None, apilar=True):
+    """Resolver varios problemas en un pool de procesos; los resultados se devuelven en orden"""
+    problemas = list(problemas)
+    resultados = [None] * len(problemas)
+    for indice, resultado in resolver_lote_iterativo(problemas, procesos, apilar):
+        resultados[indice] = resultado
+    return resultados
+
+
+def resolver_modelo(modelo, opciones=None, traza=None, metricas=None):
+    """Resolver un modelo de lector_modelos con las opciones de /resolver; devuelve (resultado, código HTTP)"""
+    # Los modelos de archivo suelen ser grandes y dispersos: por defecto no se densifica A
+    datos = {'disperso': True, **(opciones or {})}
+    datos.update({clave: valor for clave, valor in modelo.items() if clave != 'modelo'})
+    resultado, codigo = resolver_desde_datos(datos, traza, metricas)
+    resultado['modelo'] = modelo['modelo']
+    return resultado, codigo
+
+
+CAMPOS_DETALLE = ('tableaux', 'historial', 'pasos_solucion', 'problema_original')
+
+
+def resumir_resultado(resultado):
+    """Quitar del resultado los campos pensados para la interfaz (tableaux, pasos, ...)"""
+    for clave in CAMPOS_DETALLE:
+        resultado.pop(clave, None)
+    return resultado
+
+
+def _problemas_de_archivo(ruta):
+    """Producir (origen, clase, contenido) por cada problema de un archivo o de stdin ('-')
+    
+    clase es 'json' (datos de /resolver), 'modelo' (resultado de leer_modelo) o 'error'.
+    .json tiene un problema, una lista o {"problemas": [...]}; .mps y .lp (con o sin .gz) se
+    leen con lector_modelos; cualquier otro archivo se trata como NDJSON (un problema por línea).
+    """
+    nombre = ruta.lower()[:-3] if ruta.lower().endswith(".gz") else ruta.lower()
+    if nombre.endswith((".mps", ".lp")):
+        from lector_modelos import leer_archivo
+        try:
+            yield ruta, 'modelo', leer_archivo(ruta)
+        except (OSError, ValueError) as e:
+            yield ruta, 'error', f'Error al leer el modelo: {str(e)}'
+        return
+    
+    if ruta != "-" and nombre.endswith(".json"):
+        try:
+            with open(ruta, encoding="utf-8") as archivo:
+                contenido = json.load(archivo)
+        except (OSError, ValueError) as e:
+            yield ruta, 'error', f'Error al leer {ruta}: {str(e)}'
+            return
+        if isinstance(contenido, dict) and isinstance(contenido.get('problemas'), list):
+            contenido = contenido['problemas']
+        problemas = contenido if isinstance(contenido, list) else [contenido]
+        for k, problema in enumerate(problemas):
+            yield f"{ruta}[{k}]", 'json', problema
+        return
+    
+    archivo = sys.stdin if ruta == "-" else open(ruta, encoding="utf-8")
+    try:
+        for numero_linea, linea in enumerate(archivo, 1):
+            if not linea.strip():
+                continue
+            origen = f"{'stdin' if ruta == '-' else ruta}:{numero_linea}"
+            try:
+                problema = json.loads(linea)
+            except ValueError as e:
+                yield origen, 'error', f'JSON no válido: {str(e)}'
+                continue
+            yield origen, 'json', problema
+    finally:
+        if archivo is not sys.stdin:
+            archivo.close()
+
+
+def _resolver_entrada(clase, contenido, opciones, traza=None):
+    if clase == 'error':
+        return {'error': contenido}
+    if clase == 'modelo':
+        return resolver_modelo(contenido, opciones, traza)[0]
+    if not isinstance(contenido, dict):
+        return {'error': 'Cada problema debe ser un objeto JSON'}
+    try:
+        return resolver_desde_datos({**opciones, **contenido}, traza)[0]
+    except Exception as e:
+        return {'error': f'Error interno del servidor: {str(e)}'}
+
+
+def main(argumentos=None):
+    """CLI: resolver problemas de archivos o de stdin y escribir una línea NDJSON por problema"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Resolver problemas de programación lineal con el método Simplex")
+    parser.add_argument("archivos", nargs="*", default=["-"],
+                        help="NDJSON, .json, .mps o .lp (con o sin .gz); '-' o nada lee NDJSON de stdin")
+    parser.add_argument("--opciones", default="{}",
+                        help="JSON con opciones de /resolver que se aplican a todos los problemas")
+    parser.add_argument("--procesos", type=int, default=1,
+                        help="Resolver los problemas JSON en un pool de procesos (lee toda la entrada primero)")
+    parser.add_argument("--completo", action="store_true",
+                        help="Incluir tableaux, pasos y problema original en la salida")
+    parser.add_argument("--detalle", action="store_true",
+                        help="Escribir en stderr los mensajes de depuración del solver (por defecto solo avisos)")
+    parser.add_argument("--traza", metavar="ARCHIVO",
+                        help="Escribir en ARCHIVO una línea NDJSON por fase y por pivote de cada problema")
+    parser.add_argument("--tiempos", action="store_true",
+                        help="Escribir en stderr el tiempo de arranque y la sobrecarga por problema")
+    args = parser.parse_args(argumentos)
+    try:
+        opciones = json.loads(args.opciones)
+    except ValueError:
+        parser.error("--opciones debe ser un JSON válido")
+    if not isinstance(opciones, dict):
+        parser.error("--opciones debe ser un objeto JSON")
+    if args.procesos < 1:
+        parser.error("--procesos debe ser un entero positivo")
+    if args.traza and args.procesos > 1:
+        parser.error("--traza no se puede combinar con --procesos")
+    logging.basicConfig(stream=sys.stderr, level=logging.DEBUG if args.detalle else logging.WARNING,
+                        format="%(levelname)s %(name)s: %(message)s")
+    
+    inicio = time.perf_counter()
+    resueltos = 0
+    errores = 0
+    tiempo_solver_ms = 0.0
+    
+    def escribir(indice, origen, resultado):
+        nonlocal resueltos, errores, tiempo_solver_ms
+        resueltos += 1
+        errores += 'error' in resultado
+        tiempo_solver_ms += resultado.get('tiempo_resolucion_ms') or 0.0
+        if not args.completo:
+            resumir_resultado(resultado)
+        linea = {'indice': indice, 'origen': origen, 'resultado': resultado}
+        sys.stdout.write(json.dumps(linea, ensure_ascii=False, default=str) + "\n")
+        sys.stdout.flush()
+    
+    entradas = (entrada for ruta in args.archivos for entrada in _problemas_de_archivo(ruta))
+    archivo_traza = open(args.traza, "w", encoding="utf-8") if args.traza else None
+    try:
+        if args.procesos > 1:
+            # Los errores de lectura y los modelos MPS/LP se resuelven aquí; el resto va al pool
+            entradas = list(entradas)
+            lote = [k for k, (_, clase, contenido) in enumerate(entradas)
+                    if clase == 'json' and isinstance(contenido, dict)]
+            resultados = resolver_lote([{**opciones, **entradas[k][2]} for k in lote], args.procesos)
+            por_indice = dict(zip(lote, resultados))
+        else:
+            por_indice = {}
+        
+        for indice, (origen, clase, contenido) in enumerate(entradas):
+            if indice in por_indice:
+                resultado = por_indice[indice]
+            else:
+                traza = None
+                if archivo_traza is not None:
+                    traza = lambda evento, indice=indice: archivo_traza.write(
+                        json.dumps({'indice': indice, **evento}, ensure_ascii=False) + "\n")
+                resultado = _resolver_entrada(clase, contenido, opciones, traza)
+            escribir(indice, origen, resultado)
+    finally:
+        if archivo_traza is not None:
+            archivo_traza.close()
+    
+    if args.tiempos:
+        total_ms = (time.perf_counter() - inicio) * 1000
+        sobrecarga = (total_ms - tiempo_solver_ms) / resueltos if resueltos else 0.0
+        print(f"Arranque (importar simplex): {(_FIN_IMPORTACION - _INICIO_IMPORTACION) * 1000:.1f} ms; "
+              f"{resueltos} problemas en {total_ms:.1f} ms, {tiempo_solver_ms:.1f} ms resolviendo; "
+              f"sobrecarga {sobrecarga:.2f} ms/problema", file=sys.stderr)
+    return 1 if errores else 0
+
+
+_FIN_IMPORTACION = time.perf_counter()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+import os
+import sys
+
+# Los módulos del solver están en la raíz del repositorio, sin paquete instalable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Problemas pequeños con óptimo conocido: (datos de /resolver, estado, z esperado)
+PROBLEMAS = {
+    'clasico': (dict(funcion_objetivo='3x1 + 5x2', tipo_optimizacion='max',
+                     restricciones=['x1 <= 4', '2x2 <= 12', '3x1 + 2x2 <= 18']), 'optimo', 36.0),
+    # Klee-Minty en 3 dimensiones: Dantzig recorre los 8 vértices del cubo deformado
+    'klee_minty': (dict(funcion_objetivo='100x1 + 10x2 + x3', tipo_optimizacion='max',
+                        restricciones=['x1 <= 1', '20x1 + x2 <= 100', '200x1 + 20x2 + x3 <= 10000']),
+                   'optimo', 10000.0),
+    # Ejemplo de Beale: sin anticiclado Dantzig vuelve a la base inicial tras seis pivotes
+    'beale': (dict(funcion_objetivo='0.75x1 - 150x2 + 0.02x3 - 6x4', tipo_optimizacion='max',
+                   restricciones=['0.25x1 - 60x2 - 0.04x3 + 9x4 <= 0', '0.5x1 - 90x2 - 0.02x3 + 3x4 <= 0',
+                                  'x3 <= 1']), 'optimo', 0.05),
+    'degenerado': (dict(funcion_objetivo='2x1 + x2', tipo_optimizacion='max',
+                        restricciones=['x1 + x2 <= 2', 'x1 <= 2', 'x2 <= 3']), 'optimo', 4.0),
+    'minimizacion': (dict(funcion_objetivo='2x1 + 3x2', tipo_optimizacion='min',
+                          restricciones=['x1 + x2 >= 4', 'x1 + 3x2 >= 6']), 'optimo', 9.0),
+    'igualdad': (dict(funcion_objetivo='4x1 + 3x2', tipo_optimizacion='max',
+                      restricciones=['x1 + x2 = 5', 'x1 <= 3']), 'optimo', 18.0),
+    'infactible': (dict(funcion_objetivo='x1 + x2', tipo_optimizacion='max',
+                        restricciones=['x1 + x2 <= 1', 'x1 + x2 >= 3']), 'infactible', None),
+    'no_acotado': (dict(funcion_objetivo='x1 + x2', tipo_optimizacion='max',
+                        restricciones=['x1 - x2 <= 1']), 'no_acotado', None),
+}
+
+
+def sin_tiempos(resultado):
+    """Copia del resultado sin los campos que dependen del reloj"""
+    resultado = dict(resultado)
+    resultado.pop('tiempo_resolucion_ms', None)
+    if 'estadisticas' in resultado:
+        resultado['estadisticas'] = {clave: valor for clave, valor in resultado['estadisticas'].items()
+                                     if clave != 'tiempos_ms'}
+    return resultado
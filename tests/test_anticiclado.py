@@ -0,0 +1,42 @@
+import pytest
+
+import simplex
+from conftest import PROBLEMAS
+
+def resolver(datos, **opciones):
+    return simplex.resolver_desde_datos(dict(datos, cache=False, **opciones))
+
+
+def test_beale_detecta_el_ciclo_y_pasa_a_bland():
+    resultado, _ = resolver(PROBLEMAS['beale'][0])
+    assert resultado['ciclo_detectado'] is not None
+    assert resultado['pivotes_degenerados'] > 0
+    assert resultado['z_optimo'] == pytest.approx(0.05)
+
+
+def test_bland_desde_el_inicio_no_cicla():
+    resultado, _ = resolver(PROBLEMAS['beale'][0], anticiclado='bland')
+    assert 'ciclo_detectado' not in resultado
+    assert resultado['z_optimo'] == pytest.approx(0.05)
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+@pytest.mark.parametrize('anticiclado', ['lexicografico', 'perturbacion'])
+def test_beale_no_cicla_con_desempate_ni_perturbacion(anticiclado, metodo):
+    resultado, _ = resolver(PROBLEMAS['beale'][0], anticiclado=anticiclado, metodo=metodo)
+    assert 'ciclo_detectado' not in resultado
+    assert resultado['anticiclado'] == anticiclado
+    assert resultado['z_optimo'] == pytest.approx(0.05)
+    # Dantzig con empates rotos por el orden cicla; con estas reglas llega en dos pivotes
+    assert resultado['iteraciones'] == 2
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+@pytest.mark.parametrize('nombre', ['beale', 'degenerado'])
+def test_perturbacion_se_retira_antes_de_reportar(nombre, metodo):
+    datos, _, z = PROBLEMAS[nombre]
+    resultado, _ = resolver(datos, anticiclado='perturbacion', metodo=metodo)
+    assert resultado['tableaux'][-1]['perturbacion_retirada'] is True
+    assert resultado['pivotes_degenerados'] == 0
+    # El óptimo es el del problema sin perturbar, no uno desplazado por el epsilon
+    assert resultado['z_optimo'] == pytest.approx(z, abs=1e-12)
@@ -0,0 +1,116 @@
+import random
+import time
+
+import pytest
+
+import simplex
+from conftest import PROBLEMAS, sin_tiempos
+
+
+def problemas_misma_forma(cantidad, semilla=0):
+    """Problemas aleatorios de 3 restricciones <= y 4 variables: sus tableaux se apilan juntos
+    (con coeficientes negativos algunos son no acotados)"""
+    rng = random.Random(semilla)
+    problemas = []
+    for _ in range(cantidad):
+        termino = lambda: ' + '.join(f'{rng.randint(-2, 9)}x{j + 1}' for j in range(4)).replace('+ -', '- ')
+        problemas.append(dict(funcion_objetivo=termino(), tipo_optimizacion=rng.choice(['max', 'min']),
+                              restricciones=[f'{termino()} <= {rng.randint(0, 60)}' for _ in range(3)]))
+    return problemas
+
+
+def lote_de_prueba():
+    problemas = problemas_misma_forma(30)
+    # Beale cicla dentro del kernel y sigue solo con Bland; con límites bajos se interrumpe antes o después
+    beale = PROBLEMAS['beale'][0]
+    problemas += [beale, beale] + [dict(beale, max_iteraciones=limite) for limite in (1, 3, 7, 12)]
+    problemas += [dict(datos, max_iteraciones=2) for datos in problemas_misma_forma(10, semilla=1)]
+    return [dict(datos, cache=False, estadisticas=True) for datos in problemas]
+
+
+def preparar(problemas):
+    return [simplex.preparar_solver(datos)[0] for datos in problemas]
+
+
+@pytest.mark.parametrize('formato', ['json', 'base64', 'delta'])
+@pytest.mark.parametrize('modo', ['completo', 'resumen', 'ultimos', 'pivotes'])
+def test_apilado_coincide_con_resolver_cada_problema_solo(modo, formato):
+    problemas = [dict(datos, modo_historial=modo, formato_historial=formato, ultimos_k=2)
+                 for datos in lote_de_prueba()]
+    solvers = preparar(problemas)
+    assert all(solver.puede_apilarse() for solver in solvers)
+    
+    apilados = simplex.resolver_apilado(solvers)
+    for k, (apilado, datos) in enumerate(zip(apilados, problemas)):
+        simplex._agregar_estadisticas(apilado, solvers[k], datos)
+        solo, _ = simplex.resolver_desde_datos(datos)
+        assert sin_tiempos(apilado) == sin_tiempos(solo), k
+
+
+def test_lote_cubre_todos_los_estados():
+    estados = {resultado['estado'] for resultado in simplex.resolver_lote(lote_de_prueba(), procesos=1)}
+    assert estados == {'optimo', 'no_acotado', 'limite_iteraciones'}
+
+
+def test_lote_usa_el_kernel_apilado(monkeypatch):
+    apilados = []
+    original = simplex.resolver_apilado
+    monkeypatch.setattr(simplex, 'resolver_apilado', lambda solvers: apilados.append(len(solvers)) or original(solvers))
+    
+    problemas = lote_de_prueba()
+    # Una forma distinta y una opción que el kernel no cubre se resuelven aparte
+    problemas += [dict(PROBLEMAS['clasico'][0], cache=False), dict(problemas[0], metodo='revisado')]
+    lote = simplex.resolver_lote(problemas, procesos=1)
+    assert apilados == [len(problemas) - 2]
+    assert [sin_tiempos(r) for r in lote] == [sin_tiempos(simplex.resolver_desde_datos(d)[0]) for d in problemas]
+
+
+def test_ciclos_y_limites_siguen_desde_el_tableau_apilado(monkeypatch):
+    beale = PROBLEMAS['beale'][0]
+    problemas = [dict(beale, cache=False), dict(beale, cache=False, max_iteraciones=3)]
+    solos = [simplex.resolver_desde_datos(datos)[0] for datos in problemas]
+    
+    # Nada se vuelve a resolver desde el principio
+    def resolver(self):
+        raise AssertionError("resolver() no debería llamarse")
+    monkeypatch.setattr(simplex.SimplexSolver, 'resolver', resolver)
+    solvers = preparar(problemas)
+    apilados = simplex.resolver_apilado(solvers + preparar([dict(beale, cache=False, regla_precio='dantzig')]))
+    
+    assert [sin_tiempos(r) for r in apilados[:2]] == [sin_tiempos(r) for r in solos]
+    assert apilados[0]['ciclo_detectado'] == solos[0]['ciclo_detectado']
+    assert apilados[1]['estado'] == 'limite_iteraciones'
+    # El problema que no cicló antes del límite conserva la configuración pedida
+    nuevo = preparar(problemas[1:])[0]
+    assert (solvers[1].regla_precio, solvers[1].desempate) == (nuevo.regla_precio, nuevo.desempate)
+
+
+def test_cada_problema_cuenta_su_parte_del_kernel():
+    problemas = [dict(datos, cache=False, estadisticas=True) for datos in problemas_misma_forma(200, semilla=2)]
+    solvers = preparar(problemas)
+    inicio = time.perf_counter()
+    simplex.resolver_apilado(solvers)
+    duracion = time.perf_counter() - inicio
+    
+    resolucion = sum(solver.estadisticas.tiempos['resolucion'] for solver in solvers)
+    assert resolucion <= duracion
+    for solver, datos in zip(solvers, problemas):
+        solo = simplex.preparar_solver(datos)[0]
+        solo.resolver()
+        assert solver.estadisticas.contadores == solo.estadisticas.contadores
+        assert solver.pivotes_degenerados == solo.pivotes_degenerados
+
+
+def test_traza_recibe_los_pivotes_de_cada_problema():
+    datos = dict(PROBLEMAS['klee_minty'][0], cache=False)
+    eventos_solo, eventos_apilado = [], []
+    solo, _ = simplex.configurar_solver(datos, traza=eventos_solo.append)
+    simplex.estandarizar_solver(solo, datos)
+    solo.resolver()
+    apilado, _ = simplex.configurar_solver(datos, traza=eventos_apilado.append)
+    simplex.estandarizar_solver(apilado, datos)
+    simplex.resolver_apilado([apilado, simplex.preparar_solver(datos)[0]])
+    
+    pivotes = lambda eventos: [e for e in eventos if e['evento'] == 'pivote']
+    assert pivotes(eventos_apilado) == pivotes(eventos_solo)
+    assert len(pivotes(eventos_solo)) == 7
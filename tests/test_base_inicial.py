@@ -0,0 +1,80 @@
+import pytest
+
+import simplex
+from conftest import PROBLEMAS, sin_tiempos
+
+CLASICO = dict(PROBLEMAS['clasico'][0], cache=False)
+# Las columnas de x1 y x2 son proporcionales: {x1, x2} no es una base
+SINGULAR = dict(funcion_objetivo='x1 + x2', tipo_optimizacion='max',
+                restricciones=['x1 + 2x2 <= 4', '2x1 + 4x2 <= 8'], cache=False)
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+@pytest.mark.parametrize('base, mensaje', [
+    ('S1', 'base_inicial debe ser una lista de nombres (o índices) de variables'),
+    ([True, 'S2', 'S3'], 'base_inicial debe ser una lista de nombres (o índices) de variables'),
+    ({'S1': 0}, 'base_inicial debe ser una lista de nombres (o índices) de variables'),
+    (['x1', 'x2'], 'La base inicial debe tener 3 variables'),
+    (['x1', 'x1', 'S3'], 'La base inicial tiene variables repetidas o fuera de rango'),
+    ([0, 1, 9], 'La base inicial tiene variables repetidas o fuera de rango'),
+    (['zz', 'S2', 'S3'], 'Variable desconocida en la base inicial: zz'),
+])
+def test_base_inicial_invalida(metodo, base, mensaje):
+    resultado, codigo = simplex.resolver_desde_datos(dict(CLASICO, metodo=metodo, base_inicial=base))
+    assert codigo == 400
+    assert resultado['estado'] == 'invalido'
+    assert resultado['error'] == mensaje
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+def test_base_inicial_singular_mismo_error_en_ambos_metodos(metodo):
+    resultado, codigo = simplex.resolver_desde_datos(dict(SINGULAR, metodo=metodo, base_inicial=['x1', 'x2']))
+    assert codigo == 400
+    assert resultado['error'] == 'La base inicial es singular'
+
+
+@pytest.mark.parametrize('opciones, mensaje', [
+    ({'presolve': True}, 'base_inicial no es compatible con presolve'),
+    ({'metodo': 'punto_interior'}, 'base_inicial no es compatible con punto_interior'),
+])
+def test_base_inicial_incompatible(opciones, mensaje):
+    resultado, codigo = simplex.resolver_desde_datos(dict(CLASICO, base_inicial=['S1', 'S2', 'S3'], **opciones))
+    assert codigo == 400
+    assert resultado['error'] == mensaje
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+def test_arranque_en_caliente_desde_la_base_final(metodo):
+    frio, _ = simplex.resolver_desde_datos(dict(CLASICO, metodo=metodo))
+    caliente, codigo = simplex.resolver_desde_datos(dict(CLASICO, metodo=metodo, base_inicial=frio['base_final']))
+    assert codigo == 200
+    assert caliente['z_optimo'] == pytest.approx(frio['z_optimo'])
+    assert caliente['base_final'] == frio['base_final']
+    assert len(caliente['tableaux']) < len(frio['tableaux'])
+
+
+def test_base_no_factible_pero_dual_factible_se_repara():
+    # Tras bajar b, la base óptima anterior deja de ser primal factible pero sigue siendo dual factible
+    frio, _ = simplex.resolver_desde_datos(CLASICO)
+    datos = dict(CLASICO, restricciones=['x1 <= 4', '2x2 <= 12', '3x1 + 2x2 <= 10'])
+    caliente, _ = simplex.resolver_desde_datos(dict(datos, base_inicial=frio['base_final']))
+    desde_cero, _ = simplex.resolver_desde_datos(datos)
+    assert caliente['z_optimo'] == pytest.approx(desde_cero['z_optimo'])
+
+
+def test_base_inicial_por_indices_equivale_a_nombres():
+    # Columnas en el orden estandarizado: x1, x2, S1, S2, S3
+    por_nombres, _ = simplex.resolver_desde_datos(dict(CLASICO, base_inicial=['x1', 'x2', 'S3']))
+    por_indices, _ = simplex.resolver_desde_datos(dict(CLASICO, base_inicial=[0, 1, 4]))
+    assert por_indices['base_inicial_aplicada'] is True
+    assert sin_tiempos(por_indices) == sin_tiempos(por_nombres)
+
+
+def test_base_ni_primal_ni_dual_factible_usa_el_arranque_normal():
+    # Con x1, S1 y S2 en la base S1 = -2 y el costo reducido de x2 sigue mejorando
+    frio, _ = simplex.resolver_desde_datos(CLASICO)
+    caliente, codigo = simplex.resolver_desde_datos(dict(CLASICO, base_inicial=['x1', 'S1', 'S2']))
+    assert codigo == 200
+    assert caliente['base_inicial_aplicada'] is False
+    assert caliente['z_optimo'] == pytest.approx(frio['z_optimo'])
+    assert caliente['tableaux'] == frio['tableaux']
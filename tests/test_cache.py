@@ -0,0 +1,148 @@
+import os
+
+import pytest
+
+import simplex
+from conftest import PROBLEMAS
+
+
+CLASICO_MATRICIAL = dict(c=[3, 5], A=[[1, 0], [0, 2], [3, 2]], b=[4, 12, 18], tipos=['<='] * 3, tipo_optimizacion='max')
+
+
+def huella(datos):
+    solver, error = simplex.configurar_solver(datos)
+    assert error is None
+    return simplex.huella_problema(solver, datos)
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    """Reloj controlado para time.time() dentro de simplex"""
+    instante = [1_000_000.0]
+    monkeypatch.setattr(simplex.time, 'time', lambda: instante[0])
+    return instante
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = simplex.CacheResultados(ttl=60)
+    monkeypatch.setattr(simplex, 'CACHE_RESULTADOS', cache)
+    return cache
+
+
+def test_segunda_resolucion_sale_de_la_cache(cache):
+    datos = PROBLEMAS['clasico'][0]
+    primero, _ = simplex.resolver_desde_datos(datos)
+    segundo, codigo = simplex.resolver_desde_datos(datos)
+    
+    assert 'desde_cache' not in primero
+    assert segundo['desde_cache'] is True
+    assert codigo == 200
+    assert segundo['z_optimo'] == primero['z_optimo']
+    assert cache.estadisticas()['aciertos'] == 1
+
+
+def test_cache_false_y_opciones_distintas_no_aciertan(cache):
+    datos = PROBLEMAS['clasico'][0]
+    simplex.resolver_desde_datos(datos)
+    assert 'desde_cache' not in simplex.resolver_desde_datos(dict(datos, cache=False))[0]
+    assert 'desde_cache' not in simplex.resolver_desde_datos(dict(datos, metodo='revisado'))[0]
+    # Lo que no cambia la solución no cambia la huella
+    assert simplex.resolver_desde_datos(dict(datos, estadisticas=True))[0]['desde_cache'] is True
+
+
+def test_errores_del_problema_tambien_se_guardan(cache):
+    datos = PROBLEMAS['infactible'][0]
+    simplex.resolver_desde_datos(datos)
+    resultado, codigo = simplex.resolver_desde_datos(datos)
+    assert resultado['desde_cache'] is True
+    assert resultado['estado'] == 'infactible'
+    assert codigo == 400
+
+
+def test_entrada_caduca_tras_el_ttl(cache, reloj):
+    datos = PROBLEMAS['clasico'][0]
+    simplex.resolver_desde_datos(datos)
+    reloj[0] += 59
+    assert simplex.resolver_desde_datos(datos)[0]['desde_cache'] is True
+    reloj[0] += 2
+    assert 'desde_cache' not in simplex.resolver_desde_datos(datos)[0]
+
+
+def test_acierto_en_disco_entre_instancias(tmp_path):
+    escritora = simplex.CacheResultados(directorio=str(tmp_path))
+    lectora = simplex.CacheResultados(directorio=str(tmp_path))
+    escritora.guardar('abc', {'z_optimo': 1.0})
+    
+    assert lectora.obtener('abc') == {'z_optimo': 1.0}
+    assert lectora.obtener('abc') == {'z_optimo': 1.0}
+    estadisticas = lectora.estadisticas()
+    assert (estadisticas['aciertos'], estadisticas['aciertos_disco']) == (2, 1)
+
+
+def test_promocion_desde_disco_conserva_la_fecha(tmp_path, reloj):
+    escritora = simplex.CacheResultados(ttl=60, directorio=str(tmp_path))
+    lectora = simplex.CacheResultados(ttl=60, directorio=str(tmp_path))
+    escritora.guardar('abc', {'z_optimo': 1.0})
+    os.utime(escritora.ruta('abc'), (reloj[0], reloj[0]))
+    
+    # Leída a mitad del TTL pasa a memoria, pero sigue caducando desde que se guardó
+    reloj[0] += 30
+    assert lectora.obtener('abc') is not None
+    reloj[0] += 31
+    assert lectora.obtener('abc') is None
+    assert not os.path.exists(escritora.ruta('abc'))
+
+
+def test_disco_se_poda_a_max_archivos(tmp_path, reloj):
+    cache = simplex.CacheResultados(ttl=60, directorio=str(tmp_path), max_archivos=3)
+    for k in range(5):
+        cache.guardar(f'h{k}', {'k': k})
+        os.utime(cache.ruta(f'h{k}'), (reloj[0] + k, reloj[0] + k))
+    
+    assert sorted(os.listdir(tmp_path)) == ['h2.json', 'h3.json', 'h4.json']
+
+
+def test_poda_borra_primero_los_caducados(tmp_path, reloj):
+    cache = simplex.CacheResultados(ttl=60, directorio=str(tmp_path), max_archivos=3)
+    for k in range(3):
+        cache.guardar(f'viejo{k}', {'k': k})
+        os.utime(cache.ruta(f'viejo{k}'), (reloj[0] - 120, reloj[0] - 120))
+    cache.guardar('nuevo', {'k': 3})
+    assert os.listdir(tmp_path) == ['nuevo.json']
+
+
+def test_memoria_expulsa_la_menos_usada():
+    cache = simplex.CacheResultados(max_entradas=2)
+    cache.guardar('a', {'k': 1})
+    cache.guardar('b', {'k': 2})
+    cache.obtener('a')
+    cache.guardar('c', {'k': 3})
+    assert cache.obtener('b') is None
+    assert cache.obtener('a') == {'k': 1}
+    assert cache.estadisticas()['expulsiones'] == 1
+
+
+@pytest.mark.parametrize('variante', [
+    dict(funcion_objetivo='5x2+3x1', restricciones=['x1<=4', 'x2 + x2 <= 12', '2x2 + 3x1 <= 18']),
+    dict(restricciones=['  x1 <= 4', '2x2 <= 12', '3x1 + 2x2 <= 18', '']),
+])
+def test_misma_huella_para_el_mismo_modelo_escrito_distinto(variante):
+    datos = PROBLEMAS['clasico'][0]
+    assert huella(dict(datos, **variante)) == huella(datos)
+
+
+def test_entrada_matricial_comparte_huella_con_el_texto():
+    assert huella(CLASICO_MATRICIAL) == huella(PROBLEMAS['clasico'][0])
+
+
+@pytest.mark.parametrize('cambio', [
+    dict(c=[3, 5.0001]),
+    dict(b=[4, 12, 18.5]),
+    dict(tipos=['<=', '<=', '=']),
+    dict(tipo_optimizacion='min'),
+    dict(aplicar_dualidad=True),
+    dict(anticiclado='bland'),
+])
+def test_cambios_en_el_modelo_o_las_opciones_cambian_la_huella(cambio):
+    assert huella(dict(CLASICO_MATRICIAL, **cambio)) != huella(CLASICO_MATRICIAL)
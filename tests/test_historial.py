@@ -0,0 +1,67 @@
+import json
+
+import numpy as np
+import pytest
+
+import simplex
+from conftest import PROBLEMAS
+
+# Fase I y fase II (dos segmentos), el ciclo de Beale y un problema sin artificiales
+CASOS = {
+    'clasico': {},
+    'beale': {},
+    'minimizacion': {'artificiales': 'dos_fases'},
+    'igualdad': {'artificiales': 'dos_fases'},
+}
+
+
+def resolver(nombre, **opciones):
+    resultado, _ = simplex.resolver_desde_datos(dict(PROBLEMAS[nombre][0], cache=False, **CASOS[nombre], **opciones))
+    # Lo que recibe el cliente: solo tipos de JSON
+    return json.loads(json.dumps(resultado))
+
+
+def test_codificar_matriz_ida_y_vuelta_exacta():
+    rng = np.random.default_rng(3)
+    matriz = rng.normal(size=(5, 7)) * 10.0 ** rng.integers(-300, 300, size=(5, 7))
+    matriz[0, 0] = -0.0
+    codificada = json.loads(json.dumps(simplex.codificar_matriz(matriz)))
+    assert codificada['forma'] == [5, 7]
+    decodificada = simplex.decodificar_matriz(codificada)
+    assert decodificada.tobytes() == matriz.tobytes()
+    # decodificar_matriz también acepta las listas anidadas del formato json
+    np.testing.assert_array_equal(simplex.decodificar_matriz(matriz.tolist()), matriz)
+
+
+@pytest.mark.parametrize('nombre', CASOS)
+def test_base64_decodifica_a_los_mismos_tableaux(nombre):
+    listas = resolver(nombre)
+    binario = resolver(nombre, formato_historial='base64')
+    assert binario['formato_historial'] == 'base64'
+    assert len(binario['tableaux']) == len(listas['tableaux'])
+    for entrada, referencia in zip(binario['tableaux'], listas['tableaux']):
+        if 'tableau' in referencia:
+            np.testing.assert_array_equal(simplex.decodificar_matriz(entrada['tableau']), referencia['tableau'])
+
+
+@pytest.mark.parametrize('formato', ['delta', 'delta_base64'])
+@pytest.mark.parametrize('nombre', CASOS)
+def test_delta_reproduce_cada_iteracion_del_modo_completo(nombre, formato):
+    completo = resolver(nombre)
+    delta = resolver(nombre, formato_historial=formato)
+    assert len(delta['tableaux']) == len(completo['tableaux'])
+    
+    for entrada, referencia in zip(delta['tableaux'], completo['tableaux']):
+        assert 'tableau' not in entrada
+        tableau, basicas = simplex.reproducir_iteracion(delta['historial'], entrada['iteracion'], entrada['segmento'])
+        assert basicas == entrada['basic_vars'] == referencia['basic_vars']
+        if 'tableau' in referencia:
+            np.testing.assert_allclose(tableau, referencia['tableau'], atol=1e-9)
+
+
+def test_reproducir_iteracion_fuera_del_historial():
+    delta = resolver('minimizacion', formato_historial='delta')
+    with pytest.raises(ValueError, match="no está en el historial"):
+        simplex.reproducir_iteracion(delta['historial'], -1)
+    with pytest.raises(ValueError, match="no está en el historial"):
+        simplex.reproducir_iteracion(delta['historial'], 0, segmento=len(delta['historial']['segmentos']))
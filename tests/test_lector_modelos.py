@@ -0,0 +1,139 @@
+import gzip
+import io
+
+import numpy as np
+import pytest
+
+import lector_modelos
+import simplex
+
+# max 3x + 2y + 10 con las tres clases de rango (L, G y E positivo) y cotas UP y LO
+MPS = """NAME          RANGOS
+OBJSENSE
+    MAX
+ROWS
+ N  COSTO
+ L  C1
+ G  C2
+ E  C3
+COLUMNS
+    X         COSTO     3.0          C1        1.0
+    X         C2        1.0          C3        1.0
+    Y         COSTO     2.0          C1        1.0
+    Y         C2        3.0          C3        -1.0
+RHS
+    RHS       COSTO     -10.0        C1        4.0
+    RHS       C2        1.0          C3        1.0
+RANGES
+    RNG       C1        2.0          C2        5.0
+    RNG       C3        2.0
+BOUNDS
+ UP BND       X         3.0
+ LO BND       Y         0.5
+ENDATA
+"""
+
+# El mismo modelo en LP, con las filas en el orden en que el lector MPS agrega rangos y cotas
+LP = """\\ Mismo modelo que MPS
+Maximize
+ costo: 3 X + 2 Y + 10
+Subject To
+ C1: X + Y <= 4
+ C2: X + 3 Y >= 1
+ C3: X - Y
+     >= 1
+ C1_rango: X + Y >= 2
+ C2_rango: X + 3 Y <= 6
+ C3_rango: X - Y <= 3
+Bounds
+ X <= 3
+ Y >= 0.5
+End
+"""
+
+
+def leer(texto, **opciones):
+    return lector_modelos.leer_modelo(io.BytesIO(texto.encode()), **opciones)
+
+
+def linea_fija(*campos):
+    """Línea MPS de formato fijo con cada campo en sus columnas"""
+    linea = ""
+    for (inicio, _), campo in zip(lector_modelos._CAMPOS_FIJOS, campos):
+        linea = linea.ljust(inicio - 1) + campo
+    return linea
+
+
+def test_mps_rangos_cotas_y_constante():
+    modelo = leer(MPS)
+    assert modelo['modelo']['formato'] == 'mps'
+    assert modelo['tipo_optimizacion'] == 'max'
+    # El RHS de la fila objetivo es la constante con el signo cambiado
+    assert modelo['constante_objetivo'] == 10.0
+    # Cada rango agrega la otra cara de su fila y cada cota una fila más
+    assert modelo['tipos'] == ['<=', '>=', '>=', '>=', '<=', '<=', '<=', '>=']
+    assert modelo['b'].tolist() == [4.0, 1.0, 1.0, 2.0, 6.0, 3.0, 3.0, 0.5]
+    
+    resultado, codigo = simplex.resolver_modelo(modelo, {'cache': False})
+    assert codigo == 200
+    assert resultado['z_optimo'] == pytest.approx(21.0)
+
+
+def test_lp_equivale_al_mps():
+    mps, lp = leer(MPS), leer(LP)
+    assert lp['modelo']['formato'] == 'lp'
+    for campo in ('tipos', 'tipo_optimizacion', 'nombres_variables', 'constante_objetivo'):
+        assert lp[campo] == mps[campo], campo
+    for campo in ('c', 'b'):
+        np.testing.assert_array_equal(lp[campo], mps[campo])
+    densa = {}
+    for nombre, modelo in (('mps', mps), ('lp', lp)):
+        A = modelo['A']
+        densa[nombre] = np.zeros(A['forma'])
+        np.add.at(densa[nombre], (A['filas'], A['columnas']), A['valores'])
+    np.testing.assert_array_equal(densa['lp'], densa['mps'])
+
+
+def test_mps_fijo_admite_nombres_con_espacios():
+    lineas = ["NAME          FIJO", "ROWS", linea_fija("N", "OBJ"), linea_fija("L", "LIM 1"), "COLUMNS",
+              linea_fija("", "VAR A", "OBJ", "-1.0", "LIM 1", "2.0"), "RHS",
+              linea_fija("", "RHS", "LIM 1", "8.0"), "ENDATA"]
+    modelo = leer("\n".join(lineas), formato='mps_fijo')
+    assert modelo['nombres_variables'] == ['VAR A']
+    assert modelo['tipo_optimizacion'] == 'min'
+    assert modelo['b'].tolist() == [8.0]
+    assert simplex.resolver_modelo(modelo, {'cache': False})[0]['z_optimo'] == pytest.approx(-4.0)
+
+
+@pytest.mark.parametrize('texto, nombre, formato', [
+    (MPS, None, 'mps'),
+    (LP, 'modelo.lp.gz', 'lp'),
+    (LP, None, 'lp'),
+])
+def test_gzip_y_deteccion_de_formato(texto, nombre, formato):
+    comprimido = io.BytesIO(gzip.compress(texto.encode()))
+    modelo = lector_modelos.leer_modelo(comprimido, nombre=nombre)
+    assert modelo['modelo']['formato'] == formato
+    assert modelo['b'].tolist() == [4.0, 1.0, 1.0, 2.0, 6.0, 3.0, 3.0, 0.5]
+
+
+def test_enteras_se_relajan_con_aviso():
+    texto = MPS.replace("    Y         COSTO", "    M1        'MARKER'                 'INTORG'\n"
+                                             "    Y         COSTO", 1)
+    texto = texto.replace("RHS\n", "    M2        'MARKER'                 'INTEND'\nRHS\n", 1)
+    assert leer(texto)['modelo']['avisos'] == ["Se ignoró la integralidad de 1 variables (relajación lineal)"]
+
+
+@pytest.mark.parametrize('texto, mensaje', [
+    (MPS.replace(" LO BND       Y         0.5", " FR BND       Y"),
+     "La variable Y es libre o tiene cota inferior negativa"),
+    (MPS.replace("C2        3.0", "C9        3.0"), "Línea 13 del MPS: Fila 'C9' no declarada en ROWS"),
+    (MPS.replace(" UP BND       X         3.0", " XX BND       X         3.0"),
+     "Tipo de cota desconocido 'XX'"),
+    (LP.replace("X <= 3", "X free"), "La variable X es libre o tiene cota inferior negativa"),
+    # La numeración cuenta el comentario inicial que se lee para detectar el formato
+    (LP.replace(" C2: X + 3 Y >= 1", " C2: X + 3 Y >= Y"), "Línea 6 del LP: El lado derecho debe ser un número"),
+])
+def test_errores_indican_la_causa(texto, mensaje):
+    with pytest.raises(ValueError, match=mensaje):
+        leer(texto)
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+import simplex
+from conftest import PROBLEMAS, sin_tiempos
+
+
+def lote_de_prueba():
+    problemas = [datos for datos, _, _ in PROBLEMAS.values()]
+    problemas += [dict(PROBLEMAS['klee_minty'][0], metodo='revisado'), {'funcion_objetivo': ''}]
+    return [dict(datos, cache=False, estadisticas=True) for datos in problemas * 3]
+
+
+def resolver_solos(problemas):
+    return [simplex.resolver_desde_datos(datos)[0] for datos in problemas]
+
+
+@pytest.mark.parametrize('apilar', [True, False])
+def test_lote_en_proceso_coincide_con_resolver_cada_problema_solo(apilar):
+    problemas = lote_de_prueba()
+    lote = simplex.resolver_lote(problemas, procesos=1, apilar=apilar)
+    assert [sin_tiempos(r) for r in lote] == [sin_tiempos(r) for r in resolver_solos(problemas)]
+
+
+def test_lote_en_el_pool_de_procesos(monkeypatch):
+    monkeypatch.setenv('SIMPLEX_PROCESOS', '2')
+    problemas = lote_de_prueba()
+    lote = simplex.resolver_lote(problemas, procesos=2)
+    assert [sin_tiempos(r) for r in lote] == [sin_tiempos(r) for r in resolver_solos(problemas)]
+    
+    indices = sorted(indice for indice, _ in simplex.resolver_lote_iterativo(problemas, procesos=2))
+    assert indices == list(range(len(problemas)))
+
+
+def test_procesos_se_limita_al_tamano_del_pool(monkeypatch):
+    monkeypatch.setenv('SIMPLEX_PROCESOS', '1')
+    # Con un único proceso permitido el lote se resuelve aquí mismo, sin crear el pool
+    monkeypatch.setattr(simplex, '_obtener_pool', lambda: pytest.fail("no debería usar el pool"))
+    assert len(simplex.resolver_lote(lote_de_prueba(), procesos=64)) == len(lote_de_prueba())
+
+
+@pytest.mark.parametrize('procesos', [0, -1, 'dos', True, 1.5])
+def test_endpoint_batch_rechaza_procesos_invalidos(procesos):
+    app = pytest.importorskip('app')
+    respuesta = app.app.test_client().post('/resolver/batch', json={
+        'problemas': [PROBLEMAS['clasico'][0]], 'procesos': procesos})
+    assert respuesta.status_code == 400
+    assert respuesta.get_json()['error'] == 'procesos debe ser un entero positivo'
+
+
+def test_endpoint_batch_resuelve_en_orden():
+    app = pytest.importorskip('app')
+    problemas = [datos for datos, _, _ in PROBLEMAS.values()]
+    respuesta = app.app.test_client().post('/resolver/batch', json={'problemas': problemas, 'procesos': 1})
+    assert respuesta.status_code == 200
+    assert [r['estado'] for r in respuesta.get_json()['resultados']] == [e for _, e, _ in PROBLEMAS.values()]
+
+
+def test_endpoint_batch_en_flujo():
+    app = pytest.importorskip('app')
+    problemas = [datos for datos, _, _ in PROBLEMAS.values()]
+    respuesta = app.app.test_client().post('/resolver/batch', json={'problemas': problemas, 'flujo': True})
+    lineas = [json.loads(linea) for linea in respuesta.get_data(as_text=True).splitlines()]
+    assert sorted(linea['indice'] for linea in lineas) == list(range(len(problemas)))
+    assert all(linea['resultado']['estado'] == PROBLEMAS[nombre][1]
+               for nombre, linea in zip(PROBLEMAS, sorted(lineas, key=lambda linea: linea['indice'])))
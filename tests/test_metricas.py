@@ -0,0 +1,81 @@
+import re
+
+import pytest
+
+import metricas
+import simplex
+from conftest import PROBLEMAS
+
+# Línea de muestra del formato de texto de Prometheus: nombre{etiquetas} valor
+MUESTRA = re.compile(r'[a-zA-Z_:][a-zA-Z0-9_:]*(\{([a-zA-Z_]\w*="([^"\\]|\\.)*",?)*\})? \S+')
+
+
+def muestras(texto):
+    """{línea sin el valor: valor} de todas las muestras del texto exportado"""
+    resultado = {}
+    for linea in texto.splitlines():
+        if linea.startswith('#'):
+            continue
+        assert MUESTRA.fullmatch(linea), linea
+        serie, valor = linea.rsplit(' ', 1)
+        resultado[serie] = float(valor)
+    return resultado
+
+
+def test_histograma_acumula_cubetas_inclusivas():
+    histograma = metricas.Histograma('prueba_segundos', 'Ayuda', (0.1, 1.0), ('ruta',))
+    for valor in (0.05, 0.1, 0.5, 3.0):
+        histograma.observar(valor, ruta='/resolver')
+    lineas = histograma.exportar()
+    
+    assert lineas[:2] == ['# HELP prueba_segundos Ayuda', '# TYPE prueba_segundos histogram']
+    assert muestras('\n'.join(lineas)) == {
+        'prueba_segundos_bucket{ruta="/resolver",le="0.1"}': 2,
+        'prueba_segundos_bucket{ruta="/resolver",le="1.0"}': 3,
+        'prueba_segundos_bucket{ruta="/resolver",le="+Inf"}': 4,
+        'prueba_segundos_sum{ruta="/resolver"}': pytest.approx(3.65),
+        'prueba_segundos_count{ruta="/resolver"}': 4,
+    }
+
+
+def test_contador_escapa_las_etiquetas():
+    contador = metricas.Contador('prueba_total', 'Ayuda', ('estado',))
+    contador.incrementar(estado='con "comillas"\ny \\')
+    contador.incrementar(2, estado='con "comillas"\ny \\')
+    assert contador.exportar()[2] == 'prueba_total{estado="con \\"comillas\\"\\ny \\\\"} 3'
+
+
+def test_resoluciones_por_estado_fase_y_tamano(monkeypatch):
+    monkeypatch.setattr(simplex, 'CACHE_RESULTADOS', simplex.CacheResultados())
+    registro = metricas.MetricasResolucion(simplex.Estadisticas.FASES)
+    for nombre in ('clasico', 'clasico', 'infactible'):
+        simplex.resolver_desde_datos(PROBLEMAS[nombre][0], metricas=registro)
+    simplex.resolver_desde_datos({'funcion_objetivo': 'x1'}, metricas=registro)
+    series = muestras(registro.exportar(simplex.CACHE_RESULTADOS.estadisticas()))
+    
+    assert series['simplex_resultados_total{estado="optimo"}'] == 2
+    assert series['simplex_resultados_total{estado="infactible"}'] == 1
+    assert series['simplex_resultados_total{estado="invalido"}'] == 1
+    # El acierto de caché cuenta como resultado, pero no vuelve a observar fases ni tamaños
+    assert series['simplex_resultados_cache_total'] == 1
+    assert series['simplex_iteraciones_count'] == 2
+    assert series['simplex_fase_segundos_count{fase="resolucion"}'] == 2
+    assert series['simplex_tableau_filas_bucket{le="5"}'] == 2
+    assert series['simplex_cache_entradas'] == 2
+
+
+def test_endpoint_metrics(monkeypatch):
+    app = pytest.importorskip('app')
+    monkeypatch.setattr(app, 'METRICAS', metricas.MetricasResolucion(simplex.Estadisticas.FASES))
+    cliente = app.app.test_client()
+    cliente.post('/resolver', json=dict(PROBLEMAS['clasico'][0], cache=False))
+    cliente.post('/resolver', json={})
+    
+    respuesta = cliente.get('/metrics')
+    assert respuesta.status_code == 200
+    assert respuesta.content_type == metricas.TIPO_CONTENIDO
+    series = muestras(respuesta.get_data(as_text=True))
+    assert series['simplex_peticiones_total{ruta="/resolver",codigo="200"}'] == 1
+    assert series['simplex_peticiones_total{ruta="/resolver",codigo="400"}'] == 1
+    assert series['simplex_peticion_segundos_count{ruta="/resolver"}'] == 2
+    assert series['simplex_resultados_total{estado="optimo"}'] == 1
@@ -0,0 +1,49 @@
+import pytest
+
+import simplex
+from conftest import PROBLEMAS
+
+# Combinaciones de opciones de /resolver que deben llegar al mismo óptimo
+MOTORES = {
+    'tableau': {},
+    'revisado': {'metodo': 'revisado'},
+    'dos_fases': {'artificiales': 'dos_fases'},
+    'revisado_dos_fases': {'metodo': 'revisado', 'artificiales': 'dos_fases'},
+    'disperso': {'disperso': True},
+    'dual': {'algoritmo': 'dual'},
+    'punto_interior': {'metodo': 'punto_interior'},
+    'punto_interior_sin_crossover': {'metodo': 'punto_interior', 'crossover': False},
+    'presolve': {'presolve': True},
+    'escalado': {'escalado': 'geometrico'},
+}
+
+
+def resolver(datos, **opciones):
+    return simplex.resolver_desde_datos(dict(datos, cache=False, **opciones))
+
+
+@pytest.mark.parametrize('motor', MOTORES)
+@pytest.mark.parametrize('nombre', PROBLEMAS)
+def test_motores_coinciden_con_el_optimo_conocido(nombre, motor):
+    datos, estado, z = PROBLEMAS[nombre]
+    resultado, codigo = resolver(datos, **MOTORES[motor])
+    
+    assert resultado['estado'] == estado
+    if z is None:
+        assert codigo == 400
+        assert resultado.get('z_optimo') is None
+    else:
+        assert codigo == 200
+        assert resultado['z_optimo'] == pytest.approx(z, abs=1e-6)
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+def test_tableau_y_revisado_terminan_en_la_misma_base(metodo):
+    for nombre, (datos, estado, _) in PROBLEMAS.items():
+        if estado != 'optimo':
+            continue
+        tableau, _ = resolver(datos)
+        otro, _ = resolver(datos, metodo=metodo)
+        assert otro['base_final'] == tableau['base_final'], nombre
+        assert otro['variables_basicas'] == tableau['variables_basicas'], nombre
+
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+import simplex
+from conftest import PROBLEMAS
+
+CLASICO = PROBLEMAS['clasico'][0]
+
+
+def barrido(datos, parametro, direccion, desde, hasta, **opciones):
+    resultado, codigo = simplex.resolver_desde_datos(dict(
+        datos, cache=False, parametrico={'parametro': parametro, 'direccion': direccion, 'desde': desde, 'hasta': hasta},
+        **opciones))
+    return resultado, codigo
+
+
+def tramos(parametrico):
+    return [(s['desde'], s['hasta'], s['z_desde'], s['z_hasta'], s['pendiente'], sorted(s['base']))
+            for s in parametrico['segmentos']]
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+def test_barrido_de_b_en_el_ejemplo_clasico(metodo):
+    # b3 de 0 a 30: primero limita x2 (hasta b3 = 12), luego x1 (hasta 24) y después nada
+    resultado, codigo = barrido(CLASICO, 'b', [0, 0, 1], -18, 12, metodo=metodo)
+    assert codigo == 200
+    assert resultado['z_optimo'] == 0.0
+    parametrico = resultado['parametrico']
+    assert (parametrico['estado'], parametrico['pivotes']) == ('optimo', 2)
+    assert tramos(parametrico) == [
+        (-18.0, -6.0, 0.0, 30.0, 2.5, ['S1', 'S2', 'X2']),
+        (-6.0, 6.0, 30.0, 42.0, 1.0, ['S1', 'X1', 'X2']),
+        (6.0, 12.0, 42.0, 42.0, 0.0, ['S3', 'X1', 'X2']),
+    ]
+
+
+def test_barrido_de_c_en_el_ejemplo_clasico():
+    # c1 por encima de 7.5 hace que x2 deje de limitar a x1 (ver test_sensibilidad)
+    resultado, _ = barrido(CLASICO, 'c', [1, 0], -3, 10)
+    assert tramos(resultado['parametrico']) == [
+        (-3.0, 4.5, 30.0, 45.0, 2.0, ['S1', 'X1', 'X2']),
+        (4.5, 10.0, 45.0, 67.0, 4.0, ['S2', 'X1', 'X2']),
+    ]
+
+
+def test_barrido_se_detiene_al_volverse_infactible():
+    resultado, codigo = barrido(CLASICO, 'b', [0, 0, -1], 0, 30)
+    assert codigo == 200
+    parametrico = resultado['parametrico']
+    # Con b3 < 0 ningún x >= 0 cumple 3x1 + 2x2 <= b3
+    assert (parametrico['estado'], parametrico['limite']) == ('infactible', 18.0)
+    assert parametrico['segmentos'][-1]['z_hasta'] == 0.0
+
+
+def problema_aleatorio(semilla):
+    rng = np.random.default_rng(semilla)
+    return dict(c=rng.uniform(1, 10, 6).tolist(), A=rng.uniform(0.5, 5, (4, 6)).tolist(),
+                b=rng.uniform(10, 50, 4).tolist(), tipos=['<='] * 4, tipo_optimizacion='max'), rng
+
+
+@pytest.mark.parametrize('parametro', ['b', 'c'])
+@pytest.mark.parametrize('semilla', range(1, 4))
+def test_curva_coincide_con_resolver_en_cada_punto(parametro, semilla):
+    datos, rng = problema_aleatorio(semilla)
+    # Direcciones que cruzan uno o dos puntos de quiebre antes de t = 10
+    escala = 3.0 if parametro == 'b' else 1.0
+    direccion = rng.uniform(-escala, escala, len(datos[parametro])).tolist()
+    resultado, _ = barrido(datos, parametro, direccion, 0, 10)
+    segmentos = resultado['parametrico']['segmentos']
+    assert resultado['parametrico']['estado'] == 'optimo'
+    
+    # Tramos contiguos y Z continua en los puntos de quiebre
+    for anterior, siguiente in zip(segmentos, segmentos[1:]):
+        assert anterior['hasta'] == siguiente['desde']
+        assert anterior['z_hasta'] == pytest.approx(siguiente['z_desde'], abs=1e-3)
+    
+    for segmento in segmentos:
+        for t in np.linspace(segmento['desde'], segmento['hasta'], 3):
+            variado = dict(datos, **{parametro: (np.asarray(datos[parametro]) + t * np.asarray(direccion)).tolist()})
+            z, _ = simplex.resolver_desde_datos(dict(variado, cache=False))
+            esperado = segmento['z_desde'] + segmento['pendiente'] * (t - segmento['desde'])
+            # Los puntos de quiebre, Z y la pendiente vienen redondeados a 4 decimales
+            assert z['z_optimo'] == pytest.approx(esperado, rel=1e-4, abs=1e-3), (segmento, t)
+
+
+@pytest.mark.parametrize('parametrico, mensaje', [
+    ({'parametro': 'A', 'direccion': [1, 0], 'hasta': 1}, "El parámetro del barrido debe ser 'b' o 'c'"),
+    ({'parametro': 'b', 'direccion': [1, 0], 'hasta': 1}, "La dirección del barrido debe tener 3 valores"),
+    ({'parametro': 'c', 'direccion': [1, 0], 'desde': 2, 'hasta': 1}, "'hasta' del barrido no puede ser menor"),
+    ({'parametro': 'c', 'direccion': [1, 0]}, "'hasta' del barrido debe ser un número"),
+])
+def test_barrido_invalido(parametrico, mensaje):
+    resultado, codigo = simplex.resolver_desde_datos(dict(CLASICO, cache=False, parametrico=parametrico))
+    assert codigo == 400
+    assert mensaje in resultado['error']
@@ -0,0 +1,84 @@
+import re
+
+import numpy as np
+import pytest
+
+import simplex
+
+
+@pytest.fixture
+def solver():
+    return simplex.SimplexSolver()
+
+
+@pytest.mark.parametrize('expresion, terminos, constante', [
+    ('3x1 + 5x2', {'x1': 3.0, 'x2': 5.0}, 0.0),
+    ('-x1 + 2.5*x2 - x3', {'x1': -1.0, 'x2': 2.5, 'x3': -1.0}, 0.0),
+    ('1e3x1 - .5x2', {'x1': 1000.0, 'x2': -0.5}, 0.0),
+    ('  3 x1  ', {'x1': 3.0}, 0.0),
+    # Repetidas y constantes se acumulan; X1 es la misma variable que x1
+    ('x1 + X1 + 2 - 0.5', {'x1': 2.0}, 1.5),
+    ('3x1 + 5x2 - 3x1', {'x1': 0.0, 'x2': 5.0}, 0.0),
+    ('precio + 2costo - x_1', {'precio': 1.0, 'costo': 2.0, 'x_1': -1.0}, 0.0),
+])
+def test_parsear_expresion(solver, expresion, terminos, constante):
+    assert solver.parsear_expresion(expresion) == (terminos, constante)
+
+
+@pytest.mark.parametrize('expresion, mensaje', [
+    ('2*', "Término incompleto '2*'"),
+    ('x1 x2', "Falta un operador + o - antes de 'x2'"),
+    ('x1 + + x2', "Término incompleto '+'"),
+    ('x1 # x2', "Carácter inesperado '#' en la posición 4"),
+])
+def test_parsear_expresion_senala_el_error(solver, expresion, mensaje):
+    with pytest.raises(ValueError) as error:
+        solver.parsear_expresion(expresion)
+    assert str(error.value) == f"Error al parsear expresión '{expresion}': {mensaje}"
+
+
+@pytest.mark.parametrize('restriccion, esperado', [
+    ('x1 + 2 <= 5 - x2', ({'x1': 1.0, 'x2': 1.0}, '<=', 3.0)),
+    ('x1 - 3 >= 2x1', ({'x1': -1.0}, '>=', 3.0)),
+    # b negativo: la restricción se multiplica por -1 e invierte el sentido
+    ('x1 <= -4', ({'x1': -1.0}, '>=', 4.0)),
+    ('x1 + x2 = x1', ({'x1': 0.0, 'x2': 1.0}, '=', 0.0)),
+])
+def test_parsear_restriccion(solver, restriccion, esperado):
+    assert solver.parsear_restriccion(restriccion) == esperado
+
+
+@pytest.mark.parametrize('restriccion, mensaje', [
+    ('x1 4', 'No se encontró un operador válido (<=, >=, =)'),
+    ('x1 <= 2 <= 3', 'Formato de restricción inválido'),
+    ('3 <= 5', 'No se encontraron variables en la restricción'),
+])
+def test_parsear_restriccion_invalida(solver, restriccion, mensaje):
+    with pytest.raises(ValueError, match=re.escape(mensaje)):
+        solver.parsear_restriccion(restriccion)
+
+
+def test_ruta_rapida_coincide_con_el_recorrido_termino_a_termino(solver):
+    # parsear_expresion valida con una sola regex y extrae todo de una vez; _parsear_terminos
+    # es el recorrido lento que se usa con errores, repetidas o constantes
+    rng = np.random.default_rng(7)
+    for _ in range(200):
+        indices = rng.permutation(40)[:rng.integers(1, 12)] + 1
+        partes = []
+        for k, indice in enumerate(indices):
+            coef = rng.choice(['', '3', '2.5', '.25', '1e2', '4 *'])
+            signo = rng.choice(['+', '-']) if k else rng.choice(['', '-'])
+            partes.append(f"{signo} {coef}x{indice}")
+        expresion = ' '.join(partes)
+        assert solver.parsear_expresion(expresion) == simplex._parsear_terminos(expresion), expresion
+
+
+def test_columnas_por_indice_o_por_orden_de_aparicion():
+    solver = simplex.SimplexSolver()
+    solver.configurar_problema('x3', 'max', ['x1 + x3 <= 4'])
+    # x3 sola implica x1 y x2 con coeficiente 0
+    assert (solver.c, solver.A, solver.nombres_variables) == ([0.0, 0.0, 1.0], [[1.0, 0, 1.0]], None)
+    
+    solver.configurar_problema('2costo + precio', 'max', ['precio + x1 <= 4'])
+    assert solver.nombres_variables == ['costo', 'precio', 'x1']
+    assert solver.c == [2.0, 1.0, 0.0]
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+import benchmark
+import simplex
+
+
+@pytest.mark.parametrize('filas, columnas', [(5, 8), (20, 35)])
+def test_motor_numpy_coincide_con_los_bucles_originales(filas, columnas):
+    solver = benchmark.crear_solver_aleatorio(filas, columnas, semilla=3)
+    referencia = solver.tableau.copy()
+    num_restricciones, num_variables = len(solver.A), len(solver.c)
+    
+    for _ in range(10):
+        col_pivote = solver.encontrar_columna_pivote()
+        if col_pivote == -1:
+            break
+        solver.operaciones_fila(solver.encontrar_fila_pivote(col_pivote), col_pivote)
+        assert benchmark.pivotear_referencia(referencia, num_restricciones, num_variables, 1) == 1
+        np.testing.assert_allclose(solver.tableau, referencia, atol=1e-9)
+    assert benchmark.pivotear_referencia(referencia, num_restricciones, num_variables, 1) == 0
+
+
+def test_pivotear_deja_la_columna_unitaria():
+    tableau = np.array([[2.0, 1.0, 1.0, 0.0, 8.0],
+                        [1.0, 3.0, 0.0, 1.0, 9.0],
+                        [3.0, 2.0, 0.0, 0.0, 0.0]])
+    simplex._pivotear(tableau, 0, 0)
+    np.testing.assert_allclose(tableau[:, 0], [1.0, 0.0, 0.0])
+    np.testing.assert_allclose(tableau[0], [1.0, 0.5, 0.5, 0.0, 4.0])
+    np.testing.assert_allclose(tableau[1], [0.0, 2.5, -0.5, 1.0, 5.0])
+
+
+def test_pivote_nulo_se_rechaza():
+    tableau = np.array([[0.0, 1.0, 4.0], [1.0, 1.0, 0.0]])
+    with pytest.raises(ValueError, match="pivote es cero"):
+        simplex._pivotear(tableau, 0, 0)
@@ -0,0 +1,87 @@
+import threading
+
+import pytest
+
+import simplex
+from conftest import PROBLEMAS
+
+# Dantzig recorre los 8 vértices: 7 pivotes hasta el óptimo
+KLEE_MINTY = PROBLEMAS['klee_minty'][0]
+
+
+def resolver(datos, cancelacion=None, **opciones):
+    return simplex.resolver_desde_datos(dict(datos, cache=False, **opciones), cancelacion=cancelacion)
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+def test_limite_de_iteraciones_devuelve_la_ultima_base(metodo):
+    resultado, codigo = resolver(KLEE_MINTY, metodo=metodo, max_iteraciones=3)
+    assert codigo == 200
+    assert (resultado['estado'], resultado['optimo'], resultado['factible']) == ('limite_iteraciones', False, True)
+    assert resultado['iteraciones'] == 3
+    # Sin artificiales cada base es factible: su Z es la mejor encontrada hasta ahí
+    assert 0 < resultado['z_optimo'] < 10000
+    assert resultado['mensaje'] == 'Se alcanzó el máximo número de iteraciones'
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+def test_interrupcion_sin_base_factible_no_reporta_z(metodo):
+    # Tras un pivote el Big-M aún tiene artificiales en la base: su z no es del problema
+    resultado, codigo = resolver(PROBLEMAS['minimizacion'][0], metodo=metodo, max_iteraciones=1)
+    assert codigo == 200
+    assert resultado['estado'] == 'limite_iteraciones'
+    assert resultado['z_optimo'] is None
+    assert 'aún sin una solución factible' in resultado['mensaje']
+
+
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+def test_limite_de_tiempo_no_se_guarda_en_la_cache(monkeypatch, metodo):
+    monkeypatch.setattr(simplex, 'CACHE_RESULTADOS', simplex.CacheResultados())
+    datos = dict(KLEE_MINTY, metodo=metodo, limite_tiempo_ms=1e-9)
+    for _ in range(2):
+        resultado, codigo = simplex.resolver_desde_datos(datos)
+        assert codigo == 200
+        assert resultado['estado'] == 'limite_tiempo'
+        assert 'desde_cache' not in resultado
+    # Con tiempo suficiente el mismo problema llega al óptimo
+    assert resolver(KLEE_MINTY, metodo=metodo, limite_tiempo_ms=60000)[0]['z_optimo'] == pytest.approx(10000)
+
+
+def test_limite_de_tiempo_por_defecto_del_entorno(monkeypatch):
+    monkeypatch.setattr(simplex, 'LIMITE_TIEMPO_MS_POR_DEFECTO', 1e-9)
+    assert resolver(KLEE_MINTY)[0]['estado'] == 'limite_tiempo'
+
+
+@pytest.mark.parametrize('metodo', ['tableau', 'revisado'])
+def test_cancelacion_desde_otro_hilo(metodo):
+    cancelacion = threading.Event()
+    
+    def traza(evento):
+        # Otro hilo pide cancelar durante el primer pivote: la resolución para antes del segundo
+        if evento['evento'] == 'pivote':
+            hilo = threading.Thread(target=cancelacion.set)
+            hilo.start()
+            hilo.join()
+    
+    resultado, codigo = simplex.resolver_desde_datos(dict(KLEE_MINTY, metodo=metodo, cache=False),
+                                                     traza=traza, cancelacion=cancelacion)
+    assert codigo == 200
+    assert resultado['estado'] == 'cancelado'
+    assert resultado['iteraciones'] == 1
+    assert resultado['mensaje'] == 'La resolución fue cancelada'
+
+
+@pytest.mark.parametrize('opciones, mensaje', [
+    ({'max_iteraciones': 0}, 'max_iteraciones debe ser un entero positivo'),
+    ({'max_iteraciones': True}, 'max_iteraciones debe ser un entero positivo'),
+    ({'max_iterations': '5'}, 'max_iteraciones debe ser un entero positivo'),
+    ({'limite_tiempo_ms': 0}, 'limite_tiempo_ms debe ser un número positivo'),
+    ({'time_limit_ms': -5}, 'limite_tiempo_ms debe ser un número positivo'),
+    ({'limite_tiempo_ms': False}, 'limite_tiempo_ms debe ser un número positivo'),
+])
+def test_presupuestos_invalidos(opciones, mensaje):
+    resultado, codigo = resolver(KLEE_MINTY, **opciones)
+    assert codigo == 400
+    assert resultado['error'] == mensaje
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+import simplex
+
+# Con Big-M, M queda por debajo del costo de x2 y el simplex declara el problema infactible
+COSTO_GRANDE = {'c': [3, 800000, 1], 'A': [[3, 0, 1], [0, 4, 1]], 'b': [14, 23], 'tipos': ['<=', '='],
+                'tipo_optimizacion': 'min', 'metodo': 'punto_interior', 'cache': False}
+
+
+@pytest.mark.parametrize('opciones', [{}, {'artificiales': 'dos_fases'}, {'sensibilidad': True}])
+def test_crossover_no_devuelve_artificiales_a_la_base(opciones):
+    resultado, codigo = simplex.resolver_desde_datos(dict(COSTO_GRANDE, **opciones))
+    assert codigo == 200
+    assert resultado['estado'] == 'optimo'
+    assert resultado['z_optimo'] == pytest.approx(1800014.0)
+    assert resultado['punto_interior'] == {'iteraciones': resultado['iteraciones'], 'estado': 'optimo',
+                                           'crossover': True}
+    assert not any(nombre.startswith('A') for nombre in resultado['base_final'])
+
+
+def test_sin_crossover_devuelve_el_punto_interior():
+    resultado, _ = simplex.resolver_desde_datos(dict(COSTO_GRANDE, crossover=False))
+    assert resultado['estado'] == 'optimo'
+    assert resultado['z_optimo'] == pytest.approx(1800014.0, abs=1e-2)
+    assert 'base_final' not in resultado
+    assert resultado['iteraciones'] == resultado['punto_interior']['iteraciones']
+
+
+def test_iteraciones_suman_punto_interior_y_crossover():
+    rng = np.random.default_rng(0)
+    A = rng.uniform(0, 1, size=(30, 45))
+    datos = {'c': rng.uniform(1, 2, size=45).tolist(), 'A': A.tolist(), 'b': (A.sum(axis=1) / 2).tolist(),
+             'tipos': ['<='] * 30, 'tipo_optimizacion': 'max', 'cache': False}
+    interior, _ = simplex.resolver_desde_datos(dict(datos, metodo='punto_interior'))
+    revisado, _ = simplex.resolver_desde_datos(dict(datos, metodo='revisado'))
+    
+    assert interior['z_optimo'] == pytest.approx(revisado['z_optimo'])
+    assert interior['iteraciones'] >= interior['punto_interior']['iteraciones'] > 0
+
+
+def test_detenido_informa_las_iteraciones_del_punto_interior():
+    resultado, _ = simplex.resolver_desde_datos(dict(COSTO_GRANDE, max_iteraciones=2))
+    assert resultado['estado'] == 'limite_iteraciones'
+    assert resultado['iteraciones'] == 2
+    assert resultado['punto_interior']['estado'] == 'detenido'
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+import simplex
+from conftest import PROBLEMAS
+
+
+def problema_aleatorio(filas, columnas, semilla):
+    """Problema de maximización acotado y factible en el origen (b > 0, A > 0)"""
+    rng = np.random.default_rng(semilla)
+    return dict(c=rng.uniform(1, 10, columnas).round(2).tolist(),
+                A=rng.uniform(0.5, 5, (filas, columnas)).round(2).tolist(),
+                b=rng.uniform(10, 50, filas).round(2).tolist(),
+                tipos=['<='] * filas, tipo_optimizacion='max', cache=False)
+
+
+def test_factorizacion_lu_resuelve_y_actualiza():
+    rng = np.random.default_rng(0)
+    B = rng.normal(size=(6, 6)) + 6 * np.eye(6)
+    v = rng.normal(size=6)
+    lu = simplex.FactorizacionLU(B)
+    np.testing.assert_allclose(B @ lu.resolver(v), v)
+    np.testing.assert_allclose(B.T @ lu.resolver_transpuesta(v), v)
+    
+    # Cambiar la columna 2 de la base por a y registrarlo como una eta
+    a = rng.normal(size=6)
+    lu.actualizar(2, lu.resolver(a))
+    B[:, 2] = a
+    np.testing.assert_allclose(B @ lu.resolver(v), v)
+    np.testing.assert_allclose(B.T @ lu.resolver_transpuesta(v), v)
+
+
+def test_factorizacion_lu_rechaza_base_singular():
+    with pytest.raises(ValueError, match="singular"):
+        simplex.FactorizacionLU(np.array([[1.0, 2.0], [2.0, 4.0]]))
+
+
+@pytest.mark.parametrize('frecuencia', [1, 3])
+def test_refactorizar_a_menudo_no_cambia_el_resultado(frecuencia):
+    datos = problema_aleatorio(20, 30, semilla=frecuencia)
+    referencia, _ = simplex.resolver_desde_datos(dict(datos, metodo='tableau'))
+    
+    solver, error = simplex.preparar_solver(dict(datos, metodo='revisado'))
+    assert error is None
+    solver.frecuencia_refactorizacion = frecuencia
+    resultado = solver.resolver()
+    
+    assert resultado['estado'] == 'optimo'
+    assert resultado['z_optimo'] == pytest.approx(referencia['z_optimo'], rel=1e-9)
+    assert resultado['base_final'] == referencia['base_final']
+    # Tras frecuencia etas la siguiente actualización refactoriza en lugar de añadir otra
+    assert solver.estadisticas.contadores.get('refactorizaciones', 0) == resultado['iteraciones'] // (frecuencia + 1)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+import simplex
+from conftest import PROBLEMAS
+
+
+def sensibilidad(datos, **opciones):
+    resultado, codigo = simplex.resolver_desde_datos(dict(datos, cache=False, sensibilidad=True, **opciones))
+    assert codigo == 200
+    return resultado
+
+
+def rangos(resultado, grupo):
+    return [(fila['aumento_permitido'], fila['disminucion_permitida']) for fila in resultado['sensibilidad'][grupo]]
+
+
+def test_rangos_del_ejemplo_clasico():
+    # Wyndor (Hillier y Lieberman): 0 <= c1 <= 7.5, c2 >= 2, b1 >= 2, 6 <= b2 <= 18, 12 <= b3 <= 24
+    resultado = sensibilidad(PROBLEMAS['clasico'][0])
+    assert rangos(resultado, 'variables') == [(4.5, 3.0), (None, 3.0)]
+    assert rangos(resultado, 'restricciones') == [(None, 2.0), (6.0, 6.0), (6.0, 6.0)]
+    assert [fila['precio_sombra'] for fila in resultado['sensibilidad']['restricciones']] == [0.0, 1.5, 1.0]
+
+
+@pytest.mark.parametrize('opciones', [{}, {'metodo': 'revisado'}, {'artificiales': 'dos_fases'},
+                                      {'escalado': 'geometrico'}])
+def test_rangos_en_minimizacion_con_restricciones_mayor_igual(opciones):
+    # Óptimo en x = (3, 1): 1 <= c1 <= 3, 2 <= c2 <= 6, 2 <= b1 <= 6, 4 <= b2 <= 12
+    resultado = sensibilidad(PROBLEMAS['minimizacion'][0], **opciones)
+    assert rangos(resultado, 'variables') == pytest.approx([(1.0, 1.0), (3.0, 1.0)])
+    assert rangos(resultado, 'restricciones') == pytest.approx([(2.0, 2.0), (6.0, 2.0)])
+    assert [fila['precio_sombra'] for fila in resultado['sensibilidad']['restricciones']] == pytest.approx([1.5, 0.5])
+
+
+def problema_aleatorio(semilla):
+    rng = np.random.default_rng(semilla)
+    return dict(c=rng.uniform(1, 10, 8).tolist(), A=rng.uniform(0.5, 5, (5, 8)).tolist(),
+                b=rng.uniform(10, 50, 5).tolist(), tipos=['<='] * 5, tipo_optimizacion='max')
+
+
+def resolver(datos):
+    resultado, _ = simplex.resolver_desde_datos(dict(datos, cache=False))
+    return resultado
+
+
+@pytest.mark.parametrize('semilla', range(3))
+def test_dentro_del_rango_la_base_no_cambia_y_fuera_si(semilla):
+    datos = problema_aleatorio(semilla)
+    resultado = sensibilidad(datos)
+    base = resultado['base_final']
+    
+    for j, (aumento, disminucion) in enumerate(rangos(resultado, 'variables')):
+        for sentido, limite in ((1, aumento), (-1, disminucion)):
+            if limite is None:
+                continue
+            for fraccion, misma_base in ((0.5, True), (1.05, False)):
+                c = list(datos['c'])
+                c[j] += sentido * (fraccion * limite + (0 if misma_base else 1e-6))
+                assert (resolver(dict(datos, c=c))['base_final'] == base) is misma_base, (j, sentido, fraccion)
+    
+    for i, (fila, (aumento, disminucion)) in enumerate(zip(resultado['sensibilidad']['restricciones'],
+                                                          rangos(resultado, 'restricciones'))):
+        for sentido, limite in ((1, aumento), (-1, disminucion)):
+            delta = sentido * (min(limite, 10.0) if limite is not None else 10.0) / 2
+            b = list(datos['b'])
+            b[i] += delta
+            # Dentro del rango Z cambia a razón del precio sombra (la respuesta redondea a 4 decimales)
+            variado = resolver(dict(datos, b=b))
+            assert variado['base_final'] == base
+            assert variado['z_optimo'] == pytest.approx(resultado['z_optimo'] + fila['precio_sombra'] * delta, abs=1e-3)
+
+
+def test_sin_optimo_no_hay_sensibilidad():
+    resultado, _ = simplex.resolver_desde_datos(dict(PROBLEMAS['infactible'][0], cache=False, sensibilidad=True))
+    assert 'sensibilidad' not in resultado